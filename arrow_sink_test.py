@@ -0,0 +1,37 @@
+# File: arrow_sink_test.py
+import pytest
+from twitter.sinks import ArrowSink, open_sink
+from twitter.sinks.arrow import read_tweets
+from twitter.testing import fixture_tweets
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".arrow"])
+def test_round_trip_in_batches(tmp_path, suffix):
+    tweets = fixture_tweets()
+    path = str(tmp_path / f"tweets{suffix}")
+    with open_sink(path, batch_size=4) as sink:
+        assert isinstance(sink, ArrowSink)
+        for start in range(0, len(tweets), 3):
+            sink.write_page(tweets[start:start + 3])
+    assert sink.count == len(tweets)
+    assert list(read_tweets(path)) == tweets
+
+
+def test_parquet_columns_are_flat_and_typed(tmp_path):
+    tweets = fixture_tweets()
+    path = str(tmp_path / "tweets.parquet")
+    with ArrowSink(path, batch_size=5) as sink:
+        sink.write_page(tweets)
+        sink.write_page(tweets)
+    parquet = pq.ParquetFile(path)
+    # Satu row group per flush: setiap halaman sudah melewati batch_size
+    assert parquet.metadata.num_row_groups == 2
+    schema = parquet.schema_arrow
+    assert schema.field("likes").type == pa.int64()
+    assert schema.field("hashtags").type == pa.list_(pa.string())
+    assert pa.types.is_timestamp(schema.field("timestamp").type)
+    table = parquet.read(columns=["username", "likes"])
+    assert table.column("username").to_pylist() == [t.user.username for t in tweets] * 2
@@ -0,0 +1,74 @@
+# File: async_scraper_test.py
+import asyncio
+from twitter.async_scraper import AsyncTweetScraper
+from twitter.http_fetcher import HttpFetcher
+from twitter.testing.nitter_server import NitterStubCluster, StubInstanceConfig
+
+
+class StubPage:
+    """Pengganti Page Playwright secukupnya untuk _collect: HTML diambil lewat HTTP.
+
+    Navigasi ke-n (mulai 1) yang ada di `fail_on` melempar error seperti
+    page.goto yang timeout.
+    """
+
+    def __init__(self, fail_on=()):
+        self.fetcher = HttpFetcher()
+        self.fail_on = set(fail_on)
+        self.visited = []
+        self.url = "about:blank"
+        self._html = ""
+
+    async def goto(self, url, timeout=None):
+        self.visited.append(url)
+        if len(self.visited) in self.fail_on:
+            raise TimeoutError(f"Timeout navigating to {url}")
+        result = await asyncio.to_thread(self.fetcher.get, url)
+        self.url, self._html = result.url, result.html
+
+    async def content(self):
+        return self._html
+
+    async def wait_for_selector(self, selector, **kwargs):
+        pass
+
+
+def collect(instances, page, limit):
+    scraper = AsyncTweetScraper(instances=instances, health_path=None, pacing="fast", prefetch=True)
+
+    async def run():
+        scraper._instance_lock = asyncio.Lock()
+        return await scraper._collect(page, "jokowi", limit, False)
+
+    try:
+        return asyncio.run(run())
+    finally:
+        page.fetcher.close()
+        scraper.health.close()
+
+
+def test_rotation_resumes_from_cursor_without_duplicates():
+    config = StubInstanceConfig(page_size=10, total_items=100)
+    with NitterStubCluster([config, config]) as cluster:
+        # Navigasi ke halaman kedua (prefetch) gagal -> rotasi ke instance lain
+        page = StubPage(fail_on={2})
+        tweets = collect(cluster.instances, page, limit=25)
+
+    links = [tweet.link for tweet in tweets]
+    assert len(links) == 25
+    assert len(set(links)) == len(links)
+    # Hanya navigasi pertama yang membuka halaman satu; rotasi memakai cursor
+    assert [url for url in page.visited if "cursor=" not in url] == page.visited[:1]
+    assert page.visited[2].endswith(page.visited[1].split("?", 1)[1])
+    assert page.visited[2].split("/search")[0] != page.visited[1].split("/search")[0]
+
+
+def test_failed_rotation_returns_partial_results():
+    config = StubInstanceConfig(page_size=10, total_items=100)
+    with NitterStubCluster([config, config]) as cluster:
+        # Halaman pertama berhasil, semua navigasi sesudahnya gagal
+        page = StubPage(fail_on=range(2, 20))
+        tweets = collect(cluster.instances, page, limit=25)
+
+    assert 0 < len(tweets) <= 10
+    assert len({tweet.link for tweet in tweets}) == len(tweets)
@@ -0,0 +1,93 @@
+# File: batch_test.py
+import json
+from twitter import TweetScraper
+from twitter.batch import BatchQuery, BatchRunner, load_queries, output_name, output_names
+from twitter.testing.nitter_server import NitterStubServer, StubInstanceConfig
+
+
+def test_load_queries(tmp_path):
+    path = tmp_path / "queries.txt"
+    path.write_text("# komentar\njokowi\n\n#pemilu2024 | 50\n")
+    queries = load_queries(str(path))
+    assert [(q.query, q.limit) for q in queries] == [("jokowi", None), ("#pemilu2024", 50)]
+    assert output_name("#pemilu2024") == "hashtag_pemilu2024"
+
+
+def test_batch_runner_shares_state_and_writes_per_query(tmp_path):
+    queries_file = tmp_path / "queries.txt"
+    queries_file.write_text("jokowi\nprabowo | 15\nanies | 5\n")
+    with NitterStubServer(StubInstanceConfig(page_size=10, total_items=40)) as server:
+        scrapers = []
+
+        def factory():
+            scraper = TweetScraper(fetch_mode="http", instances=[server.url], health_path=None, pacing="fast")
+            scrapers.append(scraper)
+            return scraper
+
+        runner = BatchRunner(factory, str(tmp_path / "out"), workers=2, default_limit=25)
+        summary = runner.run(load_queries(str(queries_file)))
+
+    assert len(scrapers) == 2
+    assert scrapers[0].health is scrapers[1].health
+    assert scrapers[0].pacer is scrapers[1].pacer
+    assert [r["tweets"] for r in summary["results"]] == [25, 15, 5]
+    assert summary["statuses"] == {"ok": 3}
+    assert summary["failures"] == []
+    for result in summary["results"]:
+        lines = (tmp_path / "out" / f"{output_name(result['query'])}.ndjson").read_text().splitlines()
+        assert len(lines) == result["tweets"]
+    assert json.loads((tmp_path / "out" / "summary.json").read_text())["tweets"] == 45
+
+
+def test_colliding_and_duplicate_queries_get_separate_files(tmp_path):
+    queries_file = tmp_path / "queries.txt"
+    queries_file.write_text("jokowi 2024 | 7\njokowi/2024 | 12\njokowi 2024 | 30\n")
+    queries = load_queries(str(queries_file))
+    assert [(q.query, q.limit) for q in queries] == [("jokowi 2024", 7), ("jokowi/2024", 12)]
+
+    long_a, long_b = "a" * 80 + " satu", "a" * 80 + " dua"
+    names = output_names([BatchQuery(long_a), BatchQuery(long_b), BatchQuery("A" * 80)])
+    assert len({name.lower() for name in names.values()}) == 3
+
+    with NitterStubServer(StubInstanceConfig(page_size=10, total_items=40)) as server:
+        runner = BatchRunner(
+            lambda: TweetScraper(fetch_mode="http", instances=[server.url], health_path=None, pacing="fast"),
+            str(tmp_path / "out"),
+            workers=2
+        )
+        # Duplikat yang diberikan langsung (bukan lewat file) juga dibuang
+        summary = runner.run(queries + [BatchQuery("jokowi/2024", 3)])
+
+    assert [(r["query"], r["tweets"]) for r in summary["results"]] == [("jokowi 2024", 7), ("jokowi/2024", 12)]
+    outputs = [r["output"] for r in summary["results"]]
+    assert len(set(outputs)) == 2
+    for result in summary["results"]:
+        with open(result["output"]) as f:
+            assert len(f.read().splitlines()) == result["tweets"]
+
+
+def test_scrape_errors_mark_query_failed_and_keep_written_tweets(tmp_path):
+    with NitterStubServer(StubInstanceConfig(page_size=10, total_items=40)) as server:
+
+        def factory():
+            scraper = TweetScraper(fetch_mode="http", instances=[server.url], health_path=None, pacing="fast")
+            original = scraper._iter_run
+
+            def flaky(run):
+                pages = original(run)
+                yield next(pages)
+                if run.query == "rusak":
+                    raise ConnectionError("instance mati")
+                yield from pages
+
+            scraper._iter_run = flaky
+            return scraper
+
+        runner = BatchRunner(factory, str(tmp_path / "out"), workers=1, default_limit=15)
+        summary = runner.run([BatchQuery("jokowi"), BatchQuery("rusak")])
+
+    ok, failed = summary["results"]
+    assert (ok["status"], ok["tweets"]) == ("ok", 15)
+    assert failed["status"] == "failed" and failed["error"] == "instance mati"
+    assert failed["tweets"] == len((tmp_path / "out" / "rusak.ndjson").read_text().splitlines()) > 0
+    assert summary["failures"] == ["rusak"]
@@ -0,0 +1,60 @@
+# benchmarks/browser_bench.py
+"""Bandingkan byte yang ditransfer dan waktu muat halaman: BrowserConfig default vs lean.
+
+Contoh:
+    python -m benchmarks.browser_bench --pages 10 --asset-bytes 40000
+"""
+import argparse
+import time
+from statistics import mean
+from twitter.browser_manager import BrowserConfig, BrowserManager, page_metrics
+from twitter.testing.nitter_server import NitterStubServer, StubInstanceConfig, encode_cursor
+from .common import print_table, write_results
+
+def run_profile(name: str, config: BrowserConfig, server: NitterStubServer, pages: int, headless: bool) -> dict:
+    requests_before = server.stats.requests
+    metrics = []
+    with BrowserManager(headless=headless, config=config) as browser:
+        for index in range(pages):
+            url = f"{server.url}/search?f=tweets&q=bench"
+            if index:
+                url += f"&cursor={encode_cursor(index * server.config.page_size)}"
+            start = time.perf_counter()
+            browser.page.goto(url, wait_until="load", timeout=60000)
+            elapsed = time.perf_counter() - start
+            metrics.append({**page_metrics(browser.page), "wall_ms": elapsed * 1000})
+
+    return {
+        "profile": name,
+        "pages": pages,
+        "avg_wall_ms": round(mean(m["wall_ms"] for m in metrics), 1),
+        "avg_load_ms": round(mean(m["load_ms"] or 0 for m in metrics), 1),
+        "avg_kb_per_page": round(mean(m["document_bytes"] + m["resource_bytes"] for m in metrics) / 1024, 1),
+        "server_requests": server.stats.requests - requests_before,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark profil browser default vs lean")
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--asset-bytes", type=int, default=40000, help="Ukuran tiap gambar/css/font dari server tiruan")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--visible", action="store_true")
+    parser.add_argument("-o", "--output", default="browser_bench.json")
+    args = parser.parse_args()
+
+    config = StubInstanceConfig(
+        latency=args.latency,
+        asset_bytes=args.asset_bytes,
+        total_items=(args.pages + 1) * 20
+    )
+    results = []
+    with NitterStubServer(config) as server:
+        for name, browser_config in (("default", BrowserConfig()), ("lean", BrowserConfig.lean())):
+            results.append(run_profile(name, browser_config, server, args.pages, not args.visible))
+
+    print_table(results, ["profile", "pages", "avg_wall_ms", "avg_load_ms", "avg_kb_per_page", "server_requests"])
+    write_results(args.output, "browser", results)
+    print(f"\nHasil disimpan di: {args.output}")
+
+if __name__ == "__main__":
+    main()
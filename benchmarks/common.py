@@ -0,0 +1,57 @@
+# benchmarks/common.py
+
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Sequence
+
+def measure(func: Callable[[Any], Any], items: Sequence[Any], track_memory: bool = True) -> Dict[str, float]:
+    """Jalankan func untuk setiap item dan ukur throughput serta peak memory hasilnya"""
+    results = []
+    start = time.perf_counter()
+    for item in items:
+        results.append(func(item))
+    elapsed = time.perf_counter() - start
+
+    stats = {
+        "items": len(items),
+        "seconds": round(elapsed, 4),
+        "items_per_second": round(len(items) / elapsed, 1) if elapsed else None,
+    }
+    del results
+
+    if track_memory:
+        # Putaran terpisah agar overhead tracemalloc tidak mengotori angka waktu
+        tracemalloc.start()
+        results = [func(item) for item in items]
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del results
+        stats["peak_memory_mb"] = round(peak / 1024 / 1024, 2)
+    return stats
+
+def scale(items: Sequence[Any], size: int) -> List[Any]:
+    """Ulangi korpus sampai berisi tepat `size` item"""
+    return [items[i % len(items)] for i in range(size)]
+
+def write_results(path: str, benchmark: str, results: List[Dict[str, Any]]):
+    """Simpan hasil benchmark dalam format JSON beserta metadata environment"""
+    payload = {
+        "benchmark": benchmark,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(payload, f, indent=2)
+
+def print_table(results: List[Dict[str, Any]], columns: List[str]):
+    """Tampilkan hasil benchmark dalam tabel sederhana"""
+    print(" | ".join(f"{col:>16}" for col in columns))
+    print("-" * (19 * len(columns)))
+    for row in results:
+        print(" | ".join(f"{str(row.get(col, '')):>16}" for col in columns))
@@ -0,0 +1,90 @@
+# benchmarks/memory_bench.py
+"""Memori untuk menyimpan N tweet di memori: list dict vs list TweetSchema vs TweetTable.
+
+Tweet sintetis dibuat dari fixture (pengguna, hashtag dan media berulang,
+konten/link/timestamp unik per tweet) agar mirip hasil scraping besar.
+
+Contoh:
+    python -m benchmarks.memory_bench --size 1000000
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from dataclasses import asdict, replace
+from datetime import timedelta
+from typing import Callable, Iterator, List
+from twitter.models import TweetSchema, TweetStats, TweetTable
+from twitter.parsers import TweetParser, SinglePassTweetParser
+from twitter.testing import load_fixture, fixture_names
+from .common import print_table, write_results
+
+def load_templates() -> List[TweetSchema]:
+    templates = []
+    for name in fixture_names():
+        for item in TweetParser.split_timeline(load_fixture(name)):
+            tweet = SinglePassTweetParser.parse_element(item)
+            if tweet and tweet.timestamp:
+                templates.append(tweet)
+    return templates
+
+def synthetic_tweets(templates: List[TweetSchema], size: int) -> Iterator[TweetSchema]:
+    for i in range(size):
+        base = templates[i % len(templates)]
+        yield replace(
+            base,
+            user=replace(base.user),
+            content=f"{base.content} {i}",
+            hashtags=list(base.hashtags),
+            mentions=list(base.mentions),
+            replying_to=list(base.replying_to),
+            timestamp=base.timestamp - timedelta(seconds=i),
+            stats=TweetStats(i % 97, i % 31, i % 7, i % 1009),
+            link=f"https://twitter.com/{base.user.username}/status/{1900000000000000000 - i}#m"
+        )
+
+REPRESENTATIONS = {
+    "dicts": lambda tweets: [asdict(tweet) for tweet in tweets],
+    "tweets": list,
+    "table": TweetTable.from_tweets,
+}
+# asdict() per tweet sangat lambat di bawah tracemalloc; "dicts" hanya dengan --only
+DEFAULT_REPRESENTATIONS = ("tweets", "table")
+
+def measure_container(build: Callable, templates: List[TweetSchema], size: int) -> dict:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    container = build(synthetic_tweets(templates, size))
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del container
+    return {
+        "tweets": size,
+        "build_seconds": round(elapsed, 2),
+        "retained_mb": round(current / 1024 / 1024, 1),
+        "peak_mb": round(peak / 1024 / 1024, 1),
+        "bytes_per_tweet": round(current / size),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark memori representasi tweet")
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--only", choices=list(REPRESENTATIONS), action="append")
+    parser.add_argument("-o", "--output", default="memory_bench.json")
+    args = parser.parse_args()
+
+    templates = load_templates()
+    results = []
+    for name in args.only or DEFAULT_REPRESENTATIONS:
+        results.append({"representation": name, **measure_container(REPRESENTATIONS[name], templates, args.size)})
+        print(f"{name}: {results[-1]['retained_mb']} MB")
+
+    print_table(results, ["representation", "tweets", "build_seconds", "retained_mb", "peak_mb", "bytes_per_tweet"])
+    write_results(args.output, "memory", results)
+    print(f"\nHasil disimpan di: {args.output}")
+
+if __name__ == "__main__":
+    main()
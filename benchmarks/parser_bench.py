@@ -0,0 +1,59 @@
+# benchmarks/parser_bench.py
+"""Benchmark throughput dan memory parser secara offline dengan fixture Nitter.
+
+Contoh:
+    python -m benchmarks.parser_bench --sizes 1000 10000 --output parser_bench.json
+"""
+import argparse
+import logging
+from typing import Callable, Dict
+from twitter.parsers import TweetParser, SinglePassTweetParser, UserParser, MediaParser
+from twitter.parsers.backends import available_backends
+from twitter.testing import load_fixture, fixture_names
+from twitter.utils.logger import logger
+from .common import measure, print_table, scale, write_results
+
+def _parsers(backend: str) -> Dict[str, Callable[[str], object]]:
+    return {
+        "TweetParser": lambda html: TweetParser.parse(html, backend),
+        "SinglePassTweetParser": lambda html: SinglePassTweetParser.parse(html, backend),
+        "UserParser": lambda html: UserParser.parse(html, backend),
+        "MediaParser": lambda html: MediaParser.parse(html, backend),
+    }
+
+def load_corpus() -> list:
+    """HTML setiap div.timeline-item dari semua fixture halaman pencarian"""
+    return [
+        str(item)
+        for name in fixture_names()
+        for item in TweetParser.split_timeline(load_fixture(name), "html.parser")
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parser Nitter tanpa jaringan")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--backends", nargs="+", default=available_backends())
+    parser.add_argument("--parsers", nargs="+", default=list(_parsers("html.parser")))
+    parser.add_argument("--no-memory", action="store_true", help="Lewati pengukuran peak memory")
+    parser.add_argument("-o", "--output", default="parser_bench.json")
+    args = parser.parse_args()
+
+    # Fixture sengaja berisi media rusak; jangan banjiri output dengan warning
+    logger.setLevel(logging.ERROR)
+
+    corpus = load_corpus()
+    results = []
+    for size in args.sizes:
+        items = scale(corpus, size)
+        for backend in args.backends:
+            parsers = _parsers(backend)
+            for name in args.parsers:
+                stats = measure(parsers[name], items, track_memory=not args.no_memory)
+                results.append({"parser": name, "backend": backend, **stats})
+
+    print_table(results, ["parser", "backend", "items", "items_per_second", "peak_memory_mb"])
+    write_results(args.output, "parser", results)
+    print(f"\nHasil disimpan di: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# benchmarks/scraper_bench.py
+"""Benchmark end-to-end TweetScraper terhadap instance Nitter tiruan lokal.
+
+Contoh:
+    python -m benchmarks.scraper_bench --healthy 2 --dead 1 --latency 0.3 --limit 100
+"""
+import argparse
+import time
+from twitter import TweetScraper
+from twitter.scraper import FETCH_MODES
+from twitter.pacing import PACING_PROFILES, DEFAULT_PACING
+from twitter.testing.nitter_server import NitterStubCluster, StubInstanceConfig
+from .common import print_table, write_results
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scraper dengan server Nitter lokal")
+    parser.add_argument("--query", default="jokowi")
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument("--healthy", type=int, default=2, help="Jumlah instance sehat")
+    parser.add_argument("--dead", type=int, default=0, help="Jumlah instance mati")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--empty-rate", type=float, default=0.0)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--visible", action="store_true")
+    parser.add_argument("--fetch-mode", choices=FETCH_MODES, default="browser")
+    parser.add_argument("--pacing", choices=list(PACING_PROFILES), default=DEFAULT_PACING)
+    parser.add_argument("--parse-workers", type=int, default=0, help="Process pool parser (mode browser)")
+    parser.add_argument("-o", "--output", default="scraper_bench.json")
+    args = parser.parse_args()
+
+    configs = [
+        StubInstanceConfig(
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            empty_rate=args.empty_rate,
+            page_size=args.page_size,
+            total_items=args.limit * 2,
+            seed=index
+        )
+        for index in range(args.healthy)
+    ] + [StubInstanceConfig(dead=True) for _ in range(args.dead)]
+
+    results = []
+    with NitterStubCluster(configs) as cluster:
+        for run in range(args.runs):
+            scraper = TweetScraper(
+                headless=not args.visible,
+                instances=cluster.instances,
+                health_path=None,
+                fetch_mode=args.fetch_mode,
+                pacing=args.pacing,
+                parse_workers=args.parse_workers
+            )
+            start = time.perf_counter()
+            tweets = scraper.scrape_tweets(args.query, limit=args.limit)
+            elapsed = time.perf_counter() - start
+            scraper.close()
+            results.append({
+                "run": run + 1,
+                "tweets": len(tweets),
+                "seconds": round(elapsed, 2),
+                "tweets_per_second": round(len(tweets) / elapsed, 2) if elapsed else None,
+                "requests": sum(stats.requests for stats in cluster.stats().values()),
+            })
+        instance_stats = {
+            url: {"requests": s.requests, "pages": s.pages, "errors": s.errors, "empty": s.empty}
+            for url, s in cluster.stats().items()
+        }
+
+    print_table(results, ["run", "tweets", "seconds", "tweets_per_second", "requests"])
+    write_results(args.output, "scraper", results + [{"instances": instance_stats}])
+    print(f"\nHasil disimpan di: {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# benchmarks/serialization_bench.py
+"""Bandingkan EnhancedJSONEncoder lama (dataclasses.asdict) dengan twitter.utils.serialization.
+
+Contoh:
+    python -m benchmarks.serialization_bench --size 100000
+"""
+import argparse
+import dataclasses
+import json
+import time
+from datetime import datetime
+from typing import Callable, List
+from twitter.models import TweetSchema
+from twitter.testing import fixture_tweets
+from twitter.utils import serialization
+from .common import print_table, scale, write_results
+
+def legacy_default(o):
+    """EnhancedJSONEncoder.default sebelum lapisan serialisasi"""
+    if dataclasses.is_dataclass(o):
+        return dataclasses.asdict(o)
+    if isinstance(o, datetime):
+        return o.isoformat()
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+def legacy_from_dict(data: dict) -> TweetSchema:
+    """tweet_from_dict sebelum lapisan serialisasi"""
+    from twitter.models import MediaSchema, TweetStats, UserSchema
+    timestamp = data.get("timestamp")
+    return TweetSchema(
+        user=UserSchema(**data["user"]),
+        content=data["content"],
+        hashtags=list(data.get("hashtags", [])),
+        mentions=list(data.get("mentions", [])),
+        replying_to=list(data.get("replying_to", [])),
+        timestamp=datetime.fromisoformat(timestamp) if timestamp else None,
+        stats=TweetStats(**data.get("stats", {})),
+        media=MediaSchema(**data.get("media", {})),
+        link=data["link"],
+        is_retweet=data.get("is_retweet", False),
+        retweeter=data.get("retweeter")
+    )
+
+def timed(func: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def run_backend(name: str, tweets: List[TweetSchema], repeat: int) -> List[dict]:
+    if name == "legacy":
+        pretty = lambda: json.dumps(tweets, default=legacy_default, ensure_ascii=False, indent=2)
+        compact = lambda: json.dumps(tweets, default=legacy_default, ensure_ascii=False)
+        ndjson = lambda: "".join(json.dumps(t, default=legacy_default, ensure_ascii=False) + "\n" for t in tweets)
+        payload = compact()
+        decode = lambda: [legacy_from_dict(item) for item in json.loads(payload)]
+    else:
+        pretty = lambda: serialization.dumps_bytes(tweets, pretty=True)
+        compact = lambda: serialization.dumps_bytes(tweets)
+        ndjson = lambda: serialization.ndjson_bytes(tweets)
+        payload = compact()
+        decode = lambda: serialization.tweets_from_json(payload)
+
+    rows = []
+    for mode, func in (("pretty", pretty), ("compact", compact), ("ndjson", ndjson), ("decode", decode)):
+        seconds = timed(func, repeat)
+        rows.append({
+            "backend": name,
+            "mode": mode,
+            "tweets": len(tweets),
+            "seconds": round(seconds, 3),
+            "tweets_per_second": round(len(tweets) / seconds),
+        })
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark serialisasi JSON tweet")
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("-o", "--output", default="serialization_bench.json")
+    args = parser.parse_args()
+
+    tweets = scale(fixture_tweets(), args.size)
+
+    results = run_backend("legacy", tweets, args.repeat)
+    original = serialization.orjson
+    try:
+        serialization.orjson = None
+        results += run_backend("json", tweets, args.repeat)
+    finally:
+        serialization.orjson = original
+    if original is not None:
+        results += run_backend("orjson", tweets, args.repeat)
+
+    print_table(results, ["backend", "mode", "tweets", "seconds", "tweets_per_second"])
+    write_results(args.output, "serialization", results)
+    print(f"\nHasil disimpan di: {args.output}")
+
+if __name__ == "__main__":
+    main()
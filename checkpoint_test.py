@@ -0,0 +1,53 @@
+# File: checkpoint_test.py
+from twitter import TweetScraper
+from twitter.checkpoint import CheckpointStore
+from twitter.testing.nitter_server import NitterStubServer, StubInstanceConfig
+
+
+def _scrape(server, path, limit, resume):
+    with TweetScraper(
+        fetch_mode="http",
+        instances=[server.url],
+        checkpoint_path=path,
+        resume=resume,
+        health_path=None,
+        pacing="fast"
+    ) as scraper:
+        return scraper.scrape_tweets("jokowi", limit=limit)
+
+
+def test_checkpoint_round_trip(tmp_path):
+    with NitterStubServer(StubInstanceConfig(page_size=10, total_items=40)) as server:
+        tweets = _scrape(server, str(tmp_path / "scrape.db"), limit=15, resume=False)
+
+    with CheckpointStore(str(tmp_path / "scrape.db")) as store:
+        saved = store.load("jokowi")
+    assert [tweet.link for tweet in saved.tweets] == [tweet.link for tweet in tweets]
+    assert saved.tweets == tweets
+    assert "cursor=" in saved.cursor
+
+
+def test_resume_continues_from_cursor(tmp_path):
+    path = str(tmp_path / "scrape.db")
+    with NitterStubServer(StubInstanceConfig(page_size=10, total_items=40)) as server:
+        first = _scrape(server, path, limit=15, resume=False)
+        server.stats.paths.clear()
+        resumed = _scrape(server, path, limit=35, resume=True)
+        search_paths = [p for p in server.stats.paths if "f=tweets" in p]
+
+    assert resumed[:15] == first
+    assert len({tweet.link for tweet in resumed}) == len(resumed)
+    # Halaman pertama tidak diambil ulang
+    assert all("cursor=" in p for p in search_paths)
+
+
+def test_finished_checkpoint_needs_no_requests(tmp_path):
+    path = str(tmp_path / "scrape.db")
+    with NitterStubServer(StubInstanceConfig(page_size=10, total_items=40)) as server:
+        everything = _scrape(server, path, limit=100, resume=False)
+    with CheckpointStore(path) as store:
+        assert store.load("jokowi").cursor is None
+
+    with NitterStubServer(StubInstanceConfig(page_size=10, total_items=40)) as server:
+        assert _scrape(server, path, limit=100, resume=True) == everything
+        assert server.stats.requests == 0
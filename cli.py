@@ -1,16 +1,31 @@
 # File: cli.py
 import argparse
+import os
+import sys
+from datetime import date
 from termcolor import colored
 from typing import List
 from twitter import TweetScraper
+from twitter.scraper import EXTRACTION_MODES, FETCH_MODES
 from twitter.models.schemas import TweetSchema
 from twitter.utils.logger import logger
-from twitter.utils.helpers import EnhancedJSONEncoder
+from twitter.utils.serialization import write_json
+from twitter.parsers.backends import HTML_BACKENDS, DEFAULT_BACKEND
+from twitter.pacing import PACING_PROFILES, DEFAULT_PACING
+from twitter.sinks import open_sink, arrow_format
+from twitter.sinks.sqlite import DEFAULT_STORE_PATH, TweetStore, store_format
+from twitter.dedup import DEDUP_MODES
+from twitter.batch import BatchRunner, load_queries
+from twitter.sharding import ShardedScraper, DateWindow
 
-def display_results(tweets: List[TweetSchema]):
+OUTPUT_FORMATS = ("json", "ndjson", "parquet", "arrow", "sqlite")
+STREAMING_FORMATS = ("ndjson", "parquet", "arrow", "sqlite")
+
+def display_results(tweets: List[TweetSchema], start: int = 1, header: bool = True):
     """Display formatted scraping results"""
-    print(f"\n{colored('=== Hasil Scraping ===', 'cyan', attrs=['bold'])}")
-    for idx, tweet in enumerate(tweets, 1):
+    if header:
+        print(f"\n{colored('=== Hasil Scraping ===', 'cyan', attrs=['bold'])}")
+    for idx, tweet in enumerate(tweets, start):
         user = tweet.user
         stats = tweet.stats
         
@@ -34,8 +49,146 @@ def display_results(tweets: List[TweetSchema]):
         print(f"{colored('• Link:', 'blue')} {tweet.link}")
         print("-" * 80)
 
+def output_format(args) -> str:
+    if args.format:
+        return args.format
+    if args.output.endswith((".ndjson", ".jsonl")):
+        return "ndjson"
+    return arrow_format(args.output) or store_format(args.output) or "json"
+
+def open_output_sink(args):
+    format = output_format(args)
+    # Database SQLite mencatat query asal setiap tweet
+    options = {"query": args.query} if format == "sqlite" else {}
+    return open_sink(args.output, format, **options)
+
+def stream_to_sink(scraper: TweetScraper, args) -> int:
+    """Tulis (NDJSON/Parquet/Arrow/SQLite) dan tampilkan tweet per halaman tanpa menyimpan seluruh hasil di memori"""
+    total = 0
+    with open_output_sink(args) as sink:
+        for page in scraper.iter_pages(args.query, limit=args.limit, verbose=args.verbose):
+            sink.write_page(page)
+            display_results(page, start=total + 1, header=total == 0)
+            total += len(page)
+    return total
+
+def save_json(tweets: List[TweetSchema], path: str, compact: bool = False):
+    with open(path, "wb") as f:
+        write_json(tweets, f, pretty=not compact)
+    print(f"\n{colored('✔ Hasil disimpan di:', 'green')} {path}")
+
+def scraper_options(args) -> dict:
+    return dict(
+        headless=not args.visible,
+        extraction_mode=args.extraction,
+        parser_backend=args.parser_backend,
+        instances=args.instances,
+        fetch_mode=args.fetch_mode,
+        prefetch=args.prefetch,
+        checkpoint_path=args.checkpoint,
+        resume=args.resume,
+        hedge_after=args.hedge_after,
+        pacing=args.pacing,
+        lean=args.lean,
+        dedup=args.dedup,
+        incremental=args.incremental,
+        watermark_path=args.watermarks,
+        parse_workers=args.parse_workers
+    )
+
+def run_batch(args):
+    """Scrape semua query dari --batch, hasil NDJSON per query di direktori output"""
+    queries = load_queries(args.batch)
+    if not queries:
+        raise ValueError(f"Tidak ada query di {args.batch}")
+    output_dir = args.output or "batch_results"
+    options = scraper_options(args)
+    runner = BatchRunner(
+        lambda: TweetScraper(**options),
+        output_dir,
+        workers=args.workers,
+        default_limit=args.limit,
+        verbose=args.verbose
+    )
+    summary = runner.run(queries)
+
+    print(f"\n{colored('=== Ringkasan Batch ===', 'cyan', attrs=['bold'])}")
+    for result in summary["results"]:
+        color = "green" if result["status"] == "ok" else "yellow" if result["status"] == "partial" else "red"
+        status = colored(f"{result['status'].upper():<8}", color)
+        print(f"{status} {result['query']:<40} "
+              f"{result['tweets']:>6}/{result['limit']:<6} {result['seconds']:>7.1f}s")
+    print(f"\n{summary['queries']} query, {summary['tweets']} tweet dalam {summary['seconds']}s "
+          f"({summary['tweets_per_second']} tweet/detik)")
+    if summary["failures"]:
+        print(colored(f"Gagal/kosong: {', '.join(summary['failures'])}", "red"))
+    print(f"{colored('✔ Hasil disimpan di:', 'green')} {output_dir}")
+
+def scrape_sharded(args) -> List[TweetSchema]:
+    """Scrape rentang --since/--until dalam --shards jendela tanggal paralel"""
+    with ShardedScraper(processes=args.processes, **scraper_options(args)) as scraper:
+        return scraper.scrape_tweets(
+            args.query, args.since, args.until, shards=args.shards, limit_per_window=args.limit
+        )
+
+def store_main(argv: List[str]):
+    """Subperintah `store`: cari dan ringkas tweet di database SQLite hasil -o *.db"""
+    parser = argparse.ArgumentParser(
+        prog="cli.py store",
+        description="Query database SQLite hasil scraping",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument("--db", default=DEFAULT_STORE_PATH, help="File database SQLite")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    search = commands.add_parser("search", help="Cari tweet (sintaks FTS5: kata, \"frasa\", OR, prefix*)")
+    search.add_argument("text", nargs="?", help="Teks yang dicari di konten tweet")
+    search.add_argument("-l", "--limit", type=int, default=20, help="Jumlah maksimum tweet")
+    search.add_argument("--user", help="Hanya tweet dari username ini")
+    search.add_argument("--hashtag", help="Hanya tweet dengan hashtag ini")
+    search.add_argument("--query", help="Hanya tweet yang dikumpulkan oleh query scraping ini")
+    search.add_argument("--since", type=date.fromisoformat, help="Tanggal awal (YYYY-MM-DD)")
+    search.add_argument("--until", type=date.fromisoformat, help="Tanggal akhir, eksklusif (YYYY-MM-DD)")
+    search.add_argument("--order", choices=("recent", "relevance", "likes"), default="recent",
+                        help="Urutan hasil; relevance (bm25) hanya berlaku jika teks diisi")
+
+    stats = commands.add_parser("stats", help="Jumlah tweet/pengguna/hashtag dan hashtag teratas")
+    stats.add_argument("-l", "--limit", type=int, default=10, help="Jumlah hashtag/pengguna teratas")
+
+    args = parser.parse_args(argv)
+    if not os.path.exists(args.db):
+        # TweetStore akan membuat database kosong; jangan sembunyikan path yang salah
+        logger.error(f"{colored('❌ Error:', 'red')} Database tidak ditemukan: {args.db}")
+        exit(1)
+    try:
+        with TweetStore(args.db) as store:
+            if args.command == "search":
+                tweets = store.search(
+                    args.text, limit=args.limit, username=args.user, hashtag=args.hashtag,
+                    query=args.query, since=args.since, until=args.until, order=args.order
+                )
+                display_results(tweets)
+                print(f"\n{colored(f'{len(tweets)} tweet ditemukan', 'green')}")
+                return
+            counts = store.stats()
+            print(f"\n{colored('=== Isi Database ===', 'cyan', attrs=['bold'])}")
+            for name, count in counts.items():
+                print(f"{colored(f'• {name}:', 'green')} {count}")
+            print(f"\n{colored('Hashtag teratas:', 'cyan')}")
+            for tag, count in store.top_hashtags(args.limit):
+                print(f"  #{tag:<30} {count}")
+            print(f"\n{colored('Pengguna teratas:', 'cyan')}")
+            for username, count in store.top_users(args.limit):
+                print(f"  @{username:<30} {count}")
+    except Exception as e:
+        logger.error(f"{colored('❌ Error:', 'red')} {str(e)}")
+        exit(1)
+
 def main():
     """Command Line Interface for Twitter Scraper"""
+    if sys.argv[1:2] == ["store"]:
+        store_main(sys.argv[2:])
+        return
     parser = argparse.ArgumentParser(
         description="Nitter Scraper - Ekstrak Data Twitter Tanpa API",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter
@@ -43,8 +196,20 @@ def main():
     
     parser.add_argument(
         "query",
+        nargs="?",
         help="Kata kunci atau hashtag untuk pencarian"
     )
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="File berisi satu query per baris (opsional 'query | limit'); -o menjadi direktori output"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=2,
+        help="Mode batch: jumlah query yang di-scrape bersamaan"
+    )
     parser.add_argument(
         "-l", "--limit",
         type=int,
@@ -53,13 +218,126 @@ def main():
     )
     parser.add_argument(
         "-o", "--output",
-        help="Simpan hasil ke file JSON"
+        help="Simpan hasil ke file JSON; NDJSON untuk .ndjson/.jsonl, Parquet/Arrow untuk .parquet/.arrow, SQLite untuk .db/.sqlite"
+    )
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        help="Format output; ndjson/parquet/arrow/sqlite ditulis per halaman selama scraping (default: dari ekstensi file)"
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Tulis file JSON tanpa indentasi (lebih kecil dan lebih cepat untuk hasil besar)"
+    )
+    parser.add_argument(
+        "--instance",
+        action="append",
+        dest="instances",
+        help="URL instance Nitter yang dipakai (bisa diulang, default dari settings)"
     )
     parser.add_argument(
         "--visible",
         action="store_true",
         help="Tampilkan browser selama proses scraping"
     )
+    parser.add_argument(
+        "--lean",
+        action="store_true",
+        help="Browser hemat: blokir gambar, media, font dan request pihak ketiga"
+    )
+    parser.add_argument(
+        "--fetch-mode",
+        choices=FETCH_MODES,
+        default="browser",
+        help="http = ambil halaman tanpa browser, fallback ke browser jika diblokir"
+    )
+    parser.add_argument(
+        "--extraction",
+        choices=EXTRACTION_MODES,
+        default="bulk",
+        help="Cara mengambil tweet dari halaman (dom = ekstraksi JSON di browser)"
+    )
+    parser.add_argument(
+        "--parser-backend",
+        choices=list(HTML_BACKENDS),
+        default=DEFAULT_BACKEND,
+        help="Backend parser HTML (fallback ke html.parser jika tidak terpasang)"
+    )
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Mode browser + bulk: parse halaman di N proses selagi browser membuka halaman berikutnya"
+    )
+    parser.add_argument(
+        "--no-prefetch",
+        dest="prefetch",
+        action="store_false",
+        help="Jangan ambil halaman berikutnya selagi halaman saat ini di-parse"
+    )
+    parser.add_argument(
+        "--pacing",
+        choices=list(PACING_PROFILES),
+        default=DEFAULT_PACING,
+        help="Profil tempo: human = scroll seperti manusia, fast = tanpa scroll dengan rate limit longgar"
+    )
+    parser.add_argument(
+        "--hedge-after",
+        type=float,
+        metavar="SECONDS",
+        help="Mode http: minta halaman yang sama ke instance kedua jika belum dijawab dalam N detik"
+    )
+    parser.add_argument(
+        "--dedup",
+        choices=DEDUP_MODES,
+        default="exact",
+        help="Index duplikat: bloom = memori tetap untuk limit sangat besar (ada peluang false positive kecil)"
+    )
+    parser.add_argument(
+        "--checkpoint",
+        metavar="PATH",
+        help="Simpan progres scraping ke file SQLite setelah setiap halaman"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Lanjutkan scraping dari checkpoint terakhir untuk query yang sama"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Hanya ambil tweet baru sejak run terakhir; berhenti di tweet yang sudah pernah dikumpulkan"
+    )
+    parser.add_argument(
+        "--watermarks",
+        metavar="PATH",
+        help="File SQLite watermark per query (default untuk --incremental: scraper_watermarks.db)"
+    )
+    parser.add_argument(
+        "--since",
+        type=date.fromisoformat,
+        metavar="YYYY-MM-DD",
+        help="Hanya tweet sejak tanggal ini (inklusif)"
+    )
+    parser.add_argument(
+        "--until",
+        type=date.fromisoformat,
+        metavar="YYYY-MM-DD",
+        help="Hanya tweet sebelum tanggal ini (eksklusif)"
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=1,
+        help="Bagi rentang --since/--until menjadi N jendela yang di-scrape paralel; --limit berlaku per jendela"
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        help="Jumlah proses untuk --shards (default: jumlah CPU)"
+    )
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -67,26 +345,46 @@ def main():
     )
     
     args = parser.parse_args()
+    if not args.query and not args.batch:
+        parser.error("query atau --batch wajib diisi")
+    if args.shards > 1 and not (args.since and args.until):
+        parser.error("--shards membutuhkan --since dan --until")
     
     try:
-        scraper = TweetScraper(headless=not args.visible)
-        tweets = scraper.scrape_tweets(
-            query=args.query,
-            limit=args.limit,
-            verbose=args.verbose
-        )
+        if args.batch:
+            run_batch(args)
+            return
+        if args.shards > 1:
+            tweets = scrape_sharded(args)
+            if args.output and output_format(args) in STREAMING_FORMATS:
+                with open_output_sink(args) as sink:
+                    sink.write_page(tweets)
+                print(f"\n{colored('✔ Hasil disimpan di:', 'green')} {args.output}")
+            elif args.output:
+                save_json(tweets, args.output, args.compact)
+            display_results(tweets)
+            print(f"\n{colored(f'Berhasil mengumpulkan {len(tweets)} tweet!', 'green')}")
+            return
+        if args.since and args.until:
+            args.query = DateWindow(args.since, args.until).apply(args.query)
+        elif args.since:
+            args.query = f"{args.query} since:{args.since.isoformat()}"
+        elif args.until:
+            args.query = f"{args.query} until:{args.until.isoformat()}"
+        with TweetScraper(**scraper_options(args)) as scraper:
+            if args.output and output_format(args) in STREAMING_FORMATS:
+                total = stream_to_sink(scraper, args)
+                print(f"\n{colored('✔ Hasil disimpan di:', 'green')} {args.output}")
+                print(f"\n{colored(f'Berhasil mengumpulkan {total} tweet!', 'green')}")
+                return
+            tweets = scraper.scrape_tweets(
+                query=args.query,
+                limit=args.limit,
+                verbose=args.verbose
+            )
         
         if args.output:
-            import json
-            with open(args.output, "w") as f:
-                json.dump(
-                    tweets,
-                    f,
-                    indent=2,
-                    cls=EnhancedJSONEncoder,
-                    ensure_ascii=False
-                )
-            print(f"\n{colored('✔ Hasil disimpan di:', 'green')} {args.output}")
+            save_json(tweets, args.output, args.compact)
         
         display_results(tweets)
         print(f"\n{colored(f'Berhasil mengumpulkan {len(tweets)} tweet!', 'green')}")
@@ -0,0 +1,58 @@
+# File: dedup_test.py
+from twitter import TweetScraper
+from twitter.dedup import BloomTweetIndex, TweetIndex, make_index
+from twitter.parsers import SinglePassTweetParser, TweetParser
+from twitter.scraper import _ScrapeRun
+from twitter.testing import fixture_names, load_fixture
+from twitter.utils.helpers import extract_tweet_id
+
+
+def test_exact_index():
+    index = TweetIndex()
+    assert index.add("1") and not index.add("1")
+    assert "1" in index and "2" not in index
+    assert len(index) == 1
+
+
+def test_bloom_index_is_bounded_and_accurate():
+    index = BloomTweetIndex(capacity=20000, error_rate=0.01)
+    size = index.memory_bytes
+    for n in range(20000):
+        index.add(str(n))
+    assert index.memory_bytes == size
+    assert all(str(n) in index for n in range(20000))
+    false_positives = sum(str(n) in index for n in range(20000, 40000))
+    assert false_positives / 20000 < 0.02
+
+
+def test_item_id_matches_parsed_link():
+    for name in fixture_names():
+        for item in TweetParser.split_timeline(load_fixture(name)):
+            parsed = SinglePassTweetParser.parse_element(item)
+            if parsed and parsed.link:
+                assert TweetScraper._item_tweet_id(item) == extract_tweet_id(parsed.link)
+
+
+def test_known_tweets_are_skipped_before_parsing():
+    items = [item for name in fixture_names() for item in TweetParser.split_timeline(load_fixture(name))]
+    run = _ScrapeRun("jokowi", limit=1000, index=make_index("bloom", 1000))
+    accepted = [item for item in items if run.accept(SinglePassTweetParser.parse_element(item))]
+    assert accepted
+
+    # Putaran kedua (misalnya setelah rotasi instance) tidak perlu parse sama sekali
+    assert all(run.is_known(TweetScraper._item_tweet_id(item)) for item in accepted)
+    assert run.skipped == len(accepted)
+
+
+def test_bloom_index_is_sized_per_run():
+    scraper = TweetScraper(dedup="bloom", health_path=None)
+    try:
+        assert scraper._new_run("jokowi", 5000).index.capacity == 5000
+        assert scraper._new_run("prabowo", 20).index.capacity == 20
+    finally:
+        scraper.close()
+    fixed = TweetScraper(dedup="bloom", dedup_capacity=100, health_path=None)
+    try:
+        assert fixed._new_run("jokowi", 5000).index.capacity == 100
+    finally:
+        fixed.close()
@@ -0,0 +1,35 @@
+# File: instance_health_test.py
+import time
+from twitter.instance_health import InstanceHealthRegistry
+from twitter.instance_manager import InstanceManager
+from twitter.testing.nitter_server import NitterStubCluster, StubInstanceConfig
+
+
+def test_registry_prefers_fast_instance_and_persists(tmp_path):
+    path = str(tmp_path / "health.json")
+    configs = [StubInstanceConfig(latency=0.3), StubInstanceConfig(), StubInstanceConfig(dead=True)]
+    with NitterStubCluster(configs) as cluster:
+        slow, fast, dead = cluster.instances
+        registry = InstanceHealthRegistry(path)
+        start = time.perf_counter()
+        assert registry.best(cluster.instances) == fast
+        # Semua instance di-probe sekaligus, bukan berurutan
+        assert time.perf_counter() - start < 1.0 + 0.3
+        assert registry.ranked(cluster.instances) == [fast, slow]
+        assert not registry.get(dead).ok
+        registry.close()
+
+        # Run berikutnya memakai cache tanpa request baru
+        requests = {url: stats.requests for url, stats in cluster.stats().items()}
+        cached = InstanceHealthRegistry(path)
+        assert cached.best(cluster.instances) == fast
+        assert {url: stats.requests for url, stats in cluster.stats().items()} == requests
+
+
+def test_manager_rotates_away_from_failed_instance():
+    with NitterStubCluster([StubInstanceConfig(), StubInstanceConfig(latency=0.1)]) as cluster:
+        manager = InstanceManager(None, cluster.instances, registry=InstanceHealthRegistry(None))
+        first = manager.get_working_instance()
+        second = manager.rotate()
+        assert second != first
+        assert manager.registry.get(first).failures == 1
@@ -1,9 +1,9 @@
 # File: main_test.py
-import json
 from datetime import datetime
 from twitter import TweetScraper
 from twitter.utils.logger import logger
-from twitter.utils.helpers import EnhancedJSONEncoder
+from twitter.utils.serialization import write_json
+from twitter.sinks import NDJSONSink
 
 def test_scraping():
     """Fungsi testing untuk scraping tweet"""
@@ -14,28 +14,35 @@ def test_scraping():
             "limit": 30,
             "visible_browser": True,
             "output_file": "test_results.json",
+            "output_format": "json",   # "ndjson" = tulis per halaman selama scraping
             "verbose": True
         }
         
         logger.info("Memulai proses testing...")
         start_time = datetime.now()
         
-        scraper = TweetScraper(headless=not test_config["visible_browser"])
-        results = scraper.scrape_tweets(
-            query=test_config["query"],
-            limit=test_config["limit"],
-            verbose=test_config["verbose"]
-        )
-        
-        # Simpan hasil dalam format JSON
-        with open(test_config["output_file"], "w") as f:
-            json.dump(
-                results,
-                f,
-                indent=2,
-                cls=EnhancedJSONEncoder,
-                ensure_ascii=False
-            )
+        with TweetScraper(headless=not test_config["visible_browser"]) as scraper:
+            if test_config["output_format"] == "ndjson":
+                # Append NDJSON dan flush setiap halaman selesai
+                results = []
+                with NDJSONSink(test_config["output_file"]) as sink:
+                    for page in scraper.iter_pages(
+                        query=test_config["query"],
+                        limit=test_config["limit"],
+                        verbose=test_config["verbose"]
+                    ):
+                        sink.write_page(page)
+                        results.extend(page)
+            else:
+                results = scraper.scrape_tweets(
+                    query=test_config["query"],
+                    limit=test_config["limit"],
+                    verbose=test_config["verbose"]
+                )
+
+                # Simpan hasil dalam format JSON
+                with open(test_config["output_file"], "wb") as f:
+                    write_json(results, f)
         
         # Analisis hasil
         duration = datetime.now() - start_time
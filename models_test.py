@@ -0,0 +1,38 @@
+# File: models_test.py
+import json
+import pytest
+from twitter.models import EMPTY_MEDIA, MediaSchema, TweetTable, UserSchema
+from twitter.testing import fixture_tweets
+from twitter.utils.helpers import EnhancedJSONEncoder, tweet_from_dict
+
+
+def test_schemas_are_compact_and_share_empty_media():
+    tweets = fixture_tweets()
+    assert not hasattr(tweets[0], "__dict__")
+    assert any(tweet.media is EMPTY_MEDIA for tweet in tweets)
+    assert MediaSchema.of([], [], []) is EMPTY_MEDIA
+    assert MediaSchema(images=["a"]).images == ("a",)
+    with pytest.raises(AttributeError):
+        EMPTY_MEDIA.images = ("x",)
+    first = UserSchema("".join(["ko", "mpas"]), "Kompas")
+    second = UserSchema("".join(["kom", "pas"]), "Kompas")
+    assert first.username is second.username
+
+
+def test_round_trip_through_json_keeps_media_shared():
+    for tweet in fixture_tweets():
+        data = json.loads(json.dumps(tweet, cls=EnhancedJSONEncoder))
+        assert tweet_from_dict(data) == tweet
+
+
+def test_tweet_table_matches_tweet_list():
+    tweets = fixture_tweets() * 3
+    table = TweetTable.from_tweets(tweets)
+    assert len(table) == len(tweets)
+    assert list(table) == tweets
+    assert table[-1] == tweets[-1]
+    assert table[1:4] == tweets[1:4]
+    assert list(table.column("likes")) == [t.stats.likes for t in tweets]
+    assert table.column("username") == [t.user.username for t in tweets]
+    with pytest.raises(IndexError):
+        table[len(tweets)]
@@ -0,0 +1,52 @@
+# File: nitter_server_test.py
+import urllib.error
+import urllib.request
+import pytest
+from bs4 import BeautifulSoup
+from twitter.parsers import TweetParser
+from twitter.testing.nitter_server import NitterStubServer, StubInstanceConfig
+
+
+def _get(url: str):
+    with urllib.request.urlopen(url, timeout=5) as response:
+        return response.status, response.read().decode("utf-8")
+
+
+def test_stub_paginates_with_cursor():
+    with NitterStubServer(StubInstanceConfig(page_size=10, total_items=25)) as server:
+        url = f"{server.url}/search?f=tweets&q=jokowi"
+        links = []
+        while url:
+            _, html = _get(url)
+            soup = BeautifulSoup(html, "html.parser")
+            links.extend(a["href"] for a in soup.select("div.timeline-item a.tweet-link"))
+            more = [a["href"] for a in soup.select("div.show-more a") if "cursor=" in a["href"]]
+            url = f"{server.url}/search{more[0]}" if more else None
+        assert len(links) == 25
+        assert len(set(links)) == 25
+        assert server.stats.pages == 3
+
+
+def test_stub_faults():
+    with NitterStubServer(StubInstanceConfig(error_rate=1.0)) as server:
+        with pytest.raises(urllib.error.HTTPError) as error:
+            _get(f"{server.url}/search?q=test")
+        assert error.value.code == 503
+
+    with NitterStubServer(StubInstanceConfig(empty_rate=1.0)) as server:
+        _, html = _get(f"{server.url}/search?q=test")
+        assert TweetParser.split_timeline(html) == []
+
+    with NitterStubServer(StubInstanceConfig(dead=True)) as server:
+        with pytest.raises((urllib.error.URLError, ConnectionError)):
+            _get(f"{server.url}/search?q=test")
+
+
+def test_stub_serves_assets_when_enabled():
+    with NitterStubServer(StubInstanceConfig(asset_bytes=1000)) as server:
+        status, body = _get(f"{server.url}/css/style.css")
+        assert status == 200 and len(body) == 1000
+
+    with NitterStubServer() as server:
+        with pytest.raises(urllib.error.HTTPError):
+            _get(f"{server.url}/css/style.css")
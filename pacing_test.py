@@ -0,0 +1,29 @@
+# File: pacing_test.py
+import time
+import pytest
+from twitter.pacing import Pacer, PacingProfile, TokenBucket, resolve_profile
+
+
+def test_token_bucket_allows_burst_then_paces():
+    bucket = TokenBucket(rate=10.0, capacity=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.02)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.02)
+
+
+def test_pacer_limits_each_instance_separately():
+    pacer = Pacer(PacingProfile("test", rate=20.0, burst=1), overrides={"http://slow:8080": "human"})
+    start = time.perf_counter()
+    for _ in range(3):
+        pacer.before_request("http://a/search?q=1")
+        pacer.before_request("http://b/search?q=1")
+    assert 0.08 <= time.perf_counter() - start < 0.3
+    assert pacer.profile_for("http://slow:8080/search?cursor=x").name == "human"
+    assert pacer.profile_for("http://a/search").name == "test"
+
+
+def test_unknown_profile():
+    assert resolve_profile("fast").simulate_scroll is False
+    with pytest.raises(ValueError):
+        resolve_profile("reckless")
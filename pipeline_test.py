@@ -0,0 +1,67 @@
+# File: pipeline_test.py
+from dataclasses import replace
+from twitter import TweetScraper
+from twitter.parsers import ParsePipeline, TweetParser
+from twitter.parsers.pipeline import has_tweets, parse_page
+from twitter.scraper import _ScrapeRun
+from twitter.testing import load_fixture, fixture_names
+from twitter.testing.nitter_server import NitterStubServer, StubInstanceConfig
+
+
+def render_pages(total_items=80, page_size=10):
+    with NitterStubServer(StubInstanceConfig(page_size=page_size, total_items=total_items)) as server:
+        return [server.render_page("jokowi", offset) for offset in range(0, total_items, page_size)]
+
+
+def without_timestamp(tweets):
+    # Waktu relatif ("2h") dihitung dari datetime.now() saat parse, jadi bisa beda beberapa mikrodetik
+    return [replace(tweet, timestamp=None) if tweet else tweet for tweet in tweets]
+
+
+def test_parse_page_matches_inline_parser():
+    scraper = TweetScraper(extraction_mode="bulk", health_path=None)
+    try:
+        for html in [load_fixture(name) for name in fixture_names()] + render_pages(20):
+            assert has_tweets(html)
+            # Jalur inline _iter_browser_pages: split_page lalu _parse_timeline_item per item
+            items, _ = TweetParser.split_page(html, scraper.parser_backend)
+            expected = [scraper._parse_timeline_item(item) for item in items]
+            assert any(expected)
+            assert without_timestamp(parse_page(html, scraper.parser_backend)) == without_timestamp(expected)
+    finally:
+        scraper.close()
+    assert not has_tweets("<div class='timeline'></div>")
+
+
+def test_pipeline_returns_pages_in_order_with_backpressure():
+    pages = render_pages()
+
+    received = []
+    with ParsePipeline(workers=2, max_pending=3) as pipeline:
+        for index, html in enumerate(pages):
+            received.extend(pipeline.submit(html, index))
+            # Backpressure: tidak pernah lebih dari max_pending halaman tertunda
+            assert pipeline.pending <= 3
+        received.extend(pipeline.drain())
+
+    assert [index for index, _ in received] == list(range(len(pages)))
+    for (index, parsed), html in zip(received, pages):
+        assert [t.link for t in parsed if t] == [t.link for t in parse_page(html) if t]
+
+
+def test_pages_after_limit_do_not_move_checkpoint(tmp_path):
+    scraper = TweetScraper(health_path=None, checkpoint_path=str(tmp_path / "scrape.db"))
+    try:
+        run = _ScrapeRun("jokowi", limit=5)
+        scraper.checkpoint.start(run.query, "/search?f=tweets&q=jokowi")
+        pages = [parse_page(html) for html in render_pages(30)]
+        urls = [f"http://127.0.0.1/search?f=tweets&q=jokowi&cursor={n}" for n in range(3)]
+        first = scraper._accept_parsed_page(run, urls[0], urls[1], pages[0])
+        assert len(first) == 5 and run.done
+        # Halaman siap berikutnya tidak menimpa cursor halaman tempat limit tercapai
+        assert scraper._accept_parsed_page(run, urls[1], urls[2], pages[1]) == []
+        saved = scraper.checkpoint.load("jokowi")
+        assert saved.cursor == TweetScraper._cursor_path(urls[0])
+        assert [tweet.link for tweet in saved.tweets] == [tweet.link for tweet in first]
+    finally:
+        scraper.close()
@@ -0,0 +1,99 @@
+# File: resilience_test.py
+import time
+from twitter.http_fetcher import FetchResult, HttpFetcher, is_challenge_page
+from twitter.resilience import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitBreakerBoard, HedgedFetcher
+from twitter.testing import load_fixture
+from twitter.testing.nitter_server import NitterStubCluster, StubInstanceConfig
+
+
+def test_circuit_breaker_states():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    breaker.record_failure()
+    assert breaker.allow() and breaker.state == CLOSED
+    breaker.record_failure()
+    assert not breaker.allow() and breaker.state == OPEN
+
+    time.sleep(0.06)
+    assert breaker.allow() and breaker.state == HALF_OPEN
+    breaker.record_failure()
+    assert breaker.state == OPEN
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+
+
+def test_half_open_allows_single_trial():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert [breaker.allow(), breaker.allow()] == [True, False]
+    assert breaker.state == HALF_OPEN
+
+    # Percobaan yang tidak pernah melapor hasil kadaluarsa setelah reset_timeout
+    time.sleep(0.06)
+    assert [breaker.allow(), breaker.allow()] == [True, False]
+    breaker.record_success()
+    assert breaker.allow() and breaker.allow()
+
+    board = CircuitBreakerBoard(failure_threshold=1, reset_timeout=0.05)
+    board.record_failure("a")
+    assert board.blocked(["a", "b"]) == ["a"]
+    time.sleep(0.06)
+    # Filter hanya membaca state: slot percobaan tetap tersedia untuk request sungguhan
+    assert board.blocked(["a", "b"]) == [] and board.blocked(["a", "b"]) == []
+    assert not board.is_open("a")
+    assert board.allow("a")
+    assert board.blocked(["a", "b"]) == ["a"] and not board.allow("a")
+    board.record_success("a")
+    assert board.blocked(["a", "b"]) == []
+
+
+def test_hedged_fetch_uses_backup_for_slow_primary():
+    with NitterStubCluster([StubInstanceConfig(latency=1.5), StubInstanceConfig()]) as cluster:
+        slow, fast = cluster.instances
+        with HttpFetcher() as fetcher:
+            hedger = HedgedFetcher(fetcher, CircuitBreakerBoard(), hedge_after=0.2)
+            start = time.perf_counter()
+            instance, result = hedger.get("/search?f=tweets&q=jokowi", [slow, fast])
+            elapsed = time.perf_counter() - start
+            hedger.close()
+    assert instance == fast
+    assert result.status == 200
+    assert elapsed < 1.0
+
+
+def test_failing_instance_opens_circuit():
+    with NitterStubCluster([StubInstanceConfig(error_rate=1.0)]) as cluster:
+        (broken,) = cluster.instances
+        breakers = CircuitBreakerBoard(failure_threshold=2)
+        with HttpFetcher() as fetcher:
+            hedger = HedgedFetcher(fetcher, breakers)
+            for _ in range(2):
+                _, result = hedger.get("/search?q=test", [broken])
+                assert result.status == 503
+            hedger.close()
+    assert breakers.state(broken) == OPEN
+    assert breakers.blocked([broken]) == [broken]
+
+
+def test_challenge_detection_ignores_tweet_text():
+    quoted = load_fixture("search_page_1.html").replace(
+        '<div class="tweet-content media-body" dir="auto">',
+        '<div class="tweet-content media-body" dir="auto">Just a moment... Checking your browser, '
+        "anubis bilang: Making sure you're not a bot ",
+        1
+    )
+    assert not is_challenge_page(FetchResult("u", 200, quoted, 0.1))
+    assert not is_challenge_page(FetchResult("u", 200, "<p>Just a moment... anubis</p>", 0.1))
+
+    cloudflare = (
+        "<html><head><title>Just a moment...</title></head><body>"
+        '<form id="challenge-form" action="/"></form>'
+        '<script src="/cdn-cgi/challenge-platform/h/b/orchestrate/jsch/v1"></script></body></html>'
+    )
+    anubis = '<html><head><script id="anubis_challenge" type="application/json">{}</script></head></html>'
+    assert is_challenge_page(FetchResult("u", 503, cloudflare, 0.1))
+    assert is_challenge_page(FetchResult("u", 200, anubis, 0.1))
+    assert is_challenge_page(FetchResult("u", 429, quoted, 0.1))
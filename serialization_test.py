@@ -0,0 +1,55 @@
+# File: serialization_test.py
+import dataclasses
+import io
+import json
+from datetime import datetime
+import pytest
+from twitter.models import EMPTY_MEDIA, TweetSchema
+from twitter.testing import fixture_tweets
+from twitter.utils import serialization
+
+
+def legacy_default(o):
+    """Perilaku EnhancedJSONEncoder lama (dataclasses.asdict)"""
+    if dataclasses.is_dataclass(o):
+        return dataclasses.asdict(o)
+    if isinstance(o, datetime):
+        return o.isoformat()
+    raise TypeError
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    if request.param == "json":
+        monkeypatch.setattr(serialization, "orjson", None)
+    elif serialization.orjson is None:
+        pytest.skip("orjson tidak terpasang")
+    return request.param
+
+
+def test_output_matches_legacy_encoder(backend):
+    tweets = fixture_tweets()
+    legacy = json.dumps(tweets, default=legacy_default, ensure_ascii=False, indent=2)
+    assert serialization.dumps(tweets, pretty=True) == legacy
+    assert json.loads(serialization.dumps(tweets)) == json.loads(legacy)
+    assert "\n" not in serialization.dumps(tweets[0])
+
+
+def test_round_trip(backend):
+    tweets = fixture_tweets()
+    assert serialization.tweets_from_json(serialization.dumps(tweets)) == tweets
+    lines = io.BytesIO(serialization.ndjson_bytes(tweets))
+    decoded = list(serialization.iter_ndjson(lines))
+    assert decoded == tweets
+    assert any(tweet.media is EMPTY_MEDIA for tweet in decoded)
+
+
+def test_from_dict_accepts_minimal_records():
+    tweet = serialization.from_dict({"user": {"username": "a", "fullname": "A"}, "content": "halo", "link": "x"})
+    assert isinstance(tweet, TweetSchema)
+    assert tweet.hashtags == [] and tweet.timestamp is None and tweet.media is EMPTY_MEDIA
+
+    empty = serialization.from_dict(
+        {"user": {"username": "a", "fullname": "A"}, "content": "halo", "link": "x", "timestamp": ""}
+    )
+    assert empty.timestamp is None
@@ -0,0 +1,32 @@
+# File: sharding_test.py
+from datetime import date, datetime, timezone
+from twitter import TweetScraper
+from twitter.sharding import ShardedScraper, split_date_range
+from twitter.testing.nitter_server import NitterStubServer, StubInstanceConfig
+
+
+def test_split_date_range_is_disjoint_and_newest_first():
+    windows = split_date_range(date(2025, 1, 1), date(2025, 1, 11), 3)
+    assert [(w.since.day, w.until.day) for w in windows] == [(8, 11), (5, 8), (1, 5)]
+    assert len(split_date_range(date(2025, 1, 1), date(2025, 1, 3), 10)) == 2
+    assert windows[0].apply("jokowi") == "jokowi since:2025-01-08 until:2025-01-11"
+
+
+def test_sharded_scrape_matches_sequential_in_timestamp_order():
+    config = StubInstanceConfig(
+        page_size=10, total_items=100,
+        timeline_start=datetime(2025, 4, 10, tzinfo=timezone.utc), tweet_interval=6 * 3600
+    )
+    options = dict(fetch_mode="http", health_path=None, pacing="fast")
+    with NitterStubServer(config) as server:
+        with TweetScraper(instances=[server.url], **options) as scraper:
+            sequential = scraper.scrape_tweets("jokowi since:2025-03-25 until:2025-04-05", limit=500)
+        with ShardedScraper(processes=2, instances=[server.url], **options) as sharded:
+            merged = sharded.scrape_tweets(
+                "jokowi", date(2025, 3, 25), date(2025, 4, 5), shards=4, limit_per_window=500
+            )
+
+    assert len(sequential) > 30
+    assert [t.link for t in merged] == [t.link for t in sequential]
+    timestamps = [t.timestamp for t in merged]
+    assert timestamps == sorted(timestamps, reverse=True)
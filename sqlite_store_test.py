@@ -0,0 +1,72 @@
+# File: sqlite_store_test.py
+import re
+from dataclasses import replace
+from datetime import date
+from twitter.models import TweetStats
+from twitter.sinks import TweetStore, open_sink
+from twitter.testing import fixture_tweets
+from twitter.utils.helpers import extract_tweet_id
+
+
+def unique_tweets():
+    # Store menyimpan satu baris per ID tweet
+    tweets = {}
+    for tweet in fixture_tweets():
+        tweets.setdefault(extract_tweet_id(tweet.link), tweet)
+    return list(tweets.values())
+
+
+def test_round_trip_and_open_sink(tmp_path):
+    tweets = unique_tweets()
+    path = str(tmp_path / "tweets.db")
+    with open_sink(path, query="jokowi", batch_size=4) as store:
+        assert isinstance(store, TweetStore)
+        for start in range(0, len(tweets), 3):
+            store.write_page(tweets[start:start + 3])
+        assert store.stats()["tweets"] == len(tweets)
+        for tweet in tweets:
+            assert store.get(extract_tweet_id(tweet.link)) == tweet
+
+
+def test_upsert_updates_stats_without_duplicates(tmp_path):
+    tweets = unique_tweets()
+    path = str(tmp_path / "tweets.db")
+    with TweetStore(path, query="a") as store:
+        store.write_page(tweets)
+    updated = replace(tweets[0], stats=TweetStats(1, 2, 3, 999_999))
+    with TweetStore(path, query="b") as store:
+        store.write_page([updated])
+        counts = store.stats()
+        assert counts["tweets"] == len(tweets)
+        assert counts["queries"] == 2
+        assert store.get(extract_tweet_id(updated.link)).stats.likes == 999_999
+        assert store.search(order="likes", limit=1)[0].link == updated.link
+        assert [t.link for t in store.search(query="b")] == [updated.link]
+
+
+def test_full_text_search_and_filters(tmp_path):
+    tweets = unique_tweets()
+    target = tweets[0]
+    word = max(re.findall(r"[A-Za-z]+", target.content), key=len)
+    with TweetStore(str(tmp_path / "tweets.db")) as store:
+        store.write_page(tweets)
+        found = store.search(word, limit=100)
+        assert target.link in [t.link for t in found]
+        assert all(word.lower() in t.content.lower() for t in found)
+
+        by_user = store.search(username=target.user.username.upper(), limit=100)
+        assert by_user and all(t.user.username == target.user.username for t in by_user)
+
+        tagged = next(t for t in tweets if t.hashtags)
+        tag = tagged.hashtags[0]
+        assert tagged.link in [t.link for t in store.search(hashtag=f"#{tag}", limit=100)]
+        # Hashtag asli (kapitalisasi dan urutan) tetap utuh; pencarian tidak peka huruf besar/kecil
+        mixed = next(t for t in tweets if any(tag != tag.lower() for tag in t.hashtags))
+        assert store.get(extract_tweet_id(mixed.link)).hashtags == mixed.hashtags
+        upper = next(tag for tag in mixed.hashtags if tag != tag.lower()).upper()
+        assert mixed.link in [t.link for t in store.search(hashtag=upper, limit=100)]
+        assert store.top_hashtags(1)[0][1] >= 1
+
+        assert store.search(since=date(2100, 1, 1)) == []
+        recent = store.search(order="recent", limit=100)
+        assert len(recent) == len(tweets)
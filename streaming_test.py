@@ -0,0 +1,29 @@
+# File: streaming_test.py
+import json
+from twitter import TweetScraper
+from twitter.sinks import NDJSONSink
+from twitter.testing.nitter_server import NitterStubServer, StubInstanceConfig
+
+
+def test_iter_pages_streams_to_ndjson(tmp_path):
+    path = tmp_path / "tweets.ndjson"
+    with NitterStubServer(StubInstanceConfig(page_size=10, total_items=60)) as server:
+        with TweetScraper(fetch_mode="http", instances=[server.url], health_path=None, pacing="fast") as scraper:
+            pages = scraper.iter_pages("jokowi", limit=25)
+            with NDJSONSink(str(path)) as sink:
+                first = next(pages)
+                sink.write_page(first)
+                # Halaman pertama sudah di disk sebelum halaman berikutnya diminta
+                assert len(path.read_text().splitlines()) == len(first)
+                # Paling jauh halaman kedua yang sedang di-prefetch
+                assert len([p for p in server.stats.paths if "f=tweets" in p]) <= 2
+                for page in pages:
+                    sink.write_page(page)
+
+            expected = TweetScraper(fetch_mode="http", instances=[server.url], health_path=None, pacing="fast")
+            links = [tweet.link for tweet in expected.scrape_tweets("jokowi", limit=25)]
+            expected.close()
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line["link"] for line in lines] == links
+    assert len(lines) == 25
@@ -1,5 +1,6 @@
 # twitter/__init__.py
 
 from .scraper import TweetScraper
+from .async_scraper import AsyncTweetScraper
 
-__all__ = ['TweetScraper']
\ No newline at end of file
+__all__ = ['TweetScraper', 'AsyncTweetScraper']
\ No newline at end of file
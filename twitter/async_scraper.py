@@ -0,0 +1,246 @@
+# twitter/async_scraper.py
+import asyncio
+import itertools
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import quote_plus, urljoin
+from playwright.async_api import Page
+from .browser_manager import AsyncBrowserManager, BrowserConfig
+from .settings import NIITTER_INSTANCES
+from .instance_health import InstanceHealthRegistry, DEFAULT_HEALTH_PATH
+from .resilience import CircuitBreakerBoard
+from .pacing import Pacer, ProfileSpec, DEFAULT_PACING
+from .parsers.tweet_parser import TweetParser
+from .parsers.single_pass_parser import SinglePassTweetParser
+from .parsers.dom_extractor import DOMExtractor, EXTRACT_SCRIPT
+from .parsers.backends import resolve_backend
+from .models.schemas import TweetSchema
+from .dedup import TweetIndex
+from .scraper import TweetScraper, NEXT_URL_SCRIPT
+from .utils.helpers import extract_tweet_id
+from .utils.logger import logger
+
+ASYNC_EXTRACTION_MODES = ("bulk", "dom")
+
+class AsyncTweetScraper:
+    """Scraper berbasis asyncio yang menjalankan banyak pencarian sekaligus.
+
+    Semua query berbagi satu Chromium; setiap query mendapat context dan
+    page sendiri, dan jumlah page aktif dibatasi oleh `concurrency`.
+
+        async with AsyncTweetScraper(concurrency=4) as scraper:
+            results = await scraper.scrape_many(["jokowi", "prabowo"], limit=50)
+    """
+
+    def __init__(
+        self,
+        headless: bool = True,
+        concurrency: int = 4,
+        extraction_mode: str = "bulk",
+        parser_backend: Optional[str] = None,
+        instances: Optional[List[str]] = None,
+        prefetch: bool = True,
+        health_path: Optional[str] = DEFAULT_HEALTH_PATH,
+        page_timeout: int = 20000,
+        pacing: ProfileSpec = DEFAULT_PACING,
+        instance_pacing: Optional[Dict[str, ProfileSpec]] = None,
+        lean: bool = False
+    ):
+        if extraction_mode not in ASYNC_EXTRACTION_MODES:
+            raise ValueError(f"Unknown extraction mode: {extraction_mode}")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.config = BrowserConfig.lean() if lean else BrowserConfig()
+        self.headless = headless
+        self.concurrency = concurrency
+        self.extraction_mode = extraction_mode
+        self.parser_backend = resolve_backend(parser_backend)
+        self.instances = instances or NIITTER_INSTANCES
+        self.prefetch = prefetch
+        self.health = InstanceHealthRegistry(health_path)
+        self.breakers = CircuitBreakerBoard()
+        self.page_timeout = page_timeout
+        self.pacer = Pacer(pacing, instance_pacing)
+        self.max_retries = 3
+        self.browser_manager: Optional[AsyncBrowserManager] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._working_instances: List[str] = []
+        self._instance_cycle = None
+        self._instance_lock: Optional[asyncio.Lock] = None
+
+    async def __aenter__(self):
+        self.browser_manager = AsyncBrowserManager(headless=self.headless, config=self.config)
+        await self.browser_manager.__aenter__()
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._instance_lock = asyncio.Lock()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self.browser_manager:
+            await self.browser_manager.__aexit__(exc_type, exc_val, exc_tb)
+            self.browser_manager = None
+        self.health.save()
+        self.health.close()
+
+    async def scrape_tweets(self, query: str, limit: int = 10, verbose: bool = False) -> List[TweetSchema]:
+        """Scrape satu query; membuka browser sendiri jika belum dalam `async with`"""
+        if self.browser_manager is None:
+            async with self:
+                return await self._scrape_query(query, limit, verbose)
+        return await self._scrape_query(query, limit, verbose)
+
+    async def scrape_many(
+        self,
+        queries: Iterable[str],
+        limit: int = 10,
+        verbose: bool = False
+    ) -> Dict[str, List[TweetSchema]]:
+        """Scrape beberapa query secara paralel, hasil dikunci per query"""
+        queries = list(dict.fromkeys(queries))
+        if self.browser_manager is None:
+            async with self:
+                return await self.scrape_many(queries, limit, verbose)
+
+        results = await asyncio.gather(
+            *(self._scrape_query(query, limit, verbose) for query in queries)
+        )
+        return dict(zip(queries, results))
+
+    async def _scrape_query(self, query: str, limit: int, verbose: bool) -> List[TweetSchema]:
+        async with self._semaphore:
+            context = await self.browser_manager.new_context()
+            try:
+                page = await context.new_page()
+                return await self._collect(page, query, limit, verbose)
+            except Exception as e:
+                logger.error(f"Scraping failed for '{query}': {str(e)}")
+                return []
+            finally:
+                await context.close()
+
+    async def _collect(self, page: Page, query: str, limit: int, verbose: bool) -> List[TweetSchema]:
+        """Kumpulkan tweet satu query; jika gagal di tengah jalan, tweet yang sudah terkumpul dikembalikan"""
+        instance = await self._next_instance()
+        current_url = urljoin(instance, f"/search?f=tweets&q={quote_plus(query)}")
+        await self._goto(page, current_url)
+
+        tweets = []
+        seen = TweetIndex()
+        retry_count = 0
+        finished = False
+        while len(tweets) < limit and retry_count < self.max_retries:
+            navigation = None
+            try:
+                await self.pacer.settle_async(page, verbose)
+
+                raw_items, next_url = await self._extract_page(page)
+                if not raw_items:
+                    logger.warning(f"No tweets found for '{query}', rotating instance...")
+                    self.health.record_failure(instance)
+                    self.breakers.record_failure(instance)
+                    retry_count += 1
+                    instance = await self._rotate(page, instance, current_url)
+                    continue
+
+                # Browser memuat halaman berikutnya selagi halaman ini di-parse
+                if next_url and self.prefetch:
+                    navigation = asyncio.ensure_future(self._goto(page, next_url))
+                    await asyncio.sleep(0)
+
+                for parsed in self._parse_items(raw_items):
+                    if len(tweets) >= limit:
+                        break
+                    if not parsed or not TweetScraper._validate_tweet(parsed):
+                        continue
+                    # Halaman yang dibuka ulang setelah rotasi tidak menggandakan tweet
+                    if not seen.add(extract_tweet_id(parsed.link) or parsed.link):
+                        continue
+                    tweets.append(parsed)
+                    if verbose:
+                        logger.info(f"[{query}] Collected {len(tweets)}/{limit} tweets")
+
+                if not next_url:
+                    logger.info(f"[{query}] Reached end of pages")
+                    finished = True
+                    break
+                # Cursor dicatat sebelum navigasi agar rotasi membuka halaman yang benar
+                current_url = next_url
+                if navigation is not None:
+                    await navigation
+                    navigation = None
+                else:
+                    await self._goto(page, next_url)
+                self.breakers.record_success(instance)
+                retry_count = 0
+
+            except Exception as e:
+                logger.error(f"Page error for '{query}': {str(e)}")
+                if navigation is not None:
+                    navigation.cancel()
+                self.health.record_failure(instance)
+                self.breakers.record_failure(instance)
+                retry_count += 1
+                if retry_count >= self.max_retries:
+                    break
+                try:
+                    instance = await self._rotate(page, instance, current_url)
+                except Exception as e:
+                    logger.error(f"Rotation failed for '{query}': {str(e)}")
+                    break
+
+        if len(tweets) < limit and not finished:
+            logger.warning(f"[{query}] Returning {len(tweets)} tweets collected before the failure")
+        return tweets[:limit]
+
+    async def _rotate(self, page: Page, instance: str, current_url: str) -> str:
+        """Pindah ke instance lain dan lanjutkan dari cursor halaman saat ini"""
+        instance = await self._next_instance(exclude=instance)
+        await self._goto(page, urljoin(instance, TweetScraper._cursor_path(current_url)))
+        return instance
+
+    async def _extract_page(self, page: Page) -> Tuple[list, Optional[str]]:
+        """Satu panggilan IPC per halaman: item timeline mentah dan URL cursor berikutnya"""
+        if self.extraction_mode == "dom":
+            return await page.evaluate(EXTRACT_SCRIPT), await page.evaluate(NEXT_URL_SCRIPT)
+        html = await page.content()
+        items, next_href = TweetParser.split_page(html, self.parser_backend)
+        return items, urljoin(page.url, next_href) if next_href else None
+
+    def _parse_items(self, raw_items: list) -> List[Optional[TweetSchema]]:
+        if self.extraction_mode == "dom":
+            return [DOMExtractor.parse_fields(fields) for fields in raw_items]
+        return [SinglePassTweetParser.parse_element(item) for item in raw_items]
+
+    async def _next_instance(self, exclude: Optional[str] = None) -> str:
+        """Ambil instance berikutnya secara round-robin dari instance yang lolos uji"""
+        async with self._instance_lock:
+            if not self._working_instances:
+                await self._probe_instances()
+            for _ in range(len(self._working_instances)):
+                instance = next(self._instance_cycle)
+                # allow() mengambil slot percobaan circuit HALF_OPEN, jadi dipanggil hanya untuk kandidat yang dipakai
+                if len(self._working_instances) > 1 and (instance == exclude or not self.breakers.allow(instance)):
+                    continue
+                logger.info(f"Selected instance: {instance}")
+                return instance
+        raise ConnectionError("No available instances after multiple retries")
+
+    async def _probe_instances(self):
+        """Ambil instance sehat dari registry; hanya yang kadaluarsa di-probe paralel lewat HTTP"""
+        for attempt in range(self.max_retries):
+            await asyncio.to_thread(self._refresh_health, attempt > 0)
+            self._working_instances = self.health.ranked(self.instances)
+            if self._working_instances:
+                self._instance_cycle = itertools.cycle(self._working_instances)
+                return
+            logger.warning("No working instances found, retrying...")
+            await asyncio.sleep(2 ** attempt)
+        raise ConnectionError("No available instances after multiple retries")
+
+    def _refresh_health(self, force: bool):
+        stale = [i for i in self.instances if force or not self.health.is_fresh(i)]
+        self.health.probe(stale)
+
+    async def _goto(self, page: Page, url: str):
+        """Navigasi yang dibatasi rate limit per instance"""
+        await self.pacer.before_request_async(url)
+        await page.goto(url, timeout=self.page_timeout)
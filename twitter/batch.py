@@ -0,0 +1,208 @@
+# twitter/batch.py
+"""Scraping banyak query dari satu proses dengan worker pool terbatas.
+
+Setiap worker memegang satu TweetScraper (browser tetap hangat antar query),
+dan semua worker berbagi registry kesehatan instance, circuit breaker dan
+rate limiter. Format file query, satu query per baris:
+
+    jokowi
+    #pemilu2024 | 500       <- limit khusus untuk query ini
+    # baris yang diawali "# " adalah komentar
+"""
+import hashlib
+import json
+import os
+import queue
+import re
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Optional, Tuple
+from .scraper import TweetScraper
+from .sinks import NDJSONSink
+from .utils.logger import logger
+
+@dataclass
+class BatchQuery:
+    query: str
+    limit: Optional[int] = None
+
+@dataclass
+class QueryResult:
+    query: str
+    limit: int
+    tweets: int
+    seconds: float
+    status: str                 # ok | partial | empty | failed (error; `tweets` = yang tertulis sebelumnya)
+    output: Optional[str] = None
+    error: Optional[str] = None
+
+def load_queries(path: str) -> List[BatchQuery]:
+    queries = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line == "#" or line.startswith("# "):
+                continue
+            query, _, limit = line.partition(" | ")
+            queries.append(BatchQuery(query.strip(), int(limit) if limit.strip() else None))
+    return unique_queries(queries)
+
+def unique_queries(queries: List[BatchQuery]) -> List[BatchQuery]:
+    """Buang query duplikat; kemunculan pertama (dan limit-nya) yang dipakai"""
+    seen = set()
+    unique = []
+    for item in queries:
+        if item.query in seen:
+            logger.warning(f"[batch] Skipping duplicate query '{item.query}'")
+            continue
+        seen.add(item.query)
+        unique.append(item)
+    return unique
+
+def output_name(query: str) -> str:
+    """Nama file aman untuk sebuah query"""
+    slug = re.sub(r"[^\w#@-]+", "_", query).strip("_") or "query"
+    return slug.replace("#", "hashtag_").replace("@", "at_")[:80]
+
+def output_names(queries: List[BatchQuery]) -> Dict[str, str]:
+    """Nama file unik per query; nama yang bentrok diberi hash pendek dari query lengkap"""
+    names: Dict[str, str] = {}
+    used = set()
+    for item in queries:
+        name = output_name(item.query)
+        # Bandingkan tanpa membedakan huruf besar/kecil (filesystem macOS/Windows)
+        if name.lower() in used:
+            name = f"{name}-{hashlib.sha1(item.query.encode('utf-8')).hexdigest()[:8]}"
+        used.add(name.lower())
+        names[item.query] = name
+    return names
+
+class BatchRunner:
+    """Jalankan daftar query di `workers` thread, hasil NDJSON per query"""
+
+    def __init__(
+        self,
+        scraper_factory: Callable[[], TweetScraper],
+        output_dir: str,
+        workers: int = 2,
+        default_limit: int = 20,
+        verbose: bool = False
+    ):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.scraper_factory = scraper_factory
+        self.output_dir = output_dir
+        self.workers = workers
+        self.default_limit = default_limit
+        self.verbose = verbose
+        self._shared: Optional[TweetScraper] = None
+        self._lock = threading.Lock()
+
+    def run(self, queries: List[BatchQuery]) -> Dict:
+        os.makedirs(self.output_dir, exist_ok=True)
+        # Dua worker yang menulis file yang sama akan saling menimpa
+        queries = unique_queries(queries)
+        names = output_names(queries)
+        jobs: "queue.Queue[Tuple[BatchQuery, str]]" = queue.Queue()
+        for item in queries:
+            jobs.put((item, names[item.query]))
+
+        results: List[QueryResult] = []
+        start = time.perf_counter()
+        threads = [
+            threading.Thread(target=self._worker, args=(jobs, results), name=f"batch-{n}", daemon=True)
+            for n in range(min(self.workers, len(queries)))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        order = {item.query: index for index, item in enumerate(queries)}
+        results.sort(key=lambda result: order.get(result.query, 0))
+        summary = self._summarize(results, elapsed)
+        with open(os.path.join(self.output_dir, "summary.json"), "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False)
+        return summary
+
+    def _worker(self, jobs: "queue.Queue[Tuple[BatchQuery, str]]", results: List[QueryResult]):
+        scraper = None
+        try:
+            scraper = self._new_scraper()
+            while True:
+                try:
+                    item, name = jobs.get_nowait()
+                except queue.Empty:
+                    break
+                result = self._scrape(scraper, item, name)
+                with self._lock:
+                    results.append(result)
+        except Exception as e:
+            logger.error(f"Batch worker failed: {str(e)}")
+            # Query yang tersisa dicatat gagal agar ringkasan tetap lengkap
+            while True:
+                try:
+                    item, _ = jobs.get_nowait()
+                except queue.Empty:
+                    break
+                with self._lock:
+                    results.append(QueryResult(
+                        item.query, item.limit or self.default_limit, 0, 0.0, "failed", error=str(e)
+                    ))
+        finally:
+            if scraper is not None:
+                scraper.close()
+
+    def _new_scraper(self) -> TweetScraper:
+        """Scraper per worker yang berbagi state instance dengan worker lain"""
+        scraper = self.scraper_factory()
+        with self._lock:
+            if self._shared is None:
+                self._shared = scraper
+            else:
+                scraper.share_state(self._shared)
+        return scraper
+
+    def _scrape(self, scraper: TweetScraper, item: BatchQuery, name: str) -> QueryResult:
+        limit = item.limit or self.default_limit
+        path = os.path.join(self.output_dir, f"{name}.ndjson")
+        logger.info(f"[batch] Scraping '{item.query}' (limit {limit})")
+        start = time.perf_counter()
+        sink = None
+        error = None
+        try:
+            with NDJSONSink(path, append=False) as sink:
+                pages = scraper.iter_pages(item.query, limit=limit, verbose=self.verbose, raise_errors=True)
+                for page in pages:
+                    sink.write_page(page)
+        except Exception as e:
+            logger.error(f"[batch] '{item.query}' failed: {str(e)}")
+            error = str(e)
+        count = sink.count if sink is not None else 0
+        seconds = time.perf_counter() - start
+
+        if error:
+            status = "failed"
+        elif count >= limit:
+            status = "ok"
+        else:
+            status = "partial" if count else "empty"
+        return QueryResult(item.query, limit, count, round(seconds, 2), status, path, error)
+
+    @staticmethod
+    def _summarize(results: List[QueryResult], elapsed: float) -> Dict:
+        total = sum(result.tweets for result in results)
+        statuses: Dict[str, int] = {}
+        for result in results:
+            statuses[result.status] = statuses.get(result.status, 0) + 1
+        return {
+            "queries": len(results),
+            "tweets": total,
+            "seconds": round(elapsed, 2),
+            "tweets_per_second": round(total / elapsed, 2) if elapsed else None,
+            "statuses": statuses,
+            "failures": [result.query for result in results if result.status in ("failed", "empty")],
+            "results": [asdict(result) for result in results],
+        }
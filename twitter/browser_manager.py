@@ -1,16 +1,83 @@
 # twitter/browser_manager.py
 
 from dataclasses import dataclass, field
-from typing import Optional, List
+from typing import Optional, List, Tuple
+from urllib.parse import urlsplit
 from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright
 from .utils.logger import logger
 
+DEFAULT_CHROMIUM_ARGS = ["--disable-blink-features=AutomationControlled"]
+
+# Fitur Chromium yang tidak dibutuhkan untuk membaca teks DOM
+LEAN_CHROMIUM_ARGS = DEFAULT_CHROMIUM_ARGS + [
+    "--blink-settings=imagesEnabled=false",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-translate",
+    "--disable-features=Translate,MediaRouter,OptimizationHints,AutofillServerCommunication",
+    "--mute-audio",
+    "--no-first-run",
+    "--autoplay-policy=user-gesture-required",
+]
+LEAN_BLOCKED_RESOURCES = ("image", "media", "font")
+
+PAGE_METRICS_SCRIPT = """() => {
+    const nav = performance.getEntriesByType("navigation")[0];
+    const resources = performance.getEntriesByType("resource");
+    return {
+        url: location.href,
+        load_ms: nav ? nav.loadEventEnd - nav.startTime : null,
+        dom_ready_ms: nav ? nav.domContentLoadedEventEnd - nav.startTime : null,
+        document_bytes: nav ? nav.transferSize : 0,
+        resource_bytes: resources.reduce((total, entry) => total + (entry.transferSize || 0), 0),
+        resources: resources.length
+    };
+}"""
+
 @dataclass
 class BrowserConfig:
     user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
     viewport: dict = field(default_factory=lambda: {"width": 1920, "height": 1080})
     locale: str = "en-US"
     args: Optional[List[str]] = None
+    blocked_resources: Tuple[str, ...] = ()   # resource_type Playwright yang di-abort
+    block_third_party: bool = False           # Abort request ke host selain instance Nitter
+
+    @classmethod
+    def lean(cls, **overrides) -> "BrowserConfig":
+        """Profil hemat: tanpa gambar/media/font/pihak ketiga dan viewport kecil"""
+        settings = {
+            "viewport": {"width": 800, "height": 600},
+            "args": list(LEAN_CHROMIUM_ARGS),
+            "blocked_resources": LEAN_BLOCKED_RESOURCES,
+            "block_third_party": True,
+        }
+        settings.update(overrides)
+        return cls(**settings)
+
+    @property
+    def routes_requests(self) -> bool:
+        return bool(self.blocked_resources) or self.block_third_party
+
+    def should_block(self, request) -> bool:
+        """True jika request tidak dibutuhkan untuk membaca timeline"""
+        if request.resource_type in self.blocked_resources:
+            return True
+        if not self.block_third_party or request.resource_type == "document":
+            return False
+        try:
+            page_host = urlsplit(request.frame.url).hostname
+        except Exception:
+            return False
+        return bool(page_host) and urlsplit(request.url).hostname != page_host
+
+def page_metrics(page) -> dict:
+    """Byte yang ditransfer dan waktu muat halaman terakhir (Navigation/Resource Timing)"""
+    return page.evaluate(PAGE_METRICS_SCRIPT)
 
 class BrowserManager:
     def __init__(self, headless: bool = True, config: Optional[BrowserConfig] = None):
@@ -26,14 +93,10 @@ class BrowserManager:
             self.playwright = sync_playwright().start()
             launch_args = {
                 "headless": self.headless,
-                "args": self.config.args or ["--disable-blink-features=AutomationControlled"]
+                "args": self.config.args or DEFAULT_CHROMIUM_ARGS
             }
             self.browser = self.playwright.chromium.launch(**launch_args)
-            self.context = self.browser.new_context(
-                user_agent=self.config.user_agent,
-                viewport=self.config.viewport,
-                locale=self.config.locale
-            )
+            self.context = self.new_context()
             self.page = self.context.new_page()
             logger.debug("Browser initialized successfully")
             return self
@@ -46,6 +109,23 @@ class BrowserManager:
         self._cleanup()
         logger.debug("Browser resources cleaned up")
 
+    def new_context(self):
+        """Context baru dengan user agent, viewport dan locale dari BrowserConfig"""
+        context = self.browser.new_context(
+            user_agent=self.config.user_agent,
+            viewport=self.config.viewport,
+            locale=self.config.locale
+        )
+        if self.config.routes_requests:
+            context.route("**/*", self._route)
+        return context
+
+    def _route(self, route):
+        if self.config.should_block(route.request):
+            route.abort()
+        else:
+            route.continue_()
+
     def _cleanup(self):
         try:
             if self.context:
@@ -55,4 +135,57 @@ class BrowserManager:
             if self.playwright:
                 self.playwright.stop()
         except Exception as e:
-            logger.error(f"Cleanup error: {str(e)}")
\ No newline at end of file
+            logger.error(f"Cleanup error: {str(e)}")
+
+class AsyncBrowserManager:
+    """Satu browser Chromium untuk banyak context/page (playwright.async_api)"""
+
+    def __init__(self, headless: bool = True, config: Optional[BrowserConfig] = None):
+        self.headless = headless
+        self.config = config or BrowserConfig()
+        self.playwright = None
+        self.browser = None
+
+    async def __aenter__(self):
+        try:
+            self.playwright = await async_playwright().start()
+            self.browser = await self.playwright.chromium.launch(
+                headless=self.headless,
+                args=self.config.args or DEFAULT_CHROMIUM_ARGS
+            )
+            logger.debug("Async browser initialized successfully")
+            return self
+        except Exception as e:
+            logger.error(f"Browser initialization failed: {str(e)}")
+            await self._cleanup()
+            raise
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self._cleanup()
+        logger.debug("Async browser resources cleaned up")
+
+    async def new_context(self):
+        """Context baru dengan konfigurasi yang sama seperti BrowserManager"""
+        context = await self.browser.new_context(
+            user_agent=self.config.user_agent,
+            viewport=self.config.viewport,
+            locale=self.config.locale
+        )
+        if self.config.routes_requests:
+            await context.route("**/*", self._route)
+        return context
+
+    async def _route(self, route):
+        if self.config.should_block(route.request):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _cleanup(self):
+        try:
+            if self.browser:
+                await self.browser.close()
+            if self.playwright:
+                await self.playwright.stop()
+        except Exception as e:
+            logger.error(f"Cleanup error: {str(e)}")
@@ -0,0 +1,137 @@
+# twitter/browser_pool.py
+
+import atexit
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, List, Optional
+from .browser_manager import BrowserManager, BrowserConfig
+from .utils.logger import logger
+
+@dataclass
+class PoolConfig:
+    size: int = 1                      # Jumlah context hangat yang disimpan
+    max_pages_per_context: int = 200   # Recycle context setelah N halaman dimuat
+    max_heap_mb: float = 512.0         # Recycle context jika JS heap melebihi batas ini
+
+class PooledPage:
+    """Satu context + page yang dipinjamkan oleh BrowserPool"""
+
+    def __init__(self, context):
+        self.context = context
+        self.page = context.new_page()
+        self.pages_served = 0
+        self.page.on("load", self._on_load)
+
+    def _on_load(self, _):
+        self.pages_served += 1
+
+    def heap_mb(self) -> float:
+        """Ukuran JS heap yang dipakai page (hanya tersedia di Chromium)"""
+        used = self.page.evaluate(
+            "() => performance.memory ? performance.memory.usedJSHeapSize : 0"
+        )
+        return used / 1024 / 1024
+
+    def is_healthy(self) -> bool:
+        try:
+            return not self.page.is_closed() and self.page.evaluate("1 + 1") == 2
+        except Exception as e:
+            logger.warning(f"Pooled page health check failed: {str(e)[:80]}")
+            return False
+
+    def close(self):
+        try:
+            self.context.close()
+        except Exception as e:
+            logger.debug(f"Context close error: {str(e)}")
+
+class BrowserPool:
+    """Browser Chromium yang hidup lama dengan context/page hangat.
+
+    Dipakai oleh TweetScraper agar setiap query tidak perlu menjalankan
+    Playwright dan meluncurkan Chromium dari awal. Page di-recycle setelah
+    `max_pages_per_context` halaman atau saat heap-nya terlalu besar.
+    """
+
+    def __init__(
+        self,
+        headless: bool = True,
+        config: Optional[BrowserConfig] = None,
+        pool_config: Optional[PoolConfig] = None
+    ):
+        self.headless = headless
+        self.config = config or BrowserConfig()
+        self.pool_config = pool_config or PoolConfig()
+        self.manager: Optional[BrowserManager] = None
+        self._idle: List[PooledPage] = []
+        self._atexit_registered = False
+
+    def start(self):
+        if self.manager is not None:
+            return
+        self.manager = BrowserManager(headless=self.headless, config=self.config).__enter__()
+        # Context pertama dari BrowserManager menjadi slot pertama pool
+        first = self.manager.context
+        self.manager.context = None
+        self.manager.page.close()
+        self._idle = [PooledPage(first)]
+        while len(self._idle) < self.pool_config.size:
+            self._idle.append(PooledPage(self.manager.new_context()))
+        if not self._atexit_registered:
+            atexit.register(self.close)
+            self._atexit_registered = True
+        logger.debug(f"Browser pool started with {len(self._idle)} warm page(s)")
+
+    def close(self):
+        for slot in self._idle:
+            slot.close()
+        self._idle = []
+        if self.manager is not None:
+            self.manager.__exit__(None, None, None)
+            self.manager = None
+
+    def acquire(self) -> PooledPage:
+        """Pinjam page sehat; browser dijalankan ulang jika sudah mati"""
+        if self.manager is not None and not self.manager.browser.is_connected():
+            logger.warning("Pooled browser disconnected, restarting...")
+            self._idle = []
+            self.manager._cleanup()
+            self.manager = None
+        self.start()
+
+        while self._idle:
+            slot = self._idle.pop()
+            if slot.is_healthy():
+                return slot
+            slot.close()
+        return PooledPage(self.manager.new_context())
+
+    def release(self, slot: PooledPage):
+        """Kembalikan page ke pool, atau recycle jika sudah usang"""
+        if self.manager is None:
+            slot.close()
+            return
+        if self._should_recycle(slot):
+            logger.debug(f"Recycling pooled context after {slot.pages_served} pages")
+            slot.close()
+            slot = PooledPage(self.manager.new_context())
+        if len(self._idle) < self.pool_config.size:
+            self._idle.append(slot)
+        else:
+            slot.close()
+
+    @contextmanager
+    def lease(self) -> Iterator[PooledPage]:
+        slot = self.acquire()
+        try:
+            yield slot
+        finally:
+            self.release(slot)
+
+    def _should_recycle(self, slot: PooledPage) -> bool:
+        if slot.pages_served >= self.pool_config.max_pages_per_context:
+            return True
+        try:
+            return slot.heap_mb() > self.pool_config.max_heap_mb
+        except Exception:
+            return True
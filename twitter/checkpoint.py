@@ -0,0 +1,103 @@
+# twitter/checkpoint.py
+"""Checkpoint SQLite untuk scrape panjang yang bisa dilanjutkan.
+
+Setiap halaman yang selesai diproses menyimpan cursor halaman berikutnya
+dan tweet yang terkumpul, sehingga scrape yang gagal di tengah jalan bisa
+dilanjutkan dari halaman terakhir, bukan dari halaman pertama:
+
+    scraper = TweetScraper(checkpoint_path="scrape.db", resume=True)
+"""
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional, Set
+from .models.schemas import TweetSchema
+from .utils.helpers import extract_tweet_id
+from .utils.serialization import dumps, tweet_from_json
+
+DEFAULT_CHECKPOINT_PATH = "scraper_checkpoint.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scrapes (
+    query TEXT PRIMARY KEY,
+    cursor TEXT,
+    started_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tweets (
+    query TEXT NOT NULL,
+    tweet_id TEXT NOT NULL,
+    record TEXT NOT NULL,
+    PRIMARY KEY (query, tweet_id)
+);
+"""
+
+@dataclass
+class Checkpoint:
+    query: str
+    cursor: Optional[str]          # URL relatif halaman berikutnya; None = halaman habis
+    tweets: List[TweetSchema] = field(default_factory=list)
+    updated_at: float = 0.0
+
+    @property
+    def seen_ids(self) -> Set[str]:
+        return {extract_tweet_id(tweet.link) for tweet in self.tweets}
+
+class CheckpointStore:
+    """Simpan query, cursor dan tweet terkumpul ke SQLite setelah tiap halaman"""
+
+    def __init__(self, path: str = DEFAULT_CHECKPOINT_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def load(self, query: str) -> Optional[Checkpoint]:
+        row = self.conn.execute(
+            "SELECT cursor, updated_at FROM scrapes WHERE query = ?", (query,)
+        ).fetchone()
+        if row is None:
+            return None
+        records = self.conn.execute(
+            "SELECT record FROM tweets WHERE query = ? ORDER BY rowid", (query,)
+        ).fetchall()
+        tweets = [tweet_from_json(record) for (record,) in records]
+        return Checkpoint(query=query, cursor=row[0], tweets=tweets, updated_at=row[1])
+
+    def start(self, query: str, cursor: str):
+        """Mulai checkpoint baru untuk query, menghapus progres sebelumnya"""
+        now = time.time()
+        with self.conn:
+            self.conn.execute("DELETE FROM tweets WHERE query = ?", (query,))
+            self.conn.execute(
+                "INSERT OR REPLACE INTO scrapes (query, cursor, started_at, updated_at) VALUES (?, ?, ?, ?)",
+                (query, cursor, now, now)
+            )
+
+    def save_page(self, query: str, cursor: Optional[str], tweets: List[TweetSchema]):
+        """Simpan tweet satu halaman dan cursor berikutnya dalam satu transaksi"""
+        rows = [
+            (query, extract_tweet_id(tweet.link) or tweet.link, dumps(tweet))
+            for tweet in tweets
+        ]
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO tweets (query, tweet_id, record) VALUES (?, ?, ?)", rows
+            )
+            self.conn.execute(
+                "UPDATE scrapes SET cursor = ?, updated_at = ? WHERE query = ?",
+                (cursor, time.time(), query)
+            )
+
+    def clear(self, query: str):
+        with self.conn:
+            self.conn.execute("DELETE FROM tweets WHERE query = ?", (query,))
+            self.conn.execute("DELETE FROM scrapes WHERE query = ?", (query,))
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
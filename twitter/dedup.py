@@ -0,0 +1,86 @@
+# twitter/dedup.py
+"""Index ID tweet untuk membuang duplikat sebelum elemen di-parse.
+
+`TweetIndex` menyimpan ID secara eksak. Untuk run yang sangat besar,
+`BloomTweetIndex` memakai memori tetap dengan peluang false positive
+`error_rate` (tweet baru yang sesekali dianggap sudah pernah dilihat).
+"""
+import hashlib
+import math
+from typing import Iterable, Optional, Set, Union
+
+DEDUP_MODES = ("exact", "bloom")
+
+class TweetIndex:
+    """Set ID tweet eksak"""
+
+    def __init__(self, ids: Iterable[str] = ()):
+        self._ids: Set[str] = set(ids)
+
+    def add(self, tweet_id: str) -> bool:
+        """Tambahkan ID; False jika ID sudah ada"""
+        if tweet_id in self._ids:
+            return False
+        self._ids.add(tweet_id)
+        return True
+
+    def __contains__(self, tweet_id: str) -> bool:
+        return tweet_id in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+class BloomTweetIndex:
+    """Bloom filter dengan ukuran bit array tetap untuk `capacity` ID"""
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be positive and error_rate between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._count = 0
+
+    def _positions(self, tweet_id: str):
+        # Double hashing: k posisi dari dua hash 64-bit
+        digest = hashlib.blake2b(tweet_id.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, tweet_id: str) -> bool:
+        """Tambahkan ID; False jika ID (mungkin) sudah ada"""
+        new = False
+        for position in self._positions(tweet_id):
+            byte, bit = divmod(position, 8)
+            if not self._bits[byte] & (1 << bit):
+                self._bits[byte] |= 1 << bit
+                new = True
+        if new:
+            self._count += 1
+        return new
+
+    def __contains__(self, tweet_id: str) -> bool:
+        return all(
+            self._bits[position // 8] & (1 << (position % 8))
+            for position in self._positions(tweet_id)
+        )
+
+    def __len__(self) -> int:
+        """Perkiraan jumlah ID unik yang sudah ditambahkan"""
+        return self._count
+
+    @property
+    def memory_bytes(self) -> int:
+        return len(self._bits)
+
+DedupIndex = Union[TweetIndex, BloomTweetIndex]
+
+def make_index(mode: str = "exact", capacity: Optional[int] = None, error_rate: float = 0.001) -> DedupIndex:
+    if mode == "exact":
+        return TweetIndex()
+    if mode == "bloom":
+        return BloomTweetIndex(capacity or 1_000_000, error_rate)
+    raise ValueError(f"Unknown dedup mode: {mode}")
@@ -0,0 +1,179 @@
+# twitter/http_fetcher.py
+
+import gzip
+import http.client
+import re
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+from .browser_manager import BrowserConfig
+from .utils.logger import logger
+
+# Penanda halaman anti-bot yang hanya bisa dilewati oleh browser sungguhan.
+# Frasa hanya dicocokkan dengan <title>, penanda struktur dengan atribut
+# id/class/src, agar teks tweet yang mengutipnya tidak ikut terdeteksi.
+CHALLENGE_TITLES = (
+    "Just a moment",
+    "Checking your browser",
+    "Making sure you",
+    "Attention Required",
+)
+CHALLENGE_MARKERS = (
+    "cf-challenge",
+    "challenge-form",
+    "challenge-platform",
+    "anubis_challenge",
+    "/.within.website/",
+)
+CHALLENGE_STATUSES = (403, 429)
+TITLE_PATTERN = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+ATTRIBUTE_PATTERN = re.compile(r"""\b(?:id|class|src|action)\s*=\s*["']([^"']*)["']""", re.IGNORECASE)
+TIMELINE_PATTERN = re.compile(r"""class\s*=\s*["'](?:[^"']*\s)?timeline(?:-item)?[\s"']""")
+
+@dataclass
+class FetchResult:
+    url: str
+    status: int
+    html: str
+    elapsed: float
+
+def is_challenge_page(result: FetchResult) -> bool:
+    """True jika response berupa challenge/blokir, bukan halaman Nitter biasa"""
+    if result.status in CHALLENGE_STATUSES:
+        return True
+    head = result.html[:20000]
+    if result.status == 200 and TIMELINE_PATTERN.search(head):
+        # Timeline Nitter yang dirender (walau tweet mengutip frasa challenge)
+        return False
+    title = TITLE_PATTERN.search(head)
+    if title and any(marker in title.group(1) for marker in CHALLENGE_TITLES):
+        return True
+    return any(
+        marker in value
+        for value in ATTRIBUTE_PATTERN.findall(head)
+        for marker in CHALLENGE_MARKERS
+    )
+
+class HttpFetcher:
+    """Client HTTP ringan dengan koneksi keep-alive per host.
+
+    Menggantikan Chromium untuk halaman Nitter yang dirender di server;
+    koneksi yang selesai dipakai dikembalikan ke pool dan dipakai ulang.
+    """
+
+    def __init__(
+        self,
+        user_agent: Optional[str] = None,
+        timeout: float = 20.0,
+        max_idle_per_host: int = 4,
+        max_redirects: int = 3
+    ):
+        self.user_agent = user_agent or BrowserConfig().user_agent
+        self.timeout = timeout
+        self.max_idle_per_host = max_idle_per_host
+        self.max_redirects = max_redirects
+        self._idle: Dict[Tuple[str, str, int], List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> FetchResult:
+        start = time.perf_counter()
+        for _ in range(self.max_redirects + 1):
+            status, headers, body = self._request(url)
+            location = headers.get("location")
+            if status in (301, 302, 303, 307, 308) and location:
+                url = urljoin(url, location)
+                continue
+            html = self._decode(headers, body)
+            return FetchResult(url=url, status=status, html=html, elapsed=time.perf_counter() - start)
+        raise ConnectionError(f"Too many redirects for {url}")
+
+    def close(self):
+        with self._lock:
+            for connections in self._idle.values():
+                for conn in connections:
+                    conn.close()
+            self._idle.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _request(self, url: str):
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == "https" else 80))
+        path = parts.path or "/"
+        if parts.query:
+            path += f"?{parts.query}"
+        headers = {
+            "User-Agent": self.user_agent,
+            "Accept": "text/html,application/xhtml+xml",
+            "Accept-Language": "en-US,en;q=0.9",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+        }
+
+        conn, reused = self._acquire(key)
+        try:
+            conn.request("GET", path, headers=headers)
+            response = conn.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            conn.close()
+            if not reused:
+                raise
+            # Koneksi keep-alive lama sudah ditutup server; coba sekali dengan koneksi baru
+            conn = self._new_connection(key)
+            conn.request("GET", path, headers=headers)
+            response = conn.getresponse()
+        except Exception:
+            conn.close()
+            raise
+
+        body = response.read()
+        response_headers = {k.lower(): v for k, v in response.getheaders()}
+        if response.will_close:
+            conn.close()
+        else:
+            self._release(key, conn)
+        return response.status, response_headers, body
+
+    def _acquire(self, key):
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        return self._new_connection(key), False
+
+    def _new_connection(self, key):
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout)
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def _release(self, key, conn):
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(conn)
+                return
+        conn.close()
+
+    @staticmethod
+    def _decode(headers: Dict[str, str], body: bytes) -> str:
+        encoding = headers.get("content-encoding", "")
+        try:
+            if encoding == "gzip":
+                body = gzip.decompress(body)
+            elif encoding == "deflate":
+                body = zlib.decompress(body)
+        except (OSError, zlib.error) as e:
+            logger.warning(f"Failed to decompress response: {str(e)}")
+        charset = "utf-8"
+        content_type = headers.get("content-type", "")
+        if "charset=" in content_type:
+            charset = content_type.split("charset=")[-1].split(";")[0].strip()
+        return body.decode(charset, errors="replace")
@@ -0,0 +1,170 @@
+# twitter/instance_health.py
+"""Registry kesehatan instance Nitter yang disimpan antar run.
+
+Setiap instance punya EWMA latency dan skor kegagalan. Hasil probe berlaku
+selama `ttl` detik sehingga pemilihan instance berikutnya tidak perlu
+menguji ulang; instance yang kadaluarsa diuji secara paralel lewat HTTP.
+"""
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Dict, Iterable, List, Optional
+from .http_fetcher import HttpFetcher, is_challenge_page
+from .parsers.tweet_parser import TweetParser
+from .utils.logger import logger
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")),
+    "nitter-scraper"
+)
+DEFAULT_HEALTH_PATH = os.path.join(DEFAULT_CACHE_DIR, "instance_health.json")
+MAX_ENTRY_AGE = 7 * 24 * 3600   # Entry yang tidak diuji seminggu dibuang saat disimpan
+
+@dataclass
+class InstanceHealth:
+    url: str
+    latency: Optional[float] = None   # EWMA latency dalam detik
+    failures: float = 0.0             # Naik 1 per kegagalan, meluruh setengah per sukses
+    ok: bool = False
+    challenged: bool = False          # Instance hidup tapi menampilkan challenge anti-bot
+    checked_at: float = 0.0
+
+    def score(self) -> float:
+        """Semakin kecil semakin baik"""
+        return (self.latency or 1.0) * (1 + self.failures)
+
+class InstanceHealthRegistry:
+    """Pilih instance terbaik dari cache, probe paralel jika cache kadaluarsa"""
+
+    def __init__(
+        self,
+        path: Optional[str] = DEFAULT_HEALTH_PATH,
+        ttl: float = 600.0,
+        alpha: float = 0.3,
+        probe_timeout: float = 10.0,
+        max_workers: int = 8,
+        fetcher: Optional[HttpFetcher] = None
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.alpha = alpha
+        self.max_workers = max_workers
+        self.fetcher = fetcher or HttpFetcher(timeout=probe_timeout)
+        self._entries: Dict[str, InstanceHealth] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            self._entries = {url: InstanceHealth(**entry) for url, entry in data.items()}
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable instance health cache: {str(e)}")
+            self._entries = {}
+
+    def save(self):
+        if not self.path:
+            return
+        now = time.time()
+        with self._lock:
+            data = {
+                url: asdict(entry) for url, entry in self._entries.items()
+                if now - entry.checked_at < MAX_ENTRY_AGE
+            }
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to save instance health cache: {str(e)}")
+
+    def get(self, instance: str) -> InstanceHealth:
+        with self._lock:
+            return self._entries.setdefault(instance, InstanceHealth(url=instance))
+
+    def record_success(self, instance: str, latency: float, challenged: bool = False):
+        entry = self.get(instance)
+        with self._lock:
+            if entry.latency is None:
+                entry.latency = latency
+            else:
+                entry.latency = self.alpha * latency + (1 - self.alpha) * entry.latency
+            entry.failures /= 2
+            entry.ok = True
+            entry.challenged = challenged
+            entry.checked_at = time.time()
+
+    def record_failure(self, instance: str, probe: bool = False):
+        """Gagal saat scraping hanya menurunkan peringkat; probe gagal menandai mati sampai TTL habis"""
+        entry = self.get(instance)
+        with self._lock:
+            entry.failures += 1
+            if probe:
+                entry.ok = False
+                entry.checked_at = time.time()
+
+    def is_fresh(self, instance: str) -> bool:
+        return time.time() - self.get(instance).checked_at < self.ttl
+
+    def ranked(self, instances: Iterable[str], allow_challenge: bool = True) -> List[str]:
+        """Instance sehat yang hasil probe-nya masih berlaku, terbaik lebih dulu"""
+        healthy = [
+            self.get(instance) for instance in instances
+            if self.is_fresh(instance) and self.get(instance).ok
+            and (allow_challenge or not self.get(instance).challenged)
+        ]
+        return [entry.url for entry in sorted(healthy, key=InstanceHealth.score)]
+
+    def best(
+        self,
+        instances: Iterable[str],
+        exclude: Iterable[str] = (),
+        allow_challenge: bool = True
+    ) -> Optional[str]:
+        """Instance terbaik; hanya instance yang kadaluarsa yang di-probe ulang"""
+        candidates = [instance for instance in instances if instance not in set(exclude)]
+        stale = [instance for instance in candidates if not self.is_fresh(instance)]
+        if stale:
+            self.probe(stale)
+        ranked = self.ranked(candidates, allow_challenge)
+        return ranked[0] if ranked else None
+
+    def probe(self, instances: List[str]) -> Dict[str, bool]:
+        """Uji semua instance sekaligus dan simpan hasilnya"""
+        if not instances:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(len(instances), self.max_workers)) as pool:
+            results = dict(zip(instances, pool.map(self._probe_one, instances)))
+        self.save()
+        return results
+
+    def close(self):
+        self.fetcher.close()
+
+    def _probe_one(self, instance: str) -> bool:
+        logger.info(f"Testing instance: {instance}")
+        try:
+            result = self.fetcher.get(f"{instance}/search?q=test")
+        except Exception as e:
+            logger.warning(f"Instance test failed: {str(e)[:80]}...")
+            self.record_failure(instance, probe=True)
+            return False
+
+        if is_challenge_page(result):
+            # Browser masih bisa melewati challenge; HTTP fast path tidak
+            self.record_success(instance, result.elapsed, challenged=True)
+            return True
+        if result.status == 200 and len(TweetParser.split_timeline(result.html)) > 2:
+            self.record_success(instance, result.elapsed)
+            return True
+        logger.warning(f"Instance test failed: HTTP {result.status} from {instance}")
+        self.record_failure(instance, probe=True)
+        return False
@@ -1,36 +1,84 @@
 # twitter/instance_manager.py
 
-import random
 from time import sleep
 from typing import List, Optional
 from .settings import NIITTER_INSTANCES
+from .instance_health import InstanceHealthRegistry
+from .resilience import CircuitBreakerBoard
 from .utils.logger import logger
 
 class InstanceManager:
-    def __init__(self, page, instances: Optional[List[str]] = None):
+    def __init__(
+        self,
+        page,
+        instances: Optional[List[str]] = None,
+        fetcher=None,
+        registry: Optional[InstanceHealthRegistry] = None,
+        breakers: Optional[CircuitBreakerBoard] = None
+    ):
+        """`page` boleh None jika instance dipakai lewat HttpFetcher.
+
+        Instance dipilih dari `registry`; challenge anti-bot hanya diterima
+        jika ada page browser yang bisa melewatinya.
+        """
         self.page = page
+        self.fetcher = fetcher
         self.instances = instances or NIITTER_INSTANCES
+        self.registry = registry or InstanceHealthRegistry(fetcher=fetcher)
+        self.breakers = breakers or CircuitBreakerBoard()
         self.current_instance = None
         self.max_retries = 3
 
-    def _test_instance(self, instance: str) -> bool:
-        try:
-            logger.info(f"Testing instance: {instance}")
-            self.page.goto(f"{instance}/search?q=test", timeout=30000)
-            sleep(random.uniform(1, 3))
-            return self.page.locator("div.timeline-item").count() > 2
-        except Exception as e:
-            logger.warning(f"Instance test failed: {str(e)[:80]}...")
-            return False
-
-    def get_working_instance(self) -> str:
-        for _ in range(self.max_retries):
-            for instance in random.sample(self.instances, len(self.instances)):
-                if self._test_instance(instance):
-                    self.current_instance = instance
-                    logger.info(f"Selected instance: {instance}")
-                    return instance
+    def get_working_instance(self, exclude: Optional[List[str]] = None) -> str:
+        exclude = exclude or []
+        for attempt in range(self.max_retries):
+            instance = self._select(exclude)
+            if instance:
+                self.current_instance = instance
+                logger.info(f"Selected instance: {instance}")
+                return instance
             logger.warning("No working instances found, retrying...")
-            sleep(7)
-        
-        raise ConnectionError("No available instances after multiple retries")
\ No newline at end of file
+            if attempt + 1 < self.max_retries:
+                sleep(2 ** attempt)
+                # Hasil gagal yang masih berlaku juga diuji ulang
+                self.registry.probe([i for i in self.instances if i not in exclude])
+
+        raise ConnectionError("No available instances after multiple retries")
+
+    def _select(self, exclude: List[str]) -> Optional[str]:
+        """Instance terbaik yang circuit-nya tidak terbuka.
+
+        `blocked` hanya membaca state; slot percobaan circuit HALF_OPEN
+        diambil (allow) untuk instance yang terpilih saja.
+        """
+        exclude = exclude + self.breakers.blocked(self.instances)
+        while True:
+            instance = self.registry.best(self.instances, exclude, self.page is not None)
+            if instance is None or self.breakers.allow(instance):
+                return instance
+            exclude.append(instance)
+
+    def mark_failed(self, instance: Optional[str] = None):
+        """Catat kegagalan instance agar turun peringkat sampai TTL habis"""
+        instance = instance or self.current_instance
+        if instance:
+            self.breakers.record_failure(instance)
+            self.registry.record_failure(instance)
+            self.registry.save()
+
+    def mark_ok(self, instance: Optional[str] = None):
+        instance = instance or self.current_instance
+        if instance:
+            self.breakers.record_success(instance)
+
+    def rotate(self) -> str:
+        """Tandai instance saat ini gagal lalu pilih instance lain jika ada"""
+        failed = self.current_instance
+        self.mark_failed(failed)
+        if failed:
+            instance = self._select([failed])
+            if instance:
+                self.current_instance = instance
+                logger.info(f"Selected instance: {instance}")
+                return instance
+        return self.get_working_instance()
@@ -1 +1,5 @@
-# twitter/models/__init__.py
\ No newline at end of file
+# twitter/models/__init__.py
+from .schemas import TweetSchema, UserSchema, TweetStats, MediaSchema, EMPTY_MEDIA
+from .table import TweetTable
+
+__all__ = ['TweetSchema', 'UserSchema', 'TweetStats', 'MediaSchema', 'EMPTY_MEDIA', 'TweetTable']
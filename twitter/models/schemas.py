@@ -1,27 +1,55 @@
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
-@dataclass
+# Username, hashtag dan mention berulang di ribuan tweet: satu objek str per nilai
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if type(value) is str else value
+
+def _intern_all(values: List[str]) -> List[str]:
+    return [_intern(value) for value in values] if values else values
+
+@dataclass(slots=True)
 class UserSchema:
     username: str
     fullname: str
     verified: bool = field(default=False)
 
-@dataclass
+    def __post_init__(self):
+        self.username = _intern(self.username)
+        self.fullname = _intern(self.fullname)
+
+@dataclass(frozen=True, slots=True)
 class MediaSchema:
-    images: List[str] = field(default_factory=list)
-    videos: List[str] = field(default_factory=list)
-    gifs: List[str] = field(default_factory=list)
+    """Immutable agar satu instance (EMPTY_MEDIA) bisa dipakai bersama oleh semua tweet tanpa media"""
+    images: Tuple[str, ...] = ()
+    videos: Tuple[str, ...] = ()
+    gifs: Tuple[str, ...] = ()
+
+    def __post_init__(self):
+        for name in ("images", "videos", "gifs"):
+            value = getattr(self, name)
+            if type(value) is not tuple:
+                object.__setattr__(self, name, tuple(value))
 
-@dataclass
+    @staticmethod
+    def of(images: Sequence[str] = (), videos: Sequence[str] = (), gifs: Sequence[str] = ()) -> "MediaSchema":
+        """MediaSchema baru, atau EMPTY_MEDIA jika tweet tidak punya media"""
+        if not images and not videos and not gifs:
+            return EMPTY_MEDIA
+        return MediaSchema(images, videos, gifs)
+
+EMPTY_MEDIA = MediaSchema()
+
+@dataclass(slots=True)
 class TweetStats:
     comments: int = 0
     retweets: int = 0
     quotes: int = 0
     likes: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class TweetSchema:
     user: UserSchema
     content: str
@@ -33,4 +61,10 @@ class TweetSchema:
     media: MediaSchema
     link: str
     is_retweet: bool = False
-    retweeter: Optional[str] = None
\ No newline at end of file
+    retweeter: Optional[str] = None
+
+    def __post_init__(self):
+        self.hashtags = _intern_all(self.hashtags)
+        self.mentions = _intern_all(self.mentions)
+        self.replying_to = _intern_all(self.replying_to)
+        self.retweeter = _intern(self.retweeter)
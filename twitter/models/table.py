@@ -0,0 +1,139 @@
+# twitter/models/table.py
+"""Kontainer kolumnar untuk hasil scraping yang sangat besar.
+
+Alih-alih satu objek TweetSchema (plus UserSchema, TweetStats, list) per
+tweet, `TweetTable` menyimpan setiap field sebagai kolom: angka di
+`array`, flag di `bytearray`, pengguna unik sekali di tabel pengguna, dan
+list kosong/media kosong sebagai satu objek bersama. Akses baris tetap
+mengembalikan TweetSchema:
+
+    table = TweetTable.from_tweets(scraper.iter_tweets("jokowi", limit=1_000_000))
+    table[0].user.username, len(table), table.column("likes")
+"""
+import math
+import sys
+from array import array
+from collections.abc import Sequence
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from .schemas import MediaSchema, TweetSchema, TweetStats, UserSchema
+
+_STAT_COLUMNS = ("comments", "retweets", "quotes", "likes")
+_EMPTY: Tuple[str, ...] = ()
+
+def _strings(values: List[str]) -> Tuple[str, ...]:
+    return tuple(sys.intern(value) for value in values) if values else _EMPTY
+
+class TweetTable(Sequence):
+    """Sequence TweetSchema yang disimpan per kolom.
+
+    Timestamp disimpan sebagai epoch UTC (float); datetime naive dianggap UTC.
+    """
+
+    def __init__(self):
+        self._user_ids: Dict[Tuple[str, str, bool], int] = {}
+        self._users: List[Tuple[str, str, bool]] = []
+        self._user_index = array("I")
+        self._content: List[str] = []
+        self._hashtags: List[Tuple[str, ...]] = []
+        self._mentions: List[Tuple[str, ...]] = []
+        self._replying_to: List[Tuple[str, ...]] = []
+        self._timestamps = array("d")
+        self._stats = {name: array("q") for name in _STAT_COLUMNS}
+        self._media: List[MediaSchema] = []
+        self._links: List[str] = []
+        self._is_retweet = bytearray()
+        self._retweeters: List[Optional[str]] = []
+
+    @classmethod
+    def from_tweets(cls, tweets: Iterable[TweetSchema]) -> "TweetTable":
+        table = cls()
+        table.extend(tweets)
+        return table
+
+    def append(self, tweet: TweetSchema):
+        user = tweet.user
+        key = (user.username, user.fullname, bool(user.verified))
+        user_id = self._user_ids.get(key)
+        if user_id is None:
+            user_id = self._user_ids[key] = len(self._users)
+            self._users.append(key)
+        self._user_index.append(user_id)
+        self._content.append(tweet.content)
+        self._hashtags.append(_strings(tweet.hashtags))
+        self._mentions.append(_strings(tweet.mentions))
+        self._replying_to.append(_strings(tweet.replying_to))
+        self._timestamps.append(self._epoch(tweet.timestamp))
+        for name in _STAT_COLUMNS:
+            self._stats[name].append(getattr(tweet.stats, name))
+        self._media.append(MediaSchema.of(tweet.media.images, tweet.media.videos, tweet.media.gifs))
+        self._links.append(tweet.link)
+        self._is_retweet.append(1 if tweet.is_retweet else 0)
+        self._retweeters.append(sys.intern(tweet.retweeter) if tweet.retweeter else None)
+
+    def extend(self, tweets: Iterable[TweetSchema]):
+        for tweet in tweets:
+            self.append(tweet)
+
+    def __len__(self) -> int:
+        return len(self._links)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[TweetSchema, List[TweetSchema]]:
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("TweetTable index out of range")
+        return self._row(index)
+
+    def column(self, name: str) -> Sequence:
+        """Satu kolom tanpa membangun TweetSchema, misalnya "likes" atau "username" """
+        if name in self._stats:
+            return self._stats[name]
+        if name in ("username", "fullname", "verified"):
+            position = ("username", "fullname", "verified").index(name)
+            return [self._users[i][position] for i in self._user_index]
+        if name == "timestamp":
+            return [self._datetime(value) for value in self._timestamps]
+        columns = {
+            "content": self._content,
+            "hashtags": self._hashtags,
+            "mentions": self._mentions,
+            "replying_to": self._replying_to,
+            "media": self._media,
+            "link": self._links,
+            "is_retweet": [bool(flag) for flag in self._is_retweet],
+            "retweeter": self._retweeters,
+        }
+        if name not in columns:
+            raise KeyError(f"Unknown column: {name}")
+        return columns[name]
+
+    def _row(self, i: int) -> TweetSchema:
+        username, fullname, verified = self._users[self._user_index[i]]
+        return TweetSchema(
+            user=UserSchema(username, fullname, verified),
+            content=self._content[i],
+            hashtags=list(self._hashtags[i]),
+            mentions=list(self._mentions[i]),
+            replying_to=list(self._replying_to[i]),
+            timestamp=self._datetime(self._timestamps[i]),
+            stats=TweetStats(*(self._stats[name][i] for name in _STAT_COLUMNS)),
+            media=self._media[i],
+            link=self._links[i],
+            is_retweet=bool(self._is_retweet[i]),
+            retweeter=self._retweeters[i]
+        )
+
+    @staticmethod
+    def _epoch(timestamp: Optional[datetime]) -> float:
+        if timestamp is None:
+            return math.nan
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        return timestamp.timestamp()
+
+    @staticmethod
+    def _datetime(value: float) -> Optional[datetime]:
+        return None if math.isnan(value) else datetime.fromtimestamp(value, timezone.utc)
@@ -0,0 +1,152 @@
+# twitter/pacing.py
+"""Pengaturan tempo scraping: rate limit per instance dan tunggu berbasis DOM.
+
+Kesopanan terhadap instance dijaga oleh token bucket per instance, bukan
+oleh sleep acak. Setelah navigasi, scraper menunggu timeline benar-benar
+ada di DOM; simulasi scroll hanya dijalankan jika profil memintanya.
+
+    pacer = Pacer("fast", overrides={"https://nitter.net": "polite"})
+"""
+import asyncio
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple, Union
+from urllib.parse import urlsplit
+from .utils.logger import logger
+
+# Salah satu elemen ini muncul setelah halaman pencarian Nitter selesai dirender
+READY_SELECTOR = "div.timeline-item, .timeline-none, div.show-more, .timeline-end"
+
+@dataclass(frozen=True)
+class PacingProfile:
+    name: str
+    rate: float                                  # Request per detik per instance
+    burst: int = 1                               # Request beruntun yang boleh tanpa menunggu
+    simulate_scroll: bool = True
+    scrolls: Tuple[int, int] = (1, 3)            # Jumlah scroll acak per halaman
+    scroll_pause: Tuple[float, float] = (0.2, 0.6)
+    ready_timeout: int = 10000                   # ms menunggu READY_SELECTOR
+
+PACING_PROFILES: Dict[str, PacingProfile] = {
+    "human": PacingProfile("human", rate=0.1, simulate_scroll=True, scrolls=(3, 6), scroll_pause=(1.0, 3.5)),
+    "polite": PacingProfile("polite", rate=0.5, burst=2),
+    "fast": PacingProfile("fast", rate=2.0, burst=4, simulate_scroll=False),
+}
+DEFAULT_PACING = "polite"
+
+ProfileSpec = Union[str, PacingProfile]
+
+def resolve_profile(profile: ProfileSpec) -> PacingProfile:
+    if isinstance(profile, PacingProfile):
+        return profile
+    if profile not in PACING_PROFILES:
+        raise ValueError(f"Unknown pacing profile: {profile}")
+    return PACING_PROFILES[profile]
+
+def instance_key(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+class TokenBucket:
+    """Token bucket dengan reservasi: token boleh minus, pemanggil menunggu gilirannya"""
+
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Ambil satu token; return berapa detik pemanggil harus menunggu"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return max(0.0, -self.tokens / self.rate)
+
+class Pacer:
+    """Rate limiter per instance plus penantian halaman sesuai profil"""
+
+    def __init__(self, profile: ProfileSpec = DEFAULT_PACING, overrides: Optional[Dict[str, ProfileSpec]] = None):
+        self.profile = resolve_profile(profile)
+        self.overrides = {instance_key(url): resolve_profile(p) for url, p in (overrides or {}).items()}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def profile_for(self, url: str) -> PacingProfile:
+        return self.overrides.get(instance_key(url), self.profile)
+
+    def _bucket(self, url: str) -> TokenBucket:
+        key = instance_key(url)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                profile = self.profile_for(url)
+                bucket = self._buckets[key] = TokenBucket(profile.rate, profile.burst)
+            return bucket
+
+    def before_request(self, url: str):
+        delay = self._bucket(url).reserve()
+        if delay:
+            logger.debug(f"Rate limit: waiting {delay:.2f}s for {instance_key(url)}")
+            time.sleep(delay)
+
+    async def before_request_async(self, url: str):
+        delay = self._bucket(url).reserve()
+        if delay:
+            logger.debug(f"Rate limit: waiting {delay:.2f}s for {instance_key(url)}")
+            await asyncio.sleep(delay)
+
+    def settle(self, page, verbose: bool = False):
+        """Tunggu timeline dirender, lalu scroll jika profil memintanya"""
+        profile = self.profile_for(page.url)
+        try:
+            page.wait_for_selector(READY_SELECTOR, state="attached", timeout=profile.ready_timeout)
+        except Exception as e:
+            logger.warning(f"Timeline not ready: {str(e)[:80]}")
+        if not profile.simulate_scroll:
+            return
+        try:
+            for distance, pause in self._scroll_plan(page, profile, verbose):
+                page.evaluate(SCROLL_SCRIPT, distance)
+                time.sleep(pause)
+            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+        except Exception as e:
+            logger.warning(f"Interaction simulation failed: {str(e)}")
+
+    async def settle_async(self, page, verbose: bool = False):
+        """Versi async dari settle"""
+        profile = self.profile_for(page.url)
+        try:
+            await page.wait_for_selector(READY_SELECTOR, state="attached", timeout=profile.ready_timeout)
+        except Exception as e:
+            logger.warning(f"Timeline not ready: {str(e)[:80]}")
+        if not profile.simulate_scroll:
+            return
+        try:
+            for distance, pause in self._scroll_plan(page, profile, verbose):
+                await page.evaluate(SCROLL_SCRIPT, distance)
+                await asyncio.sleep(pause)
+            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+        except Exception as e:
+            logger.warning(f"Interaction simulation failed: {str(e)}")
+
+    @staticmethod
+    def _scroll_plan(page, profile: PacingProfile, verbose: bool):
+        scrolls = random.randint(*profile.scrolls)
+        if verbose:
+            logger.info(f"Simulating human scrolling ({scrolls} times)")
+        viewport_height = (page.viewport_size or {"height": 800})["height"]
+        return [
+            (
+                random.randint(int(viewport_height * 0.3), int(viewport_height * 0.8)),
+                random.uniform(*profile.scroll_pause)
+            )
+            for _ in range(scrolls)
+        ]
+
+SCROLL_SCRIPT = "distance => window.scrollBy({top: distance, left: 0, behavior: 'smooth'})"
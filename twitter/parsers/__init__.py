@@ -2,5 +2,8 @@
 from .tweet_parser import TweetParser
 from .user_parser import UserParser
 from .media_parser import MediaParser
+from .single_pass_parser import SinglePassTweetParser
+from .dom_extractor import DOMExtractor
+from .pipeline import ParsePipeline
 
-__all__ = ['TweetParser', 'UserParser', 'MediaParser']
\ No newline at end of file
+__all__ = ['TweetParser', 'UserParser', 'MediaParser', 'SinglePassTweetParser', 'DOMExtractor', 'ParsePipeline']
\ No newline at end of file
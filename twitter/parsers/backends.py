@@ -0,0 +1,37 @@
+# twitter/parsers/backends.py
+
+import importlib.util
+from functools import lru_cache
+from typing import List, Optional
+from bs4 import BeautifulSoup
+from ..utils.logger import logger
+
+# Nama backend -> (tree builder BeautifulSoup, modul C yang dibutuhkan)
+HTML_BACKENDS = {
+    "lxml": ("lxml", "lxml"),
+    "html.parser": ("html.parser", None),
+}
+DEFAULT_BACKEND = "lxml"
+FALLBACK_BACKEND = "html.parser"
+
+def available_backends() -> List[str]:
+    """Daftar backend yang dependensinya terpasang"""
+    return [
+        name for name, (_, module) in HTML_BACKENDS.items()
+        if module is None or importlib.util.find_spec(module) is not None
+    ]
+
+@lru_cache(maxsize=None)
+def resolve_backend(name: Optional[str] = None) -> str:
+    """Validasi nama backend dan fallback ke html.parser jika dependensi tidak ada"""
+    name = name or DEFAULT_BACKEND
+    if name not in HTML_BACKENDS:
+        raise ValueError(f"Unknown HTML parser backend: {name}")
+    if name not in available_backends():
+        logger.warning(f"HTML parser backend '{name}' is not installed, falling back to {FALLBACK_BACKEND}")
+        return FALLBACK_BACKEND
+    return name
+
+def make_soup(html: str, backend: Optional[str] = None) -> BeautifulSoup:
+    """Parse HTML dengan backend yang dipilih"""
+    return BeautifulSoup(html, HTML_BACKENDS[resolve_backend(backend)][0])
@@ -0,0 +1,159 @@
+// twitter/parsers/dom_extractor.js
+// Dijalankan lewat page.evaluate: baca field mentah setiap div.timeline-item
+// dalam satu traversal DOM, format sama dengan _TweetWalker.to_fields().
+() => {
+    const REMOVED_CLASSES = ["mention", "hashtag", "ellipsis", "hidden", "rt-quote"];
+    // String di dalam tag ini tidak dihitung oleh get_text() BeautifulSoup
+    const NON_CONTENT_TAGS = new Set(["script", "style", "template", "rt", "rp"]);
+    // Whitespace versi str.strip() Python
+    const WS = "[\\t\\n\\x0b\\x0c\\r\\x1c-\\x1f \\x85\\xa0\\u1680\\u2000-\\u200a\\u2028\\u2029\\u202f\\u205f\\u3000]";
+    const STRIP_RE = new RegExp(`^${WS}+|${WS}+$`, "g");
+    const strip = (text) => text.replace(STRIP_RE, "");
+
+    const extractItem = (root) => {
+        const fields = {
+            has_body: false,
+            retweet_header: null,
+            content: null,
+            username_header: null,
+            username: null,
+            fullname: null,
+            verified: false,
+            hashtag_hrefs: [],
+            mention_hrefs: [],
+            replying_text: null,
+            replying_hrefs: [],
+            date_title: null,
+            link_href: null,
+            stats: [],
+            images: [],
+            videos: [],
+            gifs: [],
+        };
+        const captures = [];
+        const openStats = [];
+        const depth = { content: 0, header: 0, fullname: 0, replying: 0, date: 0, attachments: 0 };
+        let retweetHeader = null, content = null, usernameHeader = null, usernameAny = null;
+        let fullname = null, replying = null, dateFound = false, linkFound = false;
+
+        const capture = (stripText, preMutation = false) => {
+            const result = { parts: [], strip: stripText, pre: preMutation };
+            captures.push(result);
+            return result;
+        };
+
+        const walk = (node, removed) => {
+            for (const child of node.childNodes) {
+                if (child.nodeType === Node.ELEMENT_NODE) {
+                    visit(child, removed);
+                } else if (child.nodeType === Node.TEXT_NODE && !NON_CONTENT_TAGS.has(node.localName)) {
+                    for (const item of captures) {
+                        if (removed && !item.pre) continue;
+                        const text = item.strip ? strip(child.data) : child.data;
+                        if (text) item.parts.push(text);
+                    }
+                }
+            }
+        };
+
+        const visit = (el, removed) => {
+            const name = el.localName;
+            const classes = Array.from(el.classList);
+            const capturesBefore = captures.length;
+            const statsBefore = openStats.length;
+            const entered = [];
+            const push = (key) => { depth[key] += 1; entered.push(key); };
+
+            // Lookup yang dijalankan TweetParser sebelum konten dibersihkan
+            if (name === "div") {
+                if (classes.includes("tweet-body")) fields.has_body = true;
+                if (retweetHeader === null && classes.includes("retweet-header")) {
+                    retweetHeader = capture(true, true);
+                }
+            }
+
+            if (!removed && depth.content && REMOVED_CLASSES.some((cls) => classes.includes(cls))) {
+                removed = true;
+            }
+
+            if (!removed) {
+                if (name === "div") {
+                    if (content === null && classes.includes("tweet-content")) {
+                        content = capture(true);
+                        push("content");
+                    }
+                    if (classes.includes("tweet-header")) push("header");
+                    if (replying === null && classes.includes("replying-to")) {
+                        replying = capture(true);
+                        push("replying");
+                    }
+                    if (classes.includes("attachments")) push("attachments");
+                    for (const stat of openStats) {
+                        if (stat[1] === null) stat[1] = capture(false);
+                    }
+                } else if (name === "a") {
+                    const href = el.getAttribute("href");
+                    if (classes.includes("username")) {
+                        if (usernameAny === null) usernameAny = capture(false);
+                        if (depth.header && usernameHeader === null) usernameHeader = capture(false);
+                    }
+                    if (classes.includes("fullname")) {
+                        if (fullname === null) fullname = capture(true);
+                        push("fullname");
+                    }
+                    if (href !== null && href.includes("/search?q=%23")) fields.hashtag_hrefs.push(href);
+                    if (classes.includes("mention")) fields.mention_hrefs.push(href === null ? "" : href);
+                    if (classes.includes("tweet-link") && !linkFound) {
+                        linkFound = true;
+                        fields.link_href = href;
+                    }
+                    if (depth.replying && href !== null) fields.replying_hrefs.push(href);
+                    if (depth.date && !dateFound) {
+                        dateFound = true;
+                        fields.date_title = el.getAttribute("title");
+                    }
+                } else if (name === "span") {
+                    if (classes.includes("tweet-date")) push("date");
+                    if (classes.includes("verified-icon") && depth.fullname) fields.verified = true;
+                    if (classes.join(" ").startsWith("icon-")) {
+                        for (const stat of openStats) {
+                            if (stat[0] === null) stat[0] = classes[0];
+                        }
+                    }
+                    if (classes.includes("tweet-stat")) {
+                        const stat = [null, null];
+                        fields.stats.push(stat);
+                        openStats.push(stat);
+                    }
+                } else if (name === "img") {
+                    const src = el.getAttribute("src") || "";
+                    if (depth.attachments && src.includes("/pic/")) fields.images.push(src);
+                } else if (name === "video") {
+                    const dataUrl = el.getAttribute("data-url") || "";
+                    (classes.includes("gif") ? fields.gifs : fields.videos).push(dataUrl);
+                }
+            }
+
+            walk(el, removed);
+
+            for (const key of entered) depth[key] -= 1;
+            captures.length = capturesBefore;
+            openStats.length = statsBefore;
+        };
+
+        walk(root, false);
+
+        const text = (item, sep = "") => (item === null ? null : item.parts.join(sep));
+        const contentText = text(content, " ");
+        fields.retweet_header = text(retweetHeader);
+        fields.content = contentText === null ? null : strip(contentText.replaceAll("\n", " "));
+        fields.username_header = text(usernameHeader);
+        fields.username = text(usernameAny);
+        fields.fullname = text(fullname);
+        fields.replying_text = text(replying);
+        fields.stats = fields.stats.map(([icon, value]) => [icon, text(value)]);
+        return fields;
+    };
+
+    return Array.from(document.querySelectorAll("div.timeline-item"), extractItem);
+}
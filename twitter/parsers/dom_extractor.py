@@ -0,0 +1,35 @@
+# twitter/parsers/dom_extractor.py
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from ..models.schemas import TweetSchema
+from .single_pass_parser import SinglePassTweetParser
+from ..utils.logger import logger
+
+# Script yang dijalankan di browser; menghasilkan field mentah per div.timeline-item
+EXTRACT_SCRIPT = (Path(__file__).parent / "dom_extractor.js").read_text(encoding="utf-8")
+
+class DOMExtractor:
+    """Ekstraksi tweet langsung di browser lewat satu page.evaluate per halaman.
+
+    Hasilnya berupa JSON ringkas yang dipetakan ke TweetSchema tanpa
+    mengirim HTML maupun mem-parse ulang dengan BeautifulSoup.
+    """
+
+    @staticmethod
+    def extract_fields(page) -> List[Dict[str, Any]]:
+        """Ambil field mentah semua div.timeline-item di halaman"""
+        return page.evaluate(EXTRACT_SCRIPT)
+
+    @staticmethod
+    def extract(page) -> List[Optional[TweetSchema]]:
+        return [DOMExtractor.parse_fields(fields) for fields in DOMExtractor.extract_fields(page)]
+
+    @staticmethod
+    def parse_fields(fields: Dict[str, Any]) -> Optional[TweetSchema]:
+        """Petakan field JSON dari browser ke TweetSchema"""
+        try:
+            return SinglePassTweetParser.build(fields)
+        except Exception as e:
+            logger.error(f"Tweet parsing failed: {str(e)}", exc_info=True)
+            return None
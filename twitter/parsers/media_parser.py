@@ -1,23 +1,26 @@
 # twitter/parser/media_parser.py
 
-from typing import List
+from typing import Iterable, List, Optional, Union
 from bs4 import BeautifulSoup
 from urllib.parse import unquote
-from ..models.schemas import MediaSchema
+from ..models.schemas import MediaSchema, EMPTY_MEDIA
+from .backends import make_soup
 from ..utils.logger import logger
 
 class MediaParser:
     @staticmethod
-    def parse(soup: BeautifulSoup) -> MediaSchema:
+    def parse(soup: Union[BeautifulSoup, str], backend: Optional[str] = None) -> MediaSchema:
         try:
-            return MediaSchema(
+            if isinstance(soup, str):
+                soup = make_soup(soup, backend)
+            return MediaSchema.of(
                 images=MediaParser._parse_images(soup),
                 videos=MediaParser._parse_videos(soup),
                 gifs=MediaParser._parse_gifs(soup)
             )
         except Exception as e:
             logger.error(f"Media parsing error: {str(e)}")
-            return MediaSchema(images=[], videos=[], gifs=[])
+            return EMPTY_MEDIA
 
     @staticmethod
     def _clean_url(url: str) -> str:
@@ -28,12 +31,38 @@ class MediaParser:
             logger.warning(f"URL cleaning failed: {str(e)}")
             return url
 
+    @staticmethod
+    def build(image_srcs: Iterable[str], video_urls: Iterable[str], gif_urls: Iterable[str]) -> MediaSchema:
+        """Bangun MediaSchema dari atribut mentah (src gambar, data-url video/gif)"""
+        return MediaSchema.of(
+            images=MediaParser._image_urls(image_srcs),
+            videos=MediaParser._video_urls(video_urls, "Video"),
+            gifs=MediaParser._video_urls(gif_urls, "GIF")
+        )
+
     @staticmethod
     def _parse_images(soup) -> List[str]:
+        return MediaParser._image_urls(
+            img.get("src", "") for img in soup.select("div.attachments img[src*='/pic/']")
+        )
+
+    @staticmethod
+    def _parse_videos(soup) -> List[str]:
+        return MediaParser._video_urls(
+            (video.get("data-url", "") for video in soup.select("video:not(.gif)")), "Video"
+        )
+
+    @staticmethod
+    def _parse_gifs(soup) -> List[str]:
+        return MediaParser._video_urls(
+            (gif.get("data-url", "") for gif in soup.select("video.gif")), "GIF"
+        )
+
+    @staticmethod
+    def _image_urls(srcs: Iterable[str]) -> List[str]:
         images = []
-        for img in soup.select("div.attachments img[src*='/pic/']"):
+        for src in srcs:
             try:
-                src = img.get("src", "")
                 if "/pic/" in src:
                     # Bersihkan URL
                     clean_url = unquote(src.split('?')[0].split("/pic")[1])
@@ -43,27 +72,13 @@ class MediaParser:
         return images
 
     @staticmethod
-    def _parse_videos(soup) -> List[str]:
+    def _video_urls(data_urls: Iterable[str], kind: str) -> List[str]:
         videos = []
-        for video in soup.select("video:not(.gif)"):
+        for data_url in data_urls:
             try:
-                data_url = video.get("data-url", "")
                 if data_url:
                     decoded_url = unquote(data_url.split("/pic")[1].split("?")[0])
                     videos.append(f"https://pbs.twimg.com{decoded_url}")
             except Exception as e:
-                logger.warning(f"Video parsing error: {str(e)}")
+                logger.warning(f"{kind} parsing error: {str(e)}")
         return videos
-
-    @staticmethod
-    def _parse_gifs(soup) -> List[str]:
-        gifs = []
-        for gif in soup.select("video.gif"):
-            try:
-                data_url = gif.get("data-url", "")
-                if data_url:
-                    decoded_url = unquote(data_url.split("/pic")[1].split("?")[0])
-                    gifs.append(f"https://pbs.twimg.com{decoded_url}")
-            except Exception as e:
-                logger.warning(f"GIF parsing error: {str(e)}")
-        return gifs
\ No newline at end of file
@@ -0,0 +1,89 @@
+# twitter/parsers/pipeline.py
+"""Parse halaman timeline di process pool, paralel dengan navigasi browser.
+
+Driver mengirim HTML mentah satu halaman lalu langsung lanjut ke halaman
+berikutnya. Hasil parse dikembalikan urut halaman; jika halaman yang belum
+selesai di-parse sudah mencapai `max_pending`, `submit` menunggu halaman
+tertua selesai (backpressure) agar driver tidak berlari terlalu jauh.
+"""
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Deque, Iterator, List, Optional, Tuple
+from ..models.schemas import TweetSchema
+from .tweet_parser import TweetParser
+from .single_pass_parser import SinglePassTweetParser
+
+TWEET_LINK_MARKER = 'class="tweet-link"'
+
+ParsedPage = Tuple[Any, List[Optional[TweetSchema]]]
+
+def has_tweets(html: str) -> bool:
+    """Cek murah tanpa parse: apakah halaman berisi item tweet"""
+    return TWEET_LINK_MARKER in html
+
+def parse_page(html: str, backend: Optional[str] = None) -> List[Optional[TweetSchema]]:
+    """Parse semua div.timeline-item; dijalankan di proses worker"""
+    return [
+        SinglePassTweetParser.parse_element(item)
+        for item in TweetParser.split_timeline(html, backend)
+    ]
+
+class ParsePipeline:
+    def __init__(self, workers: Optional[int] = None, max_pending: Optional[int] = None, backend: Optional[str] = None):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.workers * 2
+        self.backend = backend
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending: Deque[Tuple[Any, Future]] = deque()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: proses induk menjalankan thread (prefetch, hedging) dan Playwright
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def submit(self, html: str, context: Any = None) -> List[ParsedPage]:
+        """Kirim satu halaman; kembalikan halaman tertua yang sudah selesai, urut.
+
+        `context` dikembalikan apa adanya bersama hasil parse (misalnya URL
+        halaman dan cursor berikutnya).
+        """
+        self._pending.append((context, self._pool().submit(parse_page, html, self.backend)))
+        ready = []
+        while self._pending and (len(self._pending) > self.max_pending or self._pending[0][1].done()):
+            ready.append(self._pop())
+        return ready
+
+    def drain(self) -> Iterator[ParsedPage]:
+        """Tunggu dan yield semua halaman yang masih di-parse, urut"""
+        while self._pending:
+            yield self._pop()
+
+    def discard(self):
+        """Buang halaman yang belum diambil (misalnya setelah limit tercapai)"""
+        while self._pending:
+            self._pending.popleft()[1].cancel()
+
+    def close(self):
+        self.discard()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def _pop(self) -> ParsedPage:
+        context, future = self._pending.popleft()
+        return context, future.result()
@@ -0,0 +1,330 @@
+# twitter/parsers/single_pass_parser.py
+
+import re
+from typing import Any, Dict, List, Optional, Union
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+from ..models.schemas import TweetSchema, TweetStats, UserSchema
+from .tweet_parser import TweetParser
+from .media_parser import MediaParser
+from .backends import make_soup
+from ..utils.logger import logger
+
+# Kelas yang dibuang dari div.tweet-content (sama dengan TweetParser._parse_content)
+_REMOVED_CLASSES = frozenset(("mention", "hashtag", "ellipsis", "hidden", "rt-quote"))
+# Tipe string yang dihitung oleh get_text() bawaan BeautifulSoup
+_TEXT_TYPES = (NavigableString, CData)
+_STAT_FIELDS = {"comment": "comments", "retweet": "retweets", "quote": "quotes", "heart": "likes"}
+
+
+class _Capture:
+    """Pengumpul teks untuk satu elemen selama traversal"""
+    __slots__ = ("parts", "strip", "pre_mutation")
+
+    def __init__(self, strip: bool, pre_mutation: bool = False):
+        self.parts: List[str] = []
+        self.strip = strip
+        self.pre_mutation = pre_mutation
+
+
+class _TweetWalker:
+    """Satu kali traversal subtree tweet untuk mengumpulkan semua field mentah.
+
+    Elemen di dalam div.tweet-content yang cocok dengan _REMOVED_CLASSES
+    diperlakukan seperti sudah di-decompose oleh TweetParser, sehingga
+    tidak terlihat oleh field lain. Hanya deteksi tweet-body dan
+    retweet-header yang melihat pohon asli (sebelum mutasi).
+    """
+
+    def __init__(self):
+        self.has_body = False
+        self.retweet_header: Optional[_Capture] = None
+        self.content: Optional[_Capture] = None
+        self.username_header: Optional[_Capture] = None
+        self.username_any: Optional[_Capture] = None
+        self.fullname: Optional[_Capture] = None
+        self.verified = False
+        self.hashtag_hrefs: List[str] = []
+        self.mention_hrefs: List[str] = []
+        self.replying: Optional[_Capture] = None
+        self.replying_hrefs: List[str] = []
+        self.date_found = False
+        self.date_title: Optional[str] = None
+        self.link_found = False
+        self.link_href: Optional[str] = None
+        self.stats: List[list] = []
+        self.image_srcs: List[str] = []
+        self.video_urls: List[str] = []
+        self.gif_urls: List[str] = []
+
+        self._captures: List[_Capture] = []
+        self._open_stats: List[list] = []
+        self._in_content = 0
+        self._in_header = 0
+        self._in_fullname = 0
+        self._in_replying = 0
+        self._in_date = 0
+        self._in_attachments = 0
+
+    def walk(self, node: Union[BeautifulSoup, Tag], removed: bool = False):
+        for child in node.children:
+            if isinstance(child, Tag):
+                self._visit_tag(child, removed)
+            elif type(child) in _TEXT_TYPES:
+                for capture in self._captures:
+                    if removed and not capture.pre_mutation:
+                        continue
+                    text = child.strip() if capture.strip else str(child)
+                    if text:
+                        capture.parts.append(text)
+
+    def _visit_tag(self, tag: Tag, removed: bool):
+        name = tag.name
+        classes = tag.get("class") or ()
+        if isinstance(classes, str):
+            classes = classes.split()
+        captures_before = len(self._captures)
+        stats_before = len(self._open_stats)
+        entered = []
+
+        # Lookup yang dijalankan TweetParser sebelum konten dibersihkan
+        if name == "div":
+            if "tweet-body" in classes:
+                self.has_body = True
+            if self.retweet_header is None and "retweet-header" in classes:
+                self.retweet_header = _Capture(strip=True, pre_mutation=True)
+                self._captures.append(self.retweet_header)
+
+        if not removed and self._in_content and _REMOVED_CLASSES.intersection(classes):
+            removed = True
+
+        if not removed:
+            entered = self._enter(tag, name, classes)
+
+        self.walk(tag, removed)
+
+        for counter in entered:
+            setattr(self, counter, getattr(self, counter) - 1)
+        del self._captures[captures_before:]
+        del self._open_stats[stats_before:]
+
+    def _enter(self, tag: Tag, name: str, classes) -> List[str]:
+        entered = []
+
+        def push(counter: str):
+            setattr(self, counter, getattr(self, counter) + 1)
+            entered.append(counter)
+
+        def capture(strip: bool) -> _Capture:
+            result = _Capture(strip=strip)
+            self._captures.append(result)
+            return result
+
+        if name == "div":
+            if self.content is None and "tweet-content" in classes:
+                self.content = capture(strip=True)
+                push("_in_content")
+            if "tweet-header" in classes:
+                push("_in_header")
+            if self.replying is None and "replying-to" in classes:
+                self.replying = capture(strip=True)
+                push("_in_replying")
+            if "attachments" in classes:
+                push("_in_attachments")
+            for stat in self._open_stats:
+                if stat[1] is None:
+                    stat[1] = capture(strip=False)
+        elif name == "a":
+            href = tag.get("href")
+            if "username" in classes:
+                if self.username_any is None:
+                    self.username_any = capture(strip=False)
+                if self._in_header and self.username_header is None:
+                    self.username_header = capture(strip=False)
+            if "fullname" in classes:
+                if self.fullname is None:
+                    self.fullname = capture(strip=True)
+                push("_in_fullname")
+            if href is not None and "/search?q=%23" in href:
+                self.hashtag_hrefs.append(href)
+            if "mention" in classes:
+                self.mention_hrefs.append(tag.get("href", ""))
+            if "tweet-link" in classes and not self.link_found:
+                self.link_found = True
+                self.link_href = href
+            if self._in_replying and href is not None:
+                self.replying_hrefs.append(href)
+            if self._in_date and not self.date_found:
+                self.date_found = True
+                self.date_title = tag.get("title")
+        elif name == "span":
+            if "tweet-date" in classes:
+                push("_in_date")
+            if "verified-icon" in classes and self._in_fullname:
+                self.verified = True
+            if " ".join(classes).startswith("icon-"):
+                for stat in self._open_stats:
+                    if stat[0] is None:
+                        stat[0] = classes[0]
+            if "tweet-stat" in classes:
+                stat = [None, None]
+                self.stats.append(stat)
+                self._open_stats.append(stat)
+        elif name == "img":
+            src = tag.get("src", "")
+            if self._in_attachments and "/pic/" in src:
+                self.image_srcs.append(src)
+        elif name == "video":
+            if "gif" in classes:
+                self.gif_urls.append(tag.get("data-url", ""))
+            else:
+                self.video_urls.append(tag.get("data-url", ""))
+
+        return entered
+
+    def to_fields(self) -> Dict[str, Any]:
+        """Field mentah dalam bentuk dict, format yang sama dengan engine lain"""
+        def text(capture: Optional[_Capture], sep: str = "") -> Optional[str]:
+            return sep.join(capture.parts) if capture is not None else None
+
+        content = text(self.content, " ")
+        return {
+            "has_body": self.has_body,
+            "retweet_header": text(self.retweet_header),
+            "content": content.replace("\n", " ").strip() if content is not None else None,
+            "username_header": text(self.username_header),
+            "username": text(self.username_any),
+            "fullname": text(self.fullname),
+            "verified": self.verified,
+            "hashtag_hrefs": self.hashtag_hrefs,
+            "mention_hrefs": self.mention_hrefs,
+            "replying_text": text(self.replying),
+            "replying_hrefs": self.replying_hrefs,
+            "date_title": self.date_title,
+            "link_href": self.link_href,
+            "stats": [[icon, text(value)] for icon, value in self.stats],
+            "images": self.image_srcs,
+            "videos": self.video_urls,
+            "gifs": self.gif_urls,
+        }
+
+
+class SinglePassTweetParser:
+    """Parser tweet satu traversal dengan output identik dengan TweetParser"""
+
+    @staticmethod
+    def parse(html: str, backend: Optional[str] = None) -> Optional[TweetSchema]:
+        try:
+            return SinglePassTweetParser.parse_element(make_soup(html, backend))
+        except Exception as e:
+            logger.error(f"Tweet parsing failed: {str(e)}", exc_info=True)
+            return None
+
+    @staticmethod
+    def parse_element(soup: Union[BeautifulSoup, Tag]) -> Optional[TweetSchema]:
+        """Parse satu tweet dari soup/elemen timeline-item yang sudah di-parse"""
+        try:
+            walker = _TweetWalker()
+            walker.walk(soup)
+            return SinglePassTweetParser.build(walker.to_fields())
+        except Exception as e:
+            logger.error(f"Tweet parsing failed: {str(e)}", exc_info=True)
+            return None
+
+    @staticmethod
+    def build(fields: Dict[str, Any]) -> Optional[TweetSchema]:
+        """Bangun TweetSchema dari field mentah hasil traversal"""
+        if not fields["has_body"]:
+            return None
+
+        is_retweet = fields["retweet_header"] is not None
+        try:
+            retweeter = None
+            if is_retweet:
+                match = re.search(r"([A-Za-z0-9_]+)\s+retweeted", fields["retweet_header"])
+                if match:
+                    retweeter = match.group(1)
+
+            content = fields["content"]
+            if not content:
+                return None
+
+            return TweetSchema(
+                user=SinglePassTweetParser._build_user(fields),
+                content=content,
+                hashtags=SinglePassTweetParser._build_hashtags(content, fields["hashtag_hrefs"]),
+                mentions=SinglePassTweetParser._build_mentions(content, fields["mention_hrefs"]),
+                replying_to=SinglePassTweetParser._build_replying_to(
+                    fields["replying_text"], fields["replying_hrefs"]
+                ),
+                timestamp=(
+                    TweetParser._parse_date(fields["date_title"])
+                    if fields["date_title"] is not None
+                    else None
+                ),
+                stats=SinglePassTweetParser._build_stats(fields["stats"]),
+                media=MediaParser.build(fields["images"], fields["videos"], fields["gifs"]),
+                link=(
+                    f"https://twitter.com{fields['link_href']}"
+                    if fields["link_href"] is not None
+                    else None
+                ),
+                is_retweet=is_retweet,
+                retweeter=retweeter
+            )
+        except Exception as e:
+            kind = "retweet" if is_retweet else "regular tweet"
+            logger.warning(f"Failed to parse {kind}: {str(e)}")
+            return None
+
+    @staticmethod
+    def _build_user(fields: Dict[str, Any]) -> UserSchema:
+        username = fields["username_header"]
+        if username is None:
+            username = fields["username"]
+        return UserSchema(
+            username=username.strip().lstrip('@').lower() if username is not None else "unknown_user",
+            fullname=fields["fullname"] if fields["fullname"] is not None else "Unknown User",
+            verified=fields["verified"]
+        )
+
+    @staticmethod
+    def _build_hashtags(content: str, hrefs: List[str]) -> List[str]:
+        hashtags = set(re.findall(r"#(\w+)", content))
+        for href in hrefs:
+            match = re.search(r"%23(\w+)", href)
+            if match:
+                hashtags.add(match.group(1).lower())
+        return sorted([ht for ht in hashtags if len(ht) > 1])
+
+    @staticmethod
+    def _build_mentions(content: str, hrefs: List[str]) -> List[str]:
+        mentions = set(re.findall(r"@(\w+)", content))
+        for href in hrefs:
+            username = href.lstrip("/")
+            if username:
+                mentions.add(username.lower())
+        return sorted(mentions)
+
+    @staticmethod
+    def _build_replying_to(text: Optional[str], hrefs: List[str]) -> List[str]:
+        replying_to = []
+        if text is not None:
+            replying_to.extend(re.findall(r"@(\w+)", text))
+            replying_to.extend([href.lstrip("/").lower() for href in hrefs])
+        return list(set(filter(None, replying_to)))
+
+    @staticmethod
+    def _build_stats(items: List[list]) -> TweetStats:
+        stats = TweetStats()
+        for icon_class, value_text in items:
+            if icon_class is None or value_text is None:
+                continue
+            try:
+                icon_type = icon_class.split("icon-")[-1]
+                value = int(value_text.strip().replace(",", "")) if value_text.strip() else 0
+                field_name = _STAT_FIELDS.get(icon_type)
+                if field_name:
+                    setattr(stats, field_name, value)
+            except ValueError as e:
+                logger.debug(f"Invalid stat item: {str(e)}")
+        return stats
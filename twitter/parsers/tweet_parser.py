@@ -1,19 +1,42 @@
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 import re
 import datetime
-from typing import Optional, List
+from typing import Optional, List, Tuple, Union
 from ..models.schemas import TweetSchema, TweetStats, UserSchema, MediaSchema
 from .user_parser import UserParser
 from .media_parser import MediaParser
+from .backends import make_soup
 from ..utils.logger import logger
 
 class TweetParser:
     
     @staticmethod
-    def parse(html: str) -> Optional[TweetSchema]:
+    def parse(html: str, backend: Optional[str] = None) -> Optional[TweetSchema]:
         """Main parser dengan error handling komprehensif"""
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            return TweetParser.parse_element(make_soup(html, backend))
+        except Exception as e:
+            logger.error(f"Tweet parsing failed: {str(e)}", exc_info=True)
+            return None
+
+    @staticmethod
+    def split_timeline(html: str, backend: Optional[str] = None) -> List[Tag]:
+        """Parse HTML satu halaman sekaligus dan pecah menjadi elemen div.timeline-item"""
+        return make_soup(html, backend).select("div.timeline-item")
+
+    @staticmethod
+    def split_page(html: str, backend: Optional[str] = None) -> Tuple[List[Tag], Optional[str]]:
+        """Seperti split_timeline, plus href "Load more" (yang berisi cursor) jika ada"""
+        soup = make_soup(html, backend)
+        next_href = None
+        for link in soup.select("div.show-more a[href*='cursor=']"):
+            next_href = link["href"]
+        return soup.select("div.timeline-item"), next_href
+
+    @staticmethod
+    def parse_element(soup: Union[BeautifulSoup, Tag]) -> Optional[TweetSchema]:
+        """Parse satu tweet dari soup/elemen timeline-item yang sudah di-parse"""
+        try:
             if not soup.find("div", class_="tweet-body"):
                 return None
                 
@@ -1,14 +1,17 @@
 # twitter/parser/user_parser.py
 
 from bs4 import BeautifulSoup
-from typing import Optional
+from typing import Optional, Union
 from ..models.schemas import UserSchema
+from .backends import make_soup
 from ..utils.logger import logger
 
 class UserParser:
     @staticmethod
-    def parse(soup: BeautifulSoup) -> UserSchema:
+    def parse(soup: Union[BeautifulSoup, str], backend: Optional[str] = None) -> UserSchema:
         try:
+            if isinstance(soup, str):
+                soup = make_soup(soup, backend)
             return UserSchema(
                 username=UserParser._parse_username(soup),
                 fullname=UserParser._parse_fullname(soup),
@@ -0,0 +1,193 @@
+# twitter/resilience.py
+"""Circuit breaker per instance dan hedged request untuk fast path HTTP.
+
+Instance yang terus gagal diputus sementara (OPEN) agar tidak menerima
+traffic; setelah `reset_timeout` satu request percobaan diizinkan
+(HALF_OPEN). Hedged request mengirim cursor yang sama ke instance kedua
+jika instance utama belum menjawab dalam `hedge_after` detik.
+"""
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urljoin
+from .http_fetcher import FetchResult, HttpFetcher, is_challenge_page
+from .utils.logger import logger
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trial_in_flight = False
+        self.trial_started_at = 0.0
+
+    def allow(self) -> bool:
+        """Izinkan request; saat HALF_OPEN hanya pemanggil pertama yang mendapat request percobaan"""
+        now = time.monotonic()
+        if self.state == OPEN and now - self.opened_at >= self.reset_timeout:
+            self.state = HALF_OPEN
+            self.trial_in_flight = False
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN:
+            return False
+        # Percobaan yang tidak pernah melapor (instance akhirnya tidak dipakai) kadaluarsa setelah reset_timeout
+        if self.trial_in_flight and now - self.trial_started_at < self.reset_timeout:
+            return False
+        self.trial_in_flight = True
+        self.trial_started_at = now
+        return True
+
+    def is_open(self) -> bool:
+        """Seperti `not allow()` tetapi tanpa efek samping: tidak mengambil slot percobaan"""
+        now = time.monotonic()
+        if self.state == CLOSED:
+            return False
+        if self.state == OPEN and now - self.opened_at < self.reset_timeout:
+            return True
+        # HALF_OPEN (atau OPEN yang sudah lewat reset_timeout): terbuka hanya jika percobaan sedang berjalan
+        return self.state == HALF_OPEN and self.trial_in_flight and now - self.trial_started_at < self.reset_timeout
+
+    def record_success(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.trial_in_flight = False
+
+    def record_failure(self):
+        self.trial_in_flight = False
+        self.failures += 1
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+
+class CircuitBreakerBoard:
+    """Satu CircuitBreaker per URL instance, aman dipakai dari banyak thread"""
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, instance: str) -> CircuitBreaker:
+        breaker = self._breakers.get(instance)
+        if breaker is None:
+            breaker = self._breakers[instance] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+        return breaker
+
+    def allow(self, instance: str) -> bool:
+        """Izinkan request ke instance; panggil hanya untuk instance yang benar-benar di-request"""
+        with self._lock:
+            return self._get(instance).allow()
+
+    def is_open(self, instance: str) -> bool:
+        with self._lock:
+            return self._get(instance).is_open()
+
+    def state(self, instance: str) -> str:
+        with self._lock:
+            return self._get(instance).state
+
+    def record_success(self, instance: str):
+        with self._lock:
+            self._get(instance).record_success()
+
+    def record_failure(self, instance: str):
+        with self._lock:
+            breaker = self._get(instance)
+            was_open = breaker.state == OPEN
+            breaker.record_failure()
+            if breaker.state == OPEN and not was_open:
+                logger.warning(f"Circuit opened for {instance} after {breaker.failures} failures")
+
+    def blocked(self, instances: Iterable[str]) -> List[str]:
+        """Instance yang sedang diputus; hanya membaca state, tidak mengambil slot percobaan"""
+        return [instance for instance in instances if self.is_open(instance)]
+
+def is_good_page(result: FetchResult) -> bool:
+    return result.status == 200 and not is_challenge_page(result)
+
+class HedgedFetcher:
+    """GET halaman cursor dari instance utama, dengan cadangan jika terlambat.
+
+    Response pertama yang valid menang; response yang kalah dibiarkan
+    selesai di background dan dibuang.
+    """
+
+    def __init__(
+        self,
+        fetcher: HttpFetcher,
+        breakers: CircuitBreakerBoard,
+        hedge_after: Optional[float] = None,
+        pacer=None,
+        max_workers: int = 4
+    ):
+        self.fetcher = fetcher
+        self.breakers = breakers
+        self.hedge_after = hedge_after
+        self.pacer = pacer
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedge")
+
+    def get(self, path: str, instances: List[str]) -> Tuple[str, FetchResult]:
+        """`instances[0]` adalah instance utama, `instances[1]` (jika ada) cadangan"""
+        primary = instances[0]
+        # Rate limit instance utama dihitung di luar anggaran hedge_after
+        self._pace(primary)
+        if self.hedge_after is None or len(instances) < 2:
+            return primary, self._fetch(primary, path)
+
+        futures: Dict[Future, str] = {self._executor.submit(self._fetch, primary, path): primary}
+        done, _ = wait(futures, timeout=self.hedge_after)
+        backup = instances[1]
+        # Slot percobaan circuit HALF_OPEN baru diambil saat cadangan benar-benar dikirim
+        if not done and self.breakers.allow(backup):
+            logger.info(f"No response from {primary} after {self.hedge_after:.1f}s, hedging to {backup}")
+            futures[self._executor.submit(self._fetch, backup, path, True)] = backup
+
+        fallback: Optional[Tuple[str, FetchResult]] = None
+        error: Optional[Exception] = None
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                instance = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    error = e
+                    continue
+                if is_good_page(result):
+                    return instance, result
+                if instance == primary or fallback is None:
+                    fallback = (instance, result)
+        if fallback is not None:
+            return fallback
+        raise error
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+    def _pace(self, instance: str):
+        if self.pacer is not None:
+            self.pacer.before_request(instance)
+
+    def _fetch(self, instance: str, path: str, pace: bool = False) -> FetchResult:
+        if pace:
+            self._pace(instance)
+        try:
+            result = self.fetcher.get(urljoin(instance, path))
+        except Exception:
+            self.breakers.record_failure(instance)
+            raise
+        if is_good_page(result):
+            self.breakers.record_success(instance)
+        elif not is_challenge_page(result):
+            self.breakers.record_failure(instance)
+        return result
@@ -1,182 +1,698 @@
 # twitter/scraper.py
-import random
-from time import sleep
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import quote_plus, urljoin, urlsplit
+from bs4 import Tag
 from playwright.sync_api import Page
 from .browser_manager import BrowserManager, BrowserConfig
+from .browser_pool import BrowserPool, PoolConfig
 from .instance_manager import InstanceManager
+from .instance_health import InstanceHealthRegistry, DEFAULT_HEALTH_PATH
+from .resilience import CircuitBreakerBoard, HedgedFetcher
+from .pacing import Pacer, ProfileSpec, DEFAULT_PACING
+from .settings import NIITTER_INSTANCES
+from .checkpoint import CheckpointStore, DEFAULT_CHECKPOINT_PATH
+from .watermark import Watermark, WatermarkStore, DEFAULT_WATERMARK_PATH
+from .dedup import DedupIndex, TweetIndex, make_index
+from .http_fetcher import FetchResult, HttpFetcher, is_challenge_page
 from .parsers.tweet_parser import TweetParser
+from .parsers.single_pass_parser import SinglePassTweetParser
+from .parsers.dom_extractor import DOMExtractor
+from .parsers.pipeline import ParsePipeline, has_tweets
+from .parsers.backends import resolve_backend
 from .models.schemas import TweetSchema
+from .utils.helpers import extract_tweet_id
 from .utils.logger import logger
 
+EXTRACTION_MODES = ("bulk", "element", "dom")
+FETCH_MODES = ("browser", "http")
+
+NEXT_URL_SCRIPT = """() => {
+    const links = document.querySelectorAll("div.show-more a[href*='cursor=']");
+    return links.length ? links[links.length - 1].href : null;
+}"""
+LINK_HREF_SCRIPT = """el => {
+    const link = el.querySelector("a.tweet-link");
+    return link ? link.getAttribute("href") : null;
+}"""
+PREFETCH_SCRIPT = """url => {
+    window.__nitterPrefetch = fetch(url, {credentials: "include"})
+        .then(async (response) => ({status: response.status, html: await response.text()}))
+        .catch((error) => ({status: 0, html: String(error)}));
+}"""
+
+@dataclass
+class _ScrapeRun:
+    """Progres satu query: jumlah tweet terkumpul dan ID yang sudah dilihat"""
+    query: str
+    limit: int
+    verbose: bool = False
+    collected: int = 0
+    skipped: int = 0
+    index: DedupIndex = field(default_factory=TweetIndex)
+    watermark: Optional[Watermark] = None   # Diisi hanya dalam mode incremental
+    caught_up: bool = False                 # Sudah sampai tweet yang dikumpulkan run sebelumnya
+    exhausted: bool = False                 # Sudah sampai halaman terakhir timeline
+    newest: Optional[TweetSchema] = None
+
+    @property
+    def done(self) -> bool:
+        return self.caught_up or self.collected >= self.limit
+
+    @property
+    def complete(self) -> bool:
+        """True jika tidak ada tweet baru yang terlewat antara tweet terbaru dan watermark lama"""
+        return self.caught_up or (self.exhausted and self.collected < self.limit)
+
+    def is_known(self, tweet_id: Optional[str]) -> bool:
+        """Cek murah sebelum parse: True jika tweet ini sudah pernah diterima"""
+        if self.watermark is not None and self.watermark.covers(tweet_id):
+            # Timeline urut terbaru dulu: semua tweet setelah ini juga sudah dikenal
+            self.caught_up = True
+            return True
+        if tweet_id is not None and tweet_id in self.index:
+            self.skipped += 1
+            return True
+        return False
+
+    def accept(self, tweet: Optional[TweetSchema]) -> bool:
+        """Terima tweet yang valid dan belum pernah dilihat"""
+        if not tweet or not TweetScraper._validate_tweet(tweet):
+            return False
+        if not self.index.add(extract_tweet_id(tweet.link) or tweet.link):
+            return False
+        self.collected += 1
+        if _snowflake(tweet) > (_snowflake(self.newest) if self.newest else 0):
+            self.newest = tweet
+        if self.verbose:
+            logger.info(f"Collected {self.collected}/{self.limit} tweets")
+        return True
+
+def _snowflake(tweet: TweetSchema) -> int:
+    tweet_id = extract_tweet_id(tweet.link)
+    return int(tweet_id) if tweet_id and tweet_id.isdigit() else 0
+
 class TweetScraper:
-    def __init__(self, headless: bool = True):
-        self.config = BrowserConfig()
+    def __init__(
+        self,
+        headless: bool = True,
+        extraction_mode: str = "bulk",
+        parser_backend: Optional[str] = None,
+        instances: Optional[List[str]] = None,
+        reuse_browser: bool = True,
+        pool_config: Optional[PoolConfig] = None,
+        fetch_mode: str = "browser",
+        prefetch: bool = True,
+        checkpoint_path: Optional[str] = None,
+        resume: bool = False,
+        health_path: Optional[str] = DEFAULT_HEALTH_PATH,
+        page_timeout: int = 20000,
+        hedge_after: Optional[float] = None,
+        pacing: ProfileSpec = DEFAULT_PACING,
+        instance_pacing: Optional[Dict[str, ProfileSpec]] = None,
+        lean: bool = False,
+        dedup: str = "exact",
+        dedup_capacity: Optional[int] = None,
+        incremental: bool = False,
+        watermark_path: Optional[str] = None,
+        parse_workers: int = 0
+    ):
+        if extraction_mode not in EXTRACTION_MODES:
+            raise ValueError(f"Unknown extraction mode: {extraction_mode}")
+        if fetch_mode not in FETCH_MODES:
+            raise ValueError(f"Unknown fetch mode: {fetch_mode}")
+        make_index(dedup, dedup_capacity)  # Validasi mode lebih awal
+        self.config = BrowserConfig.lean() if lean else BrowserConfig()
         self.headless = headless
+        self.extraction_mode = extraction_mode
+        self.parser_backend = resolve_backend(parser_backend)
+        self.instances = instances
         self.instance_manager = None
+        self.health = InstanceHealthRegistry(health_path)
+        self.breakers = CircuitBreakerBoard()
+        self.page_timeout = page_timeout
+        self.pacer = Pacer(pacing, instance_pacing)
+        self.dedup = dedup
+        self.dedup_capacity = dedup_capacity
         self.browser_manager = None
+        self.pool = BrowserPool(headless, self.config, pool_config) if reuse_browser else None
+        self.fetch_mode = fetch_mode
+        self.fetcher = HttpFetcher(self.config.user_agent) if fetch_mode == "http" else None
+        self.hedger = HedgedFetcher(self.fetcher, self.breakers, hedge_after, self.pacer) if self.fetcher else None
+        self.prefetch = prefetch
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+        if resume and checkpoint_path is None:
+            checkpoint_path = DEFAULT_CHECKPOINT_PATH
+        self.checkpoint = CheckpointStore(checkpoint_path) if checkpoint_path else None
+        self.resume = resume
+        if incremental and watermark_path is None:
+            watermark_path = DEFAULT_WATERMARK_PATH
+        self.watermarks = WatermarkStore(watermark_path) if watermark_path else None
+        self.incremental = incremental
+        # parse_workers > 0: mode bulk di browser mem-parse halaman di process pool
+        self.parse_workers = parse_workers
+        self._pipeline: Optional[ParsePipeline] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def share_state(self, other: "TweetScraper"):
+        """Pakai registry kesehatan, circuit breaker dan rate limit yang sama dengan `other`.
+
+        Dipakai oleh worker batch agar semua worker melihat instance yang
+        sama sebagai sehat/mati dan bersama-sama menghormati rate limit.
+        """
+        self.health.close()
+        self.health = other.health
+        self.breakers = other.breakers
+        self.pacer = other.pacer
+        if self.hedger is not None:
+            self.hedger.breakers = other.breakers
+            self.hedger.pacer = other.pacer
+
+    def close(self):
+        """Tutup browser pool dan koneksi HTTP (jika ada)"""
+        if self.pool is not None:
+            self.pool.close()
+        if self.fetcher is not None:
+            self.hedger.close()
+            self.fetcher.close()
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=False)
+            self._prefetch_executor = None
+        if self._pipeline is not None:
+            self._pipeline.close()
+            self._pipeline = None
+        if self.checkpoint is not None:
+            self.checkpoint.close()
+            self.checkpoint = None
+        if self.watermarks is not None:
+            self.watermarks.close()
+            self.watermarks = None
+        self.health.save()
+        self.health.close()
 
     def scrape_tweets(self, query: str, limit: int = 10, verbose: bool = False) -> List[TweetSchema]:
+        return list(self.iter_tweets(query, limit, verbose))
+
+    def iter_tweets(self, query: str, limit: int = 10, verbose: bool = False) -> Iterator[TweetSchema]:
+        """Seperti scrape_tweets, tetapi tweet di-yield segera setelah halamannya diproses"""
+        for page_tweets in self.iter_pages(query, limit, verbose):
+            yield from page_tweets
+
+    def iter_pages(
+        self,
+        query: str,
+        limit: int = 10,
+        verbose: bool = False,
+        raise_errors: bool = False
+    ) -> Iterator[List[TweetSchema]]:
+        """Yield tweet baru per halaman timeline; checkpoint sudah tersimpan saat halaman di-yield.
+
+        Jika scraping gagal di tengah jalan, generator berhenti setelah
+        halaman terakhir yang berhasil, seperti scrape_tweets yang
+        mengembalikan hasil parsial; dengan `raise_errors=True` error
+        diteruskan ke pemanggil setelah halaman-halaman tersebut. Dalam mode
+        incremental, paginasi berhenti di tweet pertama yang sudah
+        dikumpulkan run sebelumnya.
+        """
+        run = self._new_run(query, limit, verbose)
         try:
-            with BrowserManager(headless=self.headless, config=self.config) as browser:
-                self.instance_manager = InstanceManager(browser.page)
+            if self.incremental:
+                run.watermark = self.watermarks.load(query)
+            yield from self._iter_run(run)
+            self._advance_watermark(run)
+
+        except Exception as e:
+            logger.error(f"Scraping failed: {str(e)}")
+            if run.collected:
+                logger.info(f"Returning {run.collected} tweets collected before the failure")
+            if raise_errors:
+                raise
+        finally:
+            if run.skipped:
+                logger.debug(f"Skipped {run.skipped} already-seen tweets before parsing")
+
+    def _new_run(self, query: str, limit: int, verbose: bool = False) -> "_ScrapeRun":
+        # Bloom filter diukur per run: satu run menerima paling banyak `limit` ID
+        index = make_index(self.dedup, self.dedup_capacity or limit)
+        return _ScrapeRun(query, limit, verbose, index=index)
+
+    def _iter_run(self, run: "_ScrapeRun") -> Iterator[List[TweetSchema]]:
+        start_path, resumed = self._begin_checkpoint(run)
+        if resumed:
+            yield resumed
+        if start_path is None:
+            # Checkpoint sudah sampai halaman terakhir
+            run.exhausted = True
+            return
+        if run.done:
+            return
+
+        resume_url = None
+        if self.fetch_mode == "http":
+            finished, resume_url = yield from self._iter_http_pages(run, start_path)
+            if finished:
+                return
+            logger.warning("HTTP fast path unavailable, falling back to browser...")
+
+        if self.parse_workers and self.extraction_mode == "bulk":
+            yield from self._iter_pipelined_pages(run, start_path, resume_url)
+        else:
+            yield from self._iter_browser_pages(run, start_path, resume_url)
+
+    def _advance_watermark(self, run: "_ScrapeRun"):
+        """Majukan watermark hanya jika run sampai watermark lama atau akhir timeline.
+
+        Run yang berhenti karena limit atau kehabisan retry sebelum itu
+        meninggalkan celah tweet yang belum dikumpulkan; watermark lama
+        dipertahankan agar run berikutnya mengisi celah tersebut. Run pertama
+        (belum ada watermark) selalu menetapkan watermark awal.
+        """
+        if run.caught_up:
+            logger.info(f"Reached tweets from the previous run of '{run.query}' ({run.collected} new)")
+        if self.watermarks is None or run.newest is None:
+            return
+        if run.watermark is not None and not run.complete:
+            logger.warning(
+                f"Stopped before the previous watermark for '{run.query}' "
+                f"({run.collected}/{run.limit} tweets); keeping it so the next run collects the rest"
+            )
+            return
+        try:
+            self.watermarks.advance(run.query, extract_tweet_id(run.newest.link), run.newest.timestamp)
+        except Exception as e:
+            logger.error(f"Failed to save watermark: {str(e)}")
+
+    def _iter_browser_pages(
+        self,
+        run: "_ScrapeRun",
+        start_path: str,
+        resume_url: Optional[str]
+    ) -> Iterator[List[TweetSchema]]:
+        with self._page_session() as page:
+            self.instance_manager = InstanceManager(
+                page, self.instances, registry=self.health, breakers=self.breakers
+            )
+            if resume_url:
+                current_url = resume_url
+            else:
                 instance = self.instance_manager.get_working_instance()
-                
-                current_url = f"{instance}/search?f=tweets&q={query}"
-                browser.page.goto(current_url, timeout=60000)
-                
-                tweets = []
-                retry_count = 0
-                max_retries = 3
-                consecutive_failures = 0
-                
-                while len(tweets) < limit and retry_count < max_retries:
-                    try:
-                        # Simulasi interaksi manusia
-                        self._simulate_human_interaction(browser.page, verbose)
+                current_url = urljoin(instance, start_path)
+            self._goto(page, current_url)
+            
+            # HTML halaman berikutnya yang sudah diambil lewat prefetch
+            prefetched_html = None
+            retry_count = 0
+            max_retries = 3
+            consecutive_failures = 0
+            
+            while not run.done and retry_count < max_retries:
+                try:
+                    if prefetched_html is None:
+                        # Tunggu timeline dirender (dan scroll jika profil pacing memintanya)
+                        self.pacer.settle(page, run.verbose)
+                    
+                    # Ekstrak elemen tweet dan cursor halaman berikutnya
+                    tweet_elements, next_url = self._get_timeline_page(page, prefetched_html)
+                    prefetched_html = None
+                    
+                    # Handle hasil kosong
+                    if not tweet_elements:
+                        logger.warning("No tweets found, rotating instance...")
+                        instance = self.instance_manager.rotate()
+                        current_url = urljoin(instance, self._cursor_path(current_url))
+                        self._goto(page, current_url)
+                        retry_count += 1
+                        continue
+                    
+                    # Ambil halaman berikutnya selagi halaman ini di-parse
+                    prefetching = bool(next_url) and self._start_prefetch(page, next_url)
                         
-                        # Ekstrak elemen tweet
-                        tweet_elements = browser.page.locator("div.timeline-item").all()
+                    # Proses tweet
+                    new_tweets = []
+                    for idx, element in enumerate(tweet_elements):
+                        if run.done:
+                            break
+                            
+                        try:
+                            # Tweet yang sudah dikenal dilewati sebelum HTML-nya diambil/di-parse
+                            if run.is_known(self._item_tweet_id(element)):
+                                continue
+                            parsed = self._parse_timeline_item(element)
+                            if run.accept(parsed):
+                                new_tweets.append(parsed)
+                            
+                        except Exception as e:
+                            logger.error(f"Error processing tweet {idx}: {str(e)}")
+                            consecutive_failures += 1
+                            if consecutive_failures > 5:
+                                raise RuntimeError("Too many consecutive tweet processing failures")
+                            
+                    # Halaman yang terpotong limit disimpan ulang agar sisanya tidak terlewat saat resume
+                    self._save_checkpoint(run.query, current_url if run.done else next_url, new_tweets)
+                    yield new_tweets
+                    
+                    # Handle paginasi lewat cursor, tanpa klik tombol "Load more"
+                    if not next_url:
+                        logger.info("Reached end of pages")
+                        run.exhausted = True
+                        break
+                    if run.done:
+                        break
+                    if prefetching:
+                        prefetched_html = self._finish_prefetch(page, next_url)
+                    if prefetched_html is None:
+                        self._goto(page, next_url)
+                    current_url = next_url
                         
-                        # Handle hasil kosong
-                        if not tweet_elements:
+                    self.instance_manager.mark_ok()
+                    retry_count = 0
+                    consecutive_failures = 0
+                    
+                except Exception as e:
+                    logger.error(f"Page error: {str(e)}")
+                    retry_count += 1
+                    prefetched_html = None
+                    instance = self.instance_manager.rotate()
+                    current_url = urljoin(instance, self._cursor_path(current_url))
+                    # Circuit breaker yang menahan instance bermasalah, bukan sleep tetap
+                    self._goto(page, current_url)
+
+    def _iter_pipelined_pages(
+        self,
+        run: "_ScrapeRun",
+        start_path: str,
+        resume_url: Optional[str]
+    ) -> Iterator[List[TweetSchema]]:
+        """Seperti _iter_browser_pages, tetapi HTML tiap halaman di-parse di process pool.
+
+        Browser langsung membuka halaman berikutnya setelah HTML halaman saat
+        ini dikirim ke pipeline; hasil parse diterima urut halaman. Paling
+        banyak `max_pending` halaman di depan hasil yang sudah diterima.
+        """
+        pipeline = self._parse_pipeline()
+        with self._page_session() as page:
+            self.instance_manager = InstanceManager(
+                page, self.instances, registry=self.health, breakers=self.breakers
+            )
+            if resume_url:
+                current_url = resume_url
+            else:
+                instance = self.instance_manager.get_working_instance()
+                current_url = urljoin(instance, start_path)
+            self._goto(page, current_url)
+
+            retry_count = 0
+            max_retries = 3
+            try:
+                while not run.done and retry_count < max_retries:
+                    try:
+                        self.pacer.settle(page, run.verbose)
+                        html = page.content()
+                        if not has_tweets(html):
                             logger.warning("No tweets found, rotating instance...")
-                            instance = self.instance_manager.get_working_instance()
-                            current_url = f"{instance}/search?f=tweets&q={query}"
-                            browser.page.goto(current_url, timeout=60000)
+                            instance = self.instance_manager.rotate()
+                            current_url = urljoin(instance, self._cursor_path(current_url))
+                            self._goto(page, current_url)
                             retry_count += 1
                             continue
-                            
-                        # Proses tweet
-                        new_tweets = []
-                        for idx, element in enumerate(tweet_elements):
-                            if len(tweets) + len(new_tweets) >= limit:
+
+                        next_url = self._read_next_url(page)
+                        for (page_url, page_next), parsed in pipeline.submit(html, (current_url, next_url)):
+                            if run.done:
                                 break
-                                
-                            try:
-                                html = element.inner_html()
-                                parsed = TweetParser.parse(html)
-                                if parsed and self._validate_tweet(parsed):
-                                    new_tweets.append(parsed)
-                                    
-                                    if verbose:
-                                        logger.info(f"Collected {len(tweets)+len(new_tweets)}/{limit} tweets")
-                                
-                            except Exception as e:
-                                logger.error(f"Error processing tweet {idx}: {str(e)}")
-                                consecutive_failures += 1
-                                if consecutive_failures > 5:
-                                    raise RuntimeError("Too many consecutive tweet processing failures")
-                                
-                        tweets.extend(new_tweets)
-                        
-                        # Handle paginasi
-                        if not self._handle_pagination(browser.page):
+                            yield self._accept_parsed_page(run, page_url, page_next, parsed)
+                        if run.done:
+                            break
+                        if not next_url:
                             logger.info("Reached end of pages")
+                            run.exhausted = True
                             break
-                            
+
+                        # Cursor dicatat sebelum goto agar retry membuka halaman yang benar
+                        current_url = next_url
+                        self._goto(page, next_url)
+                        self.instance_manager.mark_ok()
                         retry_count = 0
-                        consecutive_failures = 0
-                        
+
                     except Exception as e:
                         logger.error(f"Page error: {str(e)}")
                         retry_count += 1
-                        instance = self.instance_manager.get_working_instance()
-                        current_url = f"{instance}/search?f=tweets&q={query}"
-                        browser.page.goto(current_url, timeout=60000)
-                        sleep(10)
-                
-                return tweets[:limit]
-                
-        except Exception as e:
-            logger.error(f"Scraping failed: {str(e)}")
+                        instance = self.instance_manager.rotate()
+                        current_url = urljoin(instance, self._cursor_path(current_url))
+                        self._goto(page, current_url)
+
+                for (page_url, page_next), parsed in pipeline.drain():
+                    if run.done:
+                        break
+                    yield self._accept_parsed_page(run, page_url, page_next, parsed)
+            finally:
+                pipeline.discard()
+
+    def _accept_parsed_page(
+        self,
+        run: "_ScrapeRun",
+        page_url: str,
+        next_url: Optional[str],
+        parsed: List[Optional[TweetSchema]]
+    ) -> List[TweetSchema]:
+        """Terima hasil parse satu halaman dari pipeline dan simpan checkpoint-nya"""
+        if run.done:
+            # Cursor checkpoint tetap di halaman tempat limit/watermark tercapai
             return []
-        
-    def _simulate_human_interaction(self, page: Page, verbose: bool):
-        """Simulate realistic human scrolling behavior"""
+        new_tweets = []
+        for tweet in parsed:
+            if run.done:
+                break
+            if tweet is None or run.is_known(extract_tweet_id(tweet.link)):
+                continue
+            if run.accept(tweet):
+                new_tweets.append(tweet)
+        self._save_checkpoint(run.query, page_url if run.done else next_url, new_tweets)
+        return new_tweets
+
+    def _iter_http_pages(self, run: "_ScrapeRun", start_path: str):
+        """Fast path tanpa browser: GET halaman pencarian dan ikuti cursor "Load more".
+
+        Generator yang me-yield tweet per halaman dan mengembalikan
+        (selesai, url_lanjutan). Jika instance mengembalikan challenge atau
+        timeline kosong, url_lanjutan adalah halaman yang harus dibuka ulang
+        lewat browser.
+        """
+        manager = InstanceManager(
+            None, self.instances, fetcher=self.fetcher, registry=self.health, breakers=self.breakers
+        )
+        manager.max_retries = 1
         try:
-            # Random initial delay
-            sleep(random.uniform(1, 3))
-            
-            # Scroll in random chunks with variable speed
-            scrolls = random.randint(3, 6)
-            if verbose:
-                logger.info(f"Simulating human scrolling ({scrolls} times)")
-            
-            viewport_height = page.viewport_size["height"]
-            current_scroll = 0
-            
-            for _ in range(scrolls):
-                # Random scroll distance (30-80% of viewport height)
-                scroll_distance = random.randint(
-                    int(viewport_height * 0.3), 
-                    int(viewport_height * 0.8)
-                )
-                
-                # Smooth scroll with random duration
-                page.evaluate(f"""
-                    window.scrollBy({{
-                        top: {scroll_distance},
-                        left: 0,
-                        behavior: 'smooth'
-                    }});
-                """)
-                
-                # Random scroll duration between 0.5-2 seconds
-                sleep(random.uniform(0.5, 2))
-                
-                # Random pause after scroll
-                sleep(random.uniform(0.5, 1.5))
-                
-                current_scroll += scroll_distance
-
-            # Final scroll to trigger lazy loading
-            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            sleep(1)
-            
-        except Exception as e:
-            logger.warning(f"Interaction simulation failed: {str(e)}")
+            instance = manager.get_working_instance()
+        except ConnectionError:
+            return False, None
+
+        path = start_path
+        url = urljoin(instance, path)
+        pending = None
+        retry_count = 0
+        max_retries = 3
+
+        while not run.done:
+            try:
+                if pending is not None:
+                    instance, result = pending.result()
+                else:
+                    instance, result = self._fetch_http_page(instance, path)
+                pending = None
+                url = urljoin(instance, path)
+                if is_challenge_page(result):
+                    logger.warning(f"Challenge page received from {instance}")
+                    self.health.record_success(instance, result.elapsed, challenged=True)
+                    return False, url
+                if result.status != 200:
+                    raise ConnectionError(f"HTTP {result.status} from {url}")
+                self.health.record_success(instance, result.elapsed)
+            except Exception as e:
+                logger.error(f"Page error: {str(e)}")
+                self.health.record_failure(instance)
+                pending = None
+                retry_count += 1
+                if retry_count >= max_retries:
+                    return False, url
+                # Cursor yang sama dicoba di instance lain tanpa jeda tetap
+                try:
+                    instance = manager.get_working_instance(exclude=[instance])
+                except ConnectionError:
+                    logger.info(f"No other instance available, retrying {instance}")
+                continue
+
+            items, next_href = TweetParser.split_page(result.html, self.parser_backend)
+            if not items:
+                logger.warning("No tweets found in HTTP response")
+                return False, url
+
+            # Ambil halaman berikutnya selagi halaman ini di-parse
+            next_path = self._cursor_path(urljoin(result.url, next_href)) if next_href else None
+            next_url = urljoin(instance, next_path) if next_path else None
+            if next_path and self.prefetch:
+                pending = self._executor().submit(self._fetch_http_page, instance, next_path)
+
+            new_tweets = []
+            for item in items:
+                if run.done:
+                    break
+                if run.is_known(self._item_tweet_id(item)):
+                    continue
+                parsed = SinglePassTweetParser.parse_element(item)
+                if run.accept(parsed):
+                    new_tweets.append(parsed)
+            self._save_checkpoint(run.query, url if run.done else next_url, new_tweets)
+            yield new_tweets
+
+            if not next_path:
+                logger.info("Reached end of pages")
+                run.exhausted = True
+                return True, None
+            path = next_path
+            retry_count = 0
 
-    def _get_next_page_url(self, page: Page) -> Optional[str]:
-        """Click next page button and return new URL"""
+        return True, None
+
+    def _fetch_http_page(self, instance: str, path: str) -> Tuple[str, FetchResult]:
+        """GET satu halaman cursor; dengan hedging, instance sehat terbaik lain jadi cadangan"""
+        instances = [instance]
+        if self.hedger.hedge_after is not None:
+            backups = [
+                other for other in self.health.ranked(self.instances or NIITTER_INSTANCES, allow_challenge=False)
+                if other != instance and not self.breakers.is_open(other)
+            ]
+            instances += backups[:1]
+        return self.hedger.get(path, instances)
+
+    def _begin_checkpoint(self, run: "_ScrapeRun") -> Tuple[Optional[str], List[TweetSchema]]:
+        """(path halaman awal, tweet dari checkpoint); path None jika checkpoint sudah sampai halaman terakhir"""
+        start_path = f"/search?f=tweets&q={quote_plus(run.query)}"
+        if self.checkpoint is None:
+            return start_path, []
+        saved = self.checkpoint.load(run.query) if self.resume else None
+        if saved is None:
+            self.checkpoint.start(run.query, start_path)
+            return start_path, []
+        logger.info(f"Resuming '{run.query}' from checkpoint with {len(saved.tweets)} tweets")
+        resumed = saved.tweets[:run.limit]
+        run.collected = len(resumed)
+        for tweet_id in saved.seen_ids:
+            run.index.add(tweet_id)
+        return saved.cursor, resumed
+
+    def _save_checkpoint(self, query: str, next_url: Optional[str], page_tweets: List[TweetSchema]):
+        if self.checkpoint is None:
+            return
         try:
-            if page.locator("div.show-more").count() > 0:
-                with page.expect_navigation():
-                    page.locator("div.show-more a").first.click()
-                sleep(random.uniform(1, 3))  # Wait for content load
-                return page.url
+            cursor = self._cursor_path(next_url) if next_url else None
+            self.checkpoint.save_page(query, cursor, page_tweets)
         except Exception as e:
-            logger.warning(f"Failed to navigate to next page: {str(e)}")
-            return None
-        
-    def _handle_pagination(self, page: Page) -> bool:
-        """Handle paginasi dan return status keberhasilan"""
-        try:
-            # Coba klik tombol "Show More"
-            if page.locator("div.show-more:visible").count() > 0:
-                with page.expect_navigation(timeout=10000):
-                    page.locator("div.show-more a").first.click()
-                sleep(random.uniform(1, 2))
-                return True
-            
-            # Scroll untuk trigger lazy loading
-            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            sleep(2)
-            
-            # Cek apakah muncul tombol baru setelah scroll
-            if page.locator("div.show-more:visible").count() > 0:
-                with page.expect_navigation(timeout=10000):
-                    page.locator("div.show-more a").first.click()
-                sleep(random.uniform(1, 2))
-                return True
-                
+            logger.error(f"Failed to save checkpoint: {str(e)}")
+
+    @staticmethod
+    def _cursor_path(url: str) -> str:
+        """Path + query string dari URL, agar cursor bisa dipakai di instance lain"""
+        parts = urlsplit(url)
+        return f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+        return self._prefetch_executor
+
+    def _parse_pipeline(self) -> ParsePipeline:
+        if self._pipeline is None:
+            self._pipeline = ParsePipeline(self.parse_workers, backend=self.parser_backend)
+        return self._pipeline
+
+    @contextmanager
+    def _page_session(self) -> Iterator[Page]:
+        """Page untuk satu query: dipinjam dari pool atau dari browser sekali pakai"""
+        if self.pool is None:
+            with BrowserManager(headless=self.headless, config=self.config) as browser:
+                yield browser.page
+            return
+        with self.pool.lease() as slot:
+            yield slot.page
+
+    def _get_timeline_page(self, page: Page, html: Optional[str] = None) -> Tuple[list, Optional[str]]:
+        """Ambil elemen timeline dan URL halaman berikutnya.
+
+        Mode bulk dan dom hanya butuh satu panggilan IPC per halaman; pada
+        mode bulk `html` bisa berisi halaman hasil prefetch.
+        """
+        if self.extraction_mode == "bulk":
+            if html is None:
+                html = page.content()
+            items, next_href = TweetParser.split_page(html, self.parser_backend)
+            return items, urljoin(page.url, next_href) if next_href else None
+        if self.extraction_mode == "dom":
+            return DOMExtractor.extract_fields(page), self._read_next_url(page)
+        return page.locator("div.timeline-item").all(), self._read_next_url(page)
+
+    @staticmethod
+    def _item_tweet_id(item) -> Optional[str]:
+        """ID tweet dari link status item timeline tanpa mem-parse seluruh item"""
+        if isinstance(item, dict):
+            href = item.get("link_href")
+        elif isinstance(item, Tag):
+            link = item.select_one("a.tweet-link")
+            href = link.get("href") if link else None
+        else:
+            href = item.evaluate(LINK_HREF_SCRIPT)
+        return extract_tweet_id(href) if href else None
+
+    def _parse_timeline_item(self, item) -> Optional[TweetSchema]:
+        """Parse satu item timeline sesuai mode ekstraksi"""
+        if self.extraction_mode == "bulk":
+            return SinglePassTweetParser.parse_element(item)
+        if self.extraction_mode == "dom":
+            return DOMExtractor.parse_fields(item)
+        return SinglePassTweetParser.parse(item.inner_html(), self.parser_backend)
+
+    def _goto(self, page: Page, url: str):
+        """Navigasi yang dibatasi rate limit per instance"""
+        self.pacer.before_request(url)
+        page.goto(url, timeout=self.page_timeout)
+
+    def _read_next_url(self, page: Page) -> Optional[str]:
+        """URL absolut dari link "Load more" yang membawa cursor, tanpa klik"""
+        return page.evaluate(NEXT_URL_SCRIPT)
+
+    def _start_prefetch(self, page: Page, url: str) -> bool:
+        """Mulai fetch() halaman berikutnya di dalam page selagi Python mem-parse"""
+        if not self.prefetch or self.extraction_mode != "bulk":
             return False
-            
+        try:
+            self.pacer.before_request(url)
+            page.evaluate(PREFETCH_SCRIPT, url)
+            return True
         except Exception as e:
-            logger.warning(f"Pagination failed: {str(e)}")
+            logger.warning(f"Prefetch failed to start: {str(e)}")
             return False
 
-    def _validate_tweet(self, tweet: TweetSchema) -> bool:
+    def _finish_prefetch(self, page: Page, url: str) -> Optional[str]:
+        """Tunggu hasil prefetch; None berarti halaman harus dibuka dengan goto"""
+        try:
+            response = page.evaluate("() => window.__nitterPrefetch")
+            result = FetchResult(url=url, status=response["status"], html=response["html"], elapsed=0.0)
+            if result.status == 200 and not is_challenge_page(result):
+                return result.html
+            logger.warning(f"Prefetch returned HTTP {result.status}, navigating instead")
+        except Exception as e:
+            logger.warning(f"Prefetch failed: {str(e)}")
+        return None
+
+    @staticmethod
+    def _validate_tweet(tweet: TweetSchema) -> bool:
         """Validasi akhir untuk tweet"""
         return all([
             tweet.user.username not in ["unknown_user", ""],
@@ -0,0 +1,123 @@
+# twitter/sharding.py
+"""Pecah satu query besar menjadi jendela tanggal `since:`/`until:` yang disjoint.
+
+Setiap jendela di-scrape di proses terpisah (browser dan koneksi sendiri),
+lalu hasilnya digabung kembali urut timestamp terbaru lebih dulu. Tweet yang
+muncul di dua jendela (batas tanggal/zona waktu) hanya di-yield sekali.
+
+    with ShardedScraper(processes=4, fetch_mode="http") as scraper:
+        for tweet in scraper.iter_tweets("jokowi", date(2024, 1, 1), date(2024, 7, 1), shards=12):
+            ...
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterator, List, Optional, Tuple
+from .dedup import make_index
+from .models.schemas import TweetSchema
+from .utils.helpers import extract_tweet_id
+from .utils.logger import logger
+
+@dataclass(frozen=True)
+class DateWindow:
+    since: date     # inklusif
+    until: date     # eksklusif, sama seperti operator pencarian Nitter
+
+    def apply(self, query: str) -> str:
+        return f"{query} since:{self.since.isoformat()} until:{self.until.isoformat()}"
+
+def split_date_range(since: date, until: date, shards: int) -> List[DateWindow]:
+    """Bagi [since, until) menjadi paling banyak `shards` jendela per hari, terbaru lebih dulu"""
+    days = (until - since).days
+    if days < 1:
+        raise ValueError("until must be at least one day after since")
+    shards = max(1, min(shards, days))
+    size, extra = divmod(days, shards)
+    windows = []
+    start = since
+    for index in range(shards):
+        end = start + timedelta(days=size + (1 if index < extra else 0))
+        windows.append(DateWindow(start, end))
+        start = end
+    return list(reversed(windows))
+
+def _scrape_window(options: dict, query: str, limit: int) -> List[TweetSchema]:
+    """Dijalankan di proses worker: satu TweetScraper per jendela"""
+    from .scraper import TweetScraper
+    with TweetScraper(**options) as scraper:
+        return scraper.scrape_tweets(query, limit=limit)
+
+def _order_key(tweet: TweetSchema) -> Tuple[datetime, int]:
+    tweet_id = extract_tweet_id(tweet.link)
+    return (
+        tweet.timestamp or datetime.min.replace(tzinfo=timezone.utc),
+        int(tweet_id) if tweet_id else 0
+    )
+
+class ShardedScraper:
+    """Scrape jendela tanggal paralel di `processes` proses dengan opsi TweetScraper yang sama"""
+
+    def __init__(self, processes: Optional[int] = None, **scraper_options):
+        self.processes = processes or os.cpu_count() or 1
+        self.scraper_options = scraper_options
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: Playwright dan thread pool scraper tidak aman di-fork
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.processes, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def scrape_tweets(self, query: str, since: date, until: date, shards: int = 4,
+                      limit_per_window: int = 100, limit: Optional[int] = None) -> List[TweetSchema]:
+        return list(self.iter_tweets(query, since, until, shards, limit_per_window, limit))
+
+    def iter_tweets(self, query: str, since: date, until: date, shards: int = 4,
+                    limit_per_window: int = 100, limit: Optional[int] = None) -> Iterator[TweetSchema]:
+        """Yield tweet semua jendela, terbaru lebih dulu.
+
+        Jendela diproses urut dari yang terbaru; karena jendela disjoint,
+        hasil satu jendela bisa di-yield begitu jendela itu (dan semua
+        jendela yang lebih baru) selesai, tanpa menunggu jendela lain.
+        """
+        windows = split_date_range(since, until, shards)
+        pool = self._pool()
+        futures = [
+            pool.submit(_scrape_window, self.scraper_options, window.apply(query), limit_per_window)
+            for window in windows
+        ]
+        index = make_index()
+        emitted = 0
+        try:
+            for window, future in zip(windows, futures):
+                try:
+                    tweets = future.result()
+                except Exception as e:
+                    logger.error(f"Window {window.since}..{window.until} failed: {str(e)}")
+                    continue
+                logger.info(f"Window {window.since}..{window.until}: {len(tweets)} tweets")
+                for tweet in sorted(tweets, key=_order_key, reverse=True):
+                    if not index.add(extract_tweet_id(tweet.link) or tweet.link):
+                        continue
+                    yield tweet
+                    emitted += 1
+                    if limit is not None and emitted >= limit:
+                        return
+        finally:
+            for future in futures:
+                future.cancel()
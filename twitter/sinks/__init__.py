@@ -0,0 +1,18 @@
+# twitter/sinks/__init__.py
+from typing import Optional, Union
+from .ndjson import NDJSONSink
+from .arrow import ArrowSink, arrow_format
+from .sqlite import TweetStore, store_format
+
+Sink = Union[NDJSONSink, ArrowSink, TweetStore]
+
+def open_sink(path: str, format: Optional[str] = None, **options) -> Sink:
+    """Sink berdasarkan format ("ndjson", "parquet", "arrow", "sqlite") atau ekstensi file"""
+    format = format or arrow_format(path) or store_format(path) or "ndjson"
+    if format == "ndjson":
+        return NDJSONSink(path, **options)
+    if format == "sqlite":
+        return TweetStore(path, **options)
+    return ArrowSink(path, format=format, **options)
+
+__all__ = ["NDJSONSink", "ArrowSink", "TweetStore", "open_sink"]
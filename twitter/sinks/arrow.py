@@ -0,0 +1,158 @@
+# twitter/sinks/arrow.py
+"""Ekspor tweet ke Parquet atau Arrow IPC dalam batch kolumnar.
+
+Field bertingkat diratakan (`user.username` -> `username`, `stats.likes`
+-> `likes`, `media.images` -> `images`); hashtag/mention/media tetap
+kolom list dan timestamp bertipe timestamp UTC. Butuh `pyarrow`:
+
+    with ArrowSink("hasil.parquet", batch_size=5000) as sink:
+        for page in scraper.iter_pages("jokowi", limit=100000):
+            sink.write_page(page)
+
+File Parquet baru bisa dibaca setelah sink ditutup (footer ditulis saat close).
+"""
+import importlib.util
+from typing import Dict, Iterable, Iterator, Optional
+from ..models.schemas import MediaSchema, TweetSchema, TweetStats, UserSchema
+
+ARROW_FORMATS = {".parquet": "parquet", ".arrow": "arrow", ".feather": "arrow", ".ipc": "arrow"}
+
+COLUMNS = (
+    "username", "fullname", "verified", "content", "hashtags", "mentions", "replying_to",
+    "timestamp", "comments", "retweets", "quotes", "likes", "images", "videos", "gifs",
+    "link", "is_retweet", "retweeter",
+)
+
+def _pyarrow():
+    if importlib.util.find_spec("pyarrow") is None:
+        raise ImportError("Export Parquet/Arrow membutuhkan pyarrow: pip install pyarrow")
+    import pyarrow
+    return pyarrow
+
+def arrow_format(path: str) -> Optional[str]:
+    """'parquet' / 'arrow' dari ekstensi file, None jika bukan file kolumnar"""
+    for suffix, name in ARROW_FORMATS.items():
+        if path.endswith(suffix):
+            return name
+    return None
+
+def tweet_schema():
+    pa = _pyarrow()
+    strings = pa.list_(pa.string())
+    return pa.schema([
+        ("username", pa.string()),
+        ("fullname", pa.string()),
+        ("verified", pa.bool_()),
+        ("content", pa.string()),
+        ("hashtags", strings),
+        ("mentions", strings),
+        ("replying_to", strings),
+        ("timestamp", pa.timestamp("us", tz="UTC")),
+        ("comments", pa.int64()),
+        ("retweets", pa.int64()),
+        ("quotes", pa.int64()),
+        ("likes", pa.int64()),
+        ("images", strings),
+        ("videos", strings),
+        ("gifs", strings),
+        ("link", pa.string()),
+        ("is_retweet", pa.bool_()),
+        ("retweeter", pa.string()),
+    ])
+
+class ArrowSink:
+    """Kumpulkan tweet per kolom dan tulis satu record batch / row group setiap `batch_size` tweet"""
+
+    def __init__(self, path: str, format: Optional[str] = None, batch_size: int = 10_000, compression: str = "zstd"):
+        format = format or arrow_format(path) or "parquet"
+        if format not in ("parquet", "arrow"):
+            raise ValueError(f"Unknown columnar format: {format}")
+        self.pa = _pyarrow()
+        self.path = path
+        self.format = format
+        self.batch_size = batch_size
+        self.schema = tweet_schema()
+        self.count = 0
+        self._columns: Dict[str, list] = {name: [] for name in COLUMNS}
+        if format == "parquet":
+            import pyarrow.parquet as pq
+            self._writer = pq.ParquetWriter(path, self.schema, compression=compression)
+        else:
+            options = self.pa.ipc.IpcWriteOptions(compression=compression)
+            self._writer = self.pa.ipc.new_file(path, self.schema, options=options)
+
+    def write_page(self, tweets: Iterable[TweetSchema]):
+        columns = self._columns
+        for tweet in tweets:
+            user, stats, media = tweet.user, tweet.stats, tweet.media
+            columns["username"].append(user.username)
+            columns["fullname"].append(user.fullname)
+            columns["verified"].append(user.verified)
+            columns["content"].append(tweet.content)
+            columns["hashtags"].append(tweet.hashtags)
+            columns["mentions"].append(tweet.mentions)
+            columns["replying_to"].append(tweet.replying_to)
+            columns["timestamp"].append(tweet.timestamp)
+            columns["comments"].append(stats.comments)
+            columns["retweets"].append(stats.retweets)
+            columns["quotes"].append(stats.quotes)
+            columns["likes"].append(stats.likes)
+            columns["images"].append(list(media.images))
+            columns["videos"].append(list(media.videos))
+            columns["gifs"].append(list(media.gifs))
+            columns["link"].append(tweet.link)
+            columns["is_retweet"].append(tweet.is_retweet)
+            columns["retweeter"].append(tweet.retweeter)
+            self.count += 1
+        if len(columns["link"]) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Tulis tweet yang masih di buffer sebagai satu batch"""
+        if not self._columns["link"]:
+            return
+        batch = self.pa.RecordBatch.from_pydict(self._columns, schema=self.schema)
+        self._writer.write_batch(batch)
+        self._columns = {name: [] for name in COLUMNS}
+
+    def close(self):
+        if self._writer is None:
+            return
+        self.flush()
+        self._writer.close()
+        self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+def read_tweets(path: str, format: Optional[str] = None) -> Iterator[TweetSchema]:
+    """Baca kembali file hasil ArrowSink sebagai TweetSchema, batch demi batch"""
+    pa = _pyarrow()
+    format = format or arrow_format(path) or "parquet"
+    if format == "parquet":
+        import pyarrow.parquet as pq
+        batches = pq.ParquetFile(path).iter_batches()
+    else:
+        reader = pa.ipc.open_file(path)
+        batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+    for batch in batches:
+        for row in batch.to_pylist():
+            yield _tweet_from_row(row)
+
+def _tweet_from_row(row: Dict) -> TweetSchema:
+    return TweetSchema(
+        user=UserSchema(row["username"], row["fullname"], row["verified"]),
+        content=row["content"],
+        hashtags=row["hashtags"] or [],
+        mentions=row["mentions"] or [],
+        replying_to=row["replying_to"] or [],
+        timestamp=row["timestamp"],
+        stats=TweetStats(row["comments"], row["retweets"], row["quotes"], row["likes"]),
+        media=MediaSchema.of(row["images"] or (), row["videos"] or (), row["gifs"] or ()),
+        link=row["link"],
+        is_retweet=row["is_retweet"],
+        retweeter=row["retweeter"]
+    )
@@ -0,0 +1,36 @@
+# twitter/sinks/ndjson.py
+from typing import Iterable
+from ..models.schemas import TweetSchema
+from ..utils.serialization import ndjson_bytes
+
+class NDJSONSink:
+    """Tulis satu tweet per baris dan flush setiap halaman.
+
+    Dipakai bersama TweetScraper.iter_pages agar hasil langsung tersedia
+    untuk proses lain dan tidak hilang jika scraping berhenti di tengah:
+
+        with NDJSONSink("hasil.ndjson") as sink:
+            for page in scraper.iter_pages("jokowi", limit=10000):
+                sink.write_page(page)
+    """
+
+    def __init__(self, path: str, append: bool = True):
+        self.path = path
+        self.count = 0
+        self._file = open(path, "ab" if append else "wb")
+
+    def write_page(self, tweets: Iterable[TweetSchema]):
+        tweets = list(tweets)
+        self._file.write(ndjson_bytes(tweets))
+        self.count += len(tweets)
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,347 @@
+# twitter/sinks/sqlite.py
+"""Penyimpanan SQLite untuk tweet yang sudah dikumpulkan, dengan indeks FTS5.
+
+Tweet, pengguna dan hashtag disimpan di tabel terpisah; tweet di-upsert
+berdasarkan ID sehingga scrape ulang memperbarui statistik tanpa duplikat.
+Daftar hashtag asli disimpan utuh per tweet; tabel `hashtags` (huruf kecil)
+hanya indeks untuk filter dan statistik.
+`TweetStore` bisa dipakai sebagai sink (write_page) dan untuk query:
+
+    with TweetStore("tweets.db", query="jokowi") as store:
+        for page in scraper.iter_pages("jokowi", limit=10000):
+            store.write_page(page)
+
+    TweetStore("tweets.db").search("banjir jakarta", hashtag="banjir", limit=20)
+"""
+import sqlite3
+import time
+from datetime import date, datetime, timezone
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from ..models.schemas import MediaSchema, TweetSchema, TweetStats, UserSchema
+from ..utils.helpers import extract_tweet_id
+from ..utils.logger import logger
+from ..utils.serialization import dumps, loads
+
+DEFAULT_STORE_PATH = "tweets.db"
+STORE_FORMATS = {".db": "sqlite", ".sqlite": "sqlite", ".sqlite3": "sqlite"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY,
+    username TEXT NOT NULL UNIQUE,
+    fullname TEXT,
+    verified INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS tweets (
+    id INTEGER PRIMARY KEY,              -- ID snowflake dari link status
+    user_id INTEGER NOT NULL REFERENCES users(id),
+    content TEXT NOT NULL,
+    timestamp TEXT,                      -- ISO 8601 UTC
+    comments INTEGER NOT NULL DEFAULT 0,
+    retweets INTEGER NOT NULL DEFAULT 0,
+    quotes INTEGER NOT NULL DEFAULT 0,
+    likes INTEGER NOT NULL DEFAULT 0,
+    hashtags TEXT NOT NULL DEFAULT '[]', -- daftar asli; pencarian lewat tweet_hashtags
+    mentions TEXT NOT NULL DEFAULT '[]',
+    replying_to TEXT NOT NULL DEFAULT '[]',
+    media TEXT NOT NULL DEFAULT '{}',
+    link TEXT NOT NULL,
+    is_retweet INTEGER NOT NULL DEFAULT 0,
+    retweeter TEXT,
+    scraped_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tweets_user ON tweets(user_id);
+CREATE INDEX IF NOT EXISTS tweets_timestamp ON tweets(timestamp);
+CREATE TABLE IF NOT EXISTS hashtags (
+    id INTEGER PRIMARY KEY,
+    tag TEXT NOT NULL UNIQUE             -- huruf kecil, tanpa '#'
+);
+CREATE TABLE IF NOT EXISTS tweet_hashtags (
+    tweet_id INTEGER NOT NULL REFERENCES tweets(id),
+    hashtag_id INTEGER NOT NULL REFERENCES hashtags(id),
+    PRIMARY KEY (tweet_id, hashtag_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS tweet_hashtags_tag ON tweet_hashtags(hashtag_id);
+CREATE TABLE IF NOT EXISTS tweet_queries (
+    tweet_id INTEGER NOT NULL REFERENCES tweets(id),
+    query TEXT NOT NULL,
+    PRIMARY KEY (tweet_id, query)
+) WITHOUT ROWID;
+
+-- Indeks full-text atas tweets.content, disinkronkan lewat trigger
+CREATE VIRTUAL TABLE IF NOT EXISTS tweets_fts USING fts5(
+    content, content='tweets', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS tweets_ai AFTER INSERT ON tweets BEGIN
+    INSERT INTO tweets_fts(rowid, content) VALUES (new.id, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS tweets_ad AFTER DELETE ON tweets BEGIN
+    INSERT INTO tweets_fts(tweets_fts, rowid, content) VALUES ('delete', old.id, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS tweets_au AFTER UPDATE OF content ON tweets BEGIN
+    INSERT INTO tweets_fts(tweets_fts, rowid, content) VALUES ('delete', old.id, old.content);
+    INSERT INTO tweets_fts(rowid, content) VALUES (new.id, new.content);
+END;
+"""
+
+UPSERT_TWEET = """
+INSERT INTO tweets (
+    id, user_id, content, timestamp, comments, retweets, quotes, likes,
+    hashtags, mentions, replying_to, media, link, is_retweet, retweeter, scraped_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    content = excluded.content,
+    hashtags = excluded.hashtags,
+    comments = excluded.comments,
+    retweets = excluded.retweets,
+    quotes = excluded.quotes,
+    likes = excluded.likes,
+    media = excluded.media,
+    scraped_at = excluded.scraped_at
+"""
+
+SELECT_COLUMNS = """
+SELECT t.id, u.username, u.fullname, u.verified, t.content, t.timestamp,
+       t.comments, t.retweets, t.quotes, t.likes, t.hashtags, t.mentions, t.replying_to, t.media,
+       t.link, t.is_retweet, t.retweeter
+"""
+SELECT_TWEETS = SELECT_COLUMNS + " FROM tweets t JOIN users u ON u.id = t.user_id"
+# Pencarian teks dimulai dari indeks FTS (CROSS JOIN menahan urutan join) agar
+# "recent" cukup membaca rowid FTS dari belakang sampai LIMIT terpenuhi
+SELECT_MATCHES = (
+    SELECT_COLUMNS + " FROM tweets_fts CROSS JOIN tweets t ON t.id = tweets_fts.rowid"
+    " JOIN users u ON u.id = t.user_id"
+)
+
+DateBound = Union[date, datetime, str, None]
+
+def store_format(path: str) -> Optional[str]:
+    for suffix, name in STORE_FORMATS.items():
+        if path.endswith(suffix):
+            return name
+    return None
+
+def _iso_bound(value: DateBound) -> Optional[str]:
+    """Batas since/until sebagai string ISO UTC yang bisa dibandingkan dengan kolom timestamp"""
+    if value is None or isinstance(value, str):
+        return value
+    if not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day, tzinfo=timezone.utc)
+    elif value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat()
+
+class TweetStore:
+    """Tabel tweet/pengguna/hashtag ternormalisasi dengan upsert per batch dan pencarian FTS5"""
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH, query: Optional[str] = None, batch_size: int = 500):
+        self.path = path
+        self.query = query
+        self.batch_size = batch_size
+        self.count = 0
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self._pending: List[TweetSchema] = []
+        self._user_ids: Dict[str, int] = {}
+        self._hashtag_ids: Dict[str, int] = {}
+
+    # --- Sink -------------------------------------------------------------
+
+    def write_page(self, tweets: Iterable[TweetSchema]):
+        for tweet in tweets:
+            self._pending.append(tweet)
+            self.count += 1
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Upsert semua tweet yang tertunda dalam satu transaksi"""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        rows = []
+        for tweet in pending:
+            tweet_id = extract_tweet_id(tweet.link)
+            if tweet_id is None:
+                logger.warning(f"Skipping tweet without status ID: {tweet.link}")
+                continue
+            rows.append((int(tweet_id), tweet))
+        if not rows:
+            return
+
+        now = time.time()
+        with self.conn:
+            user_ids = self._upsert_users([tweet.user for _, tweet in rows])
+            hashtag_ids = self._ensure_hashtags({tag.lower() for _, tweet in rows for tag in tweet.hashtags})
+            self.conn.executemany(UPSERT_TWEET, [
+                (
+                    tweet_id, user_ids[tweet.user.username], tweet.content,
+                    _iso_bound(tweet.timestamp),
+                    tweet.stats.comments, tweet.stats.retweets, tweet.stats.quotes, tweet.stats.likes,
+                    dumps(tweet.hashtags), dumps(tweet.mentions), dumps(tweet.replying_to), dumps(tweet.media),
+                    tweet.link, int(tweet.is_retweet), tweet.retweeter, now
+                )
+                for tweet_id, tweet in rows
+            ])
+            # Indeks hashtag (huruf kecil) dibangun ulang untuk tweet yang di-upsert
+            self.conn.executemany(
+                "DELETE FROM tweet_hashtags WHERE tweet_id = ?", [(tweet_id,) for tweet_id, _ in rows]
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO tweet_hashtags (tweet_id, hashtag_id) VALUES (?, ?)",
+                [(tweet_id, hashtag_ids[tag.lower()]) for tweet_id, tweet in rows for tag in tweet.hashtags]
+            )
+            if self.query:
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO tweet_queries (tweet_id, query) VALUES (?, ?)",
+                    [(tweet_id, self.query) for tweet_id, _ in rows]
+                )
+
+    def _upsert_users(self, users: Sequence[UserSchema]) -> Dict[str, int]:
+        latest = {user.username: user for user in users}
+        self.conn.executemany(
+            """INSERT INTO users (username, fullname, verified) VALUES (?, ?, ?)
+               ON CONFLICT(username) DO UPDATE SET fullname = excluded.fullname, verified = excluded.verified""",
+            [(user.username, user.fullname, int(user.verified)) for user in latest.values()]
+        )
+        missing = [name for name in latest if name not in self._user_ids]
+        self._user_ids.update(self._lookup("users", "username", missing))
+        return self._user_ids
+
+    def _ensure_hashtags(self, tags: Iterable[str]) -> Dict[str, int]:
+        missing = [tag for tag in tags if tag not in self._hashtag_ids]
+        if missing:
+            self.conn.executemany("INSERT OR IGNORE INTO hashtags (tag) VALUES (?)", [(tag,) for tag in missing])
+            self._hashtag_ids.update(self._lookup("hashtags", "tag", missing))
+        return self._hashtag_ids
+
+    def _lookup(self, table: str, column: str, values: List[str]) -> Dict[str, int]:
+        ids = {}
+        # Batas jumlah parameter SQLite
+        for start in range(0, len(values), 500):
+            chunk = values[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            ids.update(self.conn.execute(
+                f"SELECT {column}, id FROM {table} WHERE {column} IN ({placeholders})", chunk
+            ).fetchall())
+        return ids
+
+    def close(self):
+        if self.conn is None:
+            return
+        self.flush()
+        self.conn.close()
+        self.conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    # --- Query ------------------------------------------------------------
+
+    def search(
+        self,
+        text: Optional[str] = None,
+        limit: int = 20,
+        username: Optional[str] = None,
+        hashtag: Optional[str] = None,
+        query: Optional[str] = None,
+        since: DateBound = None,
+        until: DateBound = None,
+        order: str = "recent"
+    ) -> List[TweetSchema]:
+        """Cari tweet tersimpan.
+
+        `text` memakai sintaks FTS5 (kata, "frasa", OR, prefix*). Filter lain
+        opsional; `order` = "recent" (ID snowflake terbaru dulu), "relevance"
+        (bm25, hanya jika `text` diisi; harus menilai semua hasil sehingga lebih
+        lambat untuk kata yang sangat umum) atau "likes".
+        """
+        self.flush()
+        sql, params, where = SELECT_TWEETS, [], []
+        if text:
+            sql = SELECT_MATCHES
+            where.append("tweets_fts MATCH ?")
+            params.append(text)
+        if username:
+            where.append("u.username = ? COLLATE NOCASE")
+            params.append(username.lstrip("@"))
+        if hashtag:
+            where.append(
+                "t.id IN (SELECT th.tweet_id FROM tweet_hashtags th "
+                "JOIN hashtags h ON h.id = th.hashtag_id WHERE h.tag = ?)"
+            )
+            params.append(hashtag.lstrip("#").lower())
+        if query:
+            where.append("t.id IN (SELECT tweet_id FROM tweet_queries WHERE query = ?)")
+            params.append(query)
+        if since is not None:
+            where.append("t.timestamp >= ?")
+            params.append(_iso_bound(since))
+        if until is not None:
+            where.append("t.timestamp < ?")
+            params.append(_iso_bound(until))
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+
+        if order == "relevance" and text:
+            sql += " ORDER BY bm25(tweets_fts)"
+        elif order == "likes":
+            sql += " ORDER BY t.likes DESC"
+        elif order in ("recent", "relevance"):
+            sql += " ORDER BY tweets_fts.rowid DESC" if text else " ORDER BY t.id DESC"
+        else:
+            raise ValueError(f"Unknown order: {order}")
+        sql += " LIMIT ?"
+        params.append(limit)
+        return [self._row_to_tweet(row) for row in self.conn.execute(sql, params)]
+
+    def get(self, tweet_id: Union[int, str]) -> Optional[TweetSchema]:
+        self.flush()
+        row = self.conn.execute(SELECT_TWEETS + " WHERE t.id = ?", (int(tweet_id),)).fetchone()
+        return self._row_to_tweet(row) if row else None
+
+    def stats(self) -> Dict[str, int]:
+        self.flush()
+        counts = {}
+        for table in ("tweets", "users", "hashtags"):
+            counts[table] = self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        counts["queries"] = self.conn.execute("SELECT COUNT(DISTINCT query) FROM tweet_queries").fetchone()[0]
+        return counts
+
+    def top_hashtags(self, limit: int = 10) -> List[Tuple[str, int]]:
+        self.flush()
+        return self.conn.execute(
+            """SELECT h.tag, COUNT(*) AS n FROM tweet_hashtags th JOIN hashtags h ON h.id = th.hashtag_id
+               GROUP BY h.id ORDER BY n DESC, h.tag LIMIT ?""", (limit,)
+        ).fetchall()
+
+    def top_users(self, limit: int = 10) -> List[Tuple[str, int]]:
+        self.flush()
+        return self.conn.execute(
+            """SELECT u.username, COUNT(*) AS n FROM tweets t JOIN users u ON u.id = t.user_id
+               GROUP BY u.id ORDER BY n DESC, u.username LIMIT ?""", (limit,)
+        ).fetchall()
+
+    @staticmethod
+    def _row_to_tweet(row) -> TweetSchema:
+        (_, username, fullname, verified, content, timestamp, comments, retweets, quotes, likes,
+         hashtags, mentions, replying_to, media, link, is_retweet, retweeter) = row
+        media = loads(media)
+        return TweetSchema(
+            user=UserSchema(username, fullname, bool(verified)),
+            content=content,
+            hashtags=loads(hashtags),
+            mentions=loads(mentions),
+            replying_to=loads(replying_to),
+            timestamp=datetime.fromisoformat(timestamp) if timestamp else None,
+            stats=TweetStats(comments, retweets, quotes, likes),
+            media=MediaSchema.of(media.get("images", ()), media.get("videos", ()), media.get("gifs", ())),
+            link=link,
+            is_retweet=bool(is_retweet),
+            retweeter=retweeter
+        )
@@ -0,0 +1,25 @@
+# twitter/testing/__init__.py
+
+from pathlib import Path
+from typing import List
+from ..models.schemas import TweetSchema
+from ..parsers import TweetParser, SinglePassTweetParser
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+def load_fixture(name: str) -> str:
+    """Baca file HTML fixture Nitter berdasarkan nama"""
+    return (FIXTURES_DIR / name).read_text(encoding="utf-8")
+
+def fixture_names() -> List[str]:
+    """Daftar nama fixture halaman pencarian yang tersedia"""
+    return sorted(path.name for path in FIXTURES_DIR.glob("search_page_*.html"))
+
+def fixture_tweets() -> List[TweetSchema]:
+    """Semua tweet valid dari fixture, di-parse dengan SinglePassTweetParser"""
+    return [
+        tweet
+        for name in fixture_names()
+        for item in TweetParser.split_timeline(load_fixture(name))
+        if (tweet := SinglePassTweetParser.parse_element(item))
+    ]
@@ -0,0 +1,272 @@
+# twitter/testing/nitter_server.py
+"""Server HTTP lokal yang meniru halaman pencarian Nitter.
+
+Dipakai untuk benchmark dan pengujian scraper tanpa jaringan:
+
+    with NitterStubServer(StubInstanceConfig(latency=0.2)) as server:
+        scraper = TweetScraper(instances=[server.url])
+        scraper.scrape_tweets("jokowi", limit=50)
+"""
+import base64
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, quote_plus, urlsplit
+from bs4 import BeautifulSoup
+from . import load_fixture, fixture_names
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{query} | Search | nitter</title>
+<link rel="stylesheet" type="text/css" href="/css/style.css">
+<link rel="stylesheet" type="text/css" href="/css/fontello.css">
+</head>
+<body class="fixed-nav">
+<nav><div class="inner-nav"><div class="nav-item"><a class="site-name" href="/">nitter</a></div></div></nav>
+<div class="container">
+<div class="timeline-container">
+<div class="timeline">
+{items}
+</div>
+</div>
+</div>
+</body>
+</html>
+"""
+EMPTY_TIMELINE = '<div class="timeline-header"><h2 class="timeline-none">No items found</h2></div>'
+FIRST_TWEET_ID = 1908460000000000000
+DATE_TITLE_PATTERN = re.compile(r'(<span class="tweet-date"><a [^>]*?title=")[^"]*(")')
+SEARCH_DATE_PATTERN = re.compile(r"\b(since|until):(\d{4}-\d{2}-\d{2})\b")
+ASSET_PREFIXES = ("/pic/", "/video/", "/css/", "/fonts/")
+ASSET_TYPES = {"css": "text/css", "jpg": "image/jpeg", "png": "image/png", "mp4": "video/mp4", "woff2": "font/woff2"}
+
+@dataclass
+class StubInstanceConfig:
+    latency: float = 0.0           # Detik tambahan per request
+    jitter: float = 0.0            # Tambahan acak 0..jitter detik
+    error_rate: float = 0.0        # Peluang response HTTP 503
+    empty_rate: float = 0.0        # Peluang timeline kosong
+    dead: bool = False             # Koneksi ditutup tanpa response
+    page_size: int = 20
+    total_items: int = 200         # Jumlah tweet sebelum "Load more" hilang
+    asset_bytes: int = 0           # Ukuran respons /pic, /video, /css, /fonts (0 = 404)
+    timeline_start: Optional[datetime] = None  # Jika diisi: tweet ke-n bertanggal start - n * interval
+    tweet_interval: float = 3600.0             # dan filter since:/until: pada query dihormati
+    seed: Optional[int] = None
+
+@dataclass
+class StubStats:
+    requests: int = 0
+    pages: int = 0
+    errors: int = 0
+    empty: int = 0
+    paths: List[str] = field(default_factory=list)
+
+def load_stub_items() -> List[str]:
+    """HTML div.timeline-item dari fixture, tanpa item 'Load newest'"""
+    items = []
+    for name in fixture_names():
+        soup = BeautifulSoup(load_fixture(name), "html.parser")
+        items.extend(
+            str(item) for item in soup.select("div.timeline-item")
+            if "show-more" not in item.get("class", [])
+        )
+    return items
+
+def encode_cursor(offset: int) -> str:
+    return base64.urlsafe_b64encode(f"scroll:{offset}".encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> int:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    return int(base64.urlsafe_b64decode(padded).decode().split(":", 1)[1])
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_StubHTTPServer"
+
+    def do_GET(self):
+        stub = self.server.stub
+        stub._record(self.path)
+        config = stub.config
+
+        if config.dead:
+            self.close_connection = True
+            self.connection.close()
+            return
+
+        delay = config.latency + stub._random.uniform(0, config.jitter)
+        if delay:
+            time.sleep(delay)
+
+        url = urlsplit(self.path)
+        if url.path.startswith(ASSET_PREFIXES) and config.asset_bytes:
+            self._send_asset(url.path, config.asset_bytes)
+            return
+        if url.path != "/search":
+            self._send(404, "<h1>Not found</h1>")
+            return
+        if stub._roll(config.error_rate):
+            stub._count("errors")
+            self._send(503, "<h1>Service Unavailable</h1>")
+            return
+
+        params = parse_qs(url.query)
+        query = params.get("q", [""])[0]
+        try:
+            offset = decode_cursor(params["cursor"][0]) if "cursor" in params else 0
+        except (ValueError, IndexError, UnicodeDecodeError):
+            self._send(400, "<h1>Invalid cursor</h1>")
+            return
+
+        if stub._roll(config.empty_rate):
+            stub._count("empty")
+            self._send(200, PAGE_TEMPLATE.format(query=escape(query), items=EMPTY_TIMELINE))
+            return
+
+        stub._count("pages")
+        self._send(200, stub.render_page(query, offset))
+
+    def _send(self, status: int, body: str):
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_asset(self, path: str, size: int):
+        content_type = ASSET_TYPES.get(path.rsplit(".", 1)[-1], "application/octet-stream")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(size))
+        self.end_headers()
+        self.wfile.write(b"\0" * size if content_type != "text/css" else b" " * size)
+
+    def log_message(self, format, *args):
+        pass
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+class NitterStubServer:
+    """Satu instance Nitter tiruan di 127.0.0.1 dengan paginasi cursor"""
+
+    def __init__(self, config: Optional[StubInstanceConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or StubInstanceConfig()
+        self.stats = StubStats()
+        self._items = load_stub_items()
+        self._random = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._httpd = _StubHTTPServer((host, port), _Handler)
+        self._httpd.stub = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "NitterStubServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def tweet_time(self, position: int) -> Optional[datetime]:
+        start = self.config.timeline_start
+        if start is None:
+            return None
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=timezone.utc)
+        return start - timedelta(seconds=position * self.config.tweet_interval)
+
+    def _positions(self, query: str) -> range:
+        """Posisi tweet yang cocok dengan query (filter since:/until: jika timeline bertanggal)"""
+        first, last = 0, self.config.total_items
+        if self.config.timeline_start is None:
+            return range(first, last)
+        for operator, value in SEARCH_DATE_PATTERN.findall(query):
+            bound = datetime.strptime(value, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+            if operator == "until":
+                # until eksklusif: lewati tweet pada/sesudah tanggal tersebut
+                while first < last and self.tweet_time(first) >= bound:
+                    first += 1
+            else:
+                while last > first and self.tweet_time(last - 1) < bound:
+                    last -= 1
+        return range(first, last)
+
+    def render_page(self, query: str, offset: int) -> str:
+        """Render halaman pencarian mulai dari tweet ke-`offset`"""
+        positions = self._positions(query)
+        end = min(offset + self.config.page_size, len(positions))
+        items = []
+        if offset:
+            items.append(f'<div class="timeline-item show-more"><a href="?f=tweets&amp;q={quote_plus(query)}">Load newest</a></div>')
+        for position in positions[offset:end]:
+            html = self._items[position % len(self._items)]
+            html = re.sub(r"/status/\d+", f"/status/{FIRST_TWEET_ID - position}", html)
+            moment = self.tweet_time(position)
+            if moment is not None:
+                title = f"{moment:%b} {moment.day}, {moment.year} · {moment.hour % 12 or 12}:{moment:%M %p} UTC"
+                html = DATE_TITLE_PATTERN.sub(lambda m: f"{m.group(1)}{title}{m.group(2)}", html)
+            items.append(html)
+        if end < len(positions):
+            items.append(
+                f'<div class="show-more"><a href="?f=tweets&amp;q={quote_plus(query)}'
+                f'&amp;cursor={encode_cursor(end)}">Load more</a></div>'
+            )
+        return PAGE_TEMPLATE.format(query=escape(query), items="\n".join(items))
+
+    def _record(self, path: str):
+        with self._lock:
+            self.stats.requests += 1
+            self.stats.paths.append(path)
+
+    def _count(self, name: str):
+        with self._lock:
+            setattr(self.stats, name, getattr(self.stats, name) + 1)
+
+    def _roll(self, rate: float) -> bool:
+        with self._lock:
+            return rate > 0 and self._random.random() < rate
+
+class NitterStubCluster:
+    """Beberapa NitterStubServer sekaligus, misalnya campuran instance sehat dan mati"""
+
+    def __init__(self, configs: List[StubInstanceConfig]):
+        self.servers = [NitterStubServer(config) for config in configs]
+
+    @property
+    def instances(self) -> List[str]:
+        return [server.url for server in self.servers]
+
+    def stats(self) -> Dict[str, StubStats]:
+        return {server.url: server.stats for server in self.servers}
+
+    def __enter__(self):
+        for server in self.servers:
+            server.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        for server in self.servers:
+            server.stop()
@@ -1,9 +1,13 @@
 # twitter/utils/helpers.py
 import re
 import json
-from typing import Optional
+from typing import Any, Dict, Optional
 from datetime import datetime
-from dataclasses import is_dataclass, asdict
+from dataclasses import is_dataclass
+from ..models.schemas import TweetSchema
+from .serialization import from_dict, to_dict
+
+TWEET_ID_PATTERN = re.compile(r'/status/(\d+)')
 
 def sanitize_text(text: str) -> str:
     """Clean text from extra whitespace and control characters"""
@@ -19,10 +23,19 @@ def parse_relative_date(time_str: str) -> Optional[int]:
     multipliers = {'h': 1, 'm': 1/60, 'd': 24}
     return int(value) * multipliers.get(unit, 1)
 
+def extract_tweet_id(link: str) -> Optional[str]:
+    """Ambil ID tweet dari link status (https://twitter.com/user/status/<id>)"""
+    match = TWEET_ID_PATTERN.search(link or "")
+    return match.group(1) if match else None
+
+def tweet_from_dict(data: Dict[str, Any]) -> TweetSchema:
+    """Kebalikan dari EnhancedJSONEncoder: bangun ulang TweetSchema dari dict"""
+    return from_dict(data, TweetSchema)
+
 class EnhancedJSONEncoder(json.JSONEncoder):
     def default(self, o):
         if is_dataclass(o):
-            return asdict(o)
+            return to_dict(o)
         if isinstance(o, datetime):
             return o.isoformat()
         return super().default(o)
\ No newline at end of file
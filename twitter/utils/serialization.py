@@ -0,0 +1,157 @@
+# twitter/utils/serialization.py
+"""Serialisasi TweetSchema ke/dari JSON tanpa dataclasses.asdict.
+
+Fungsi to_dict/from_dict per schema dibangkitkan sekali dari definisi
+dataclass (tanpa rekursi generik dan deep copy per field). Jika `orjson`
+terpasang, encode/decode memakai orjson; jika tidak, modul json bawaan.
+Output kedua backend identik: datetime ISO 8601, tuple menjadi array.
+
+    dumps(tweets, pretty=True)        # seperti json.dumps(..., indent=2)
+    dumps(tweet)                      # satu baris ringkas (NDJSON)
+    tweet = tweet_from_json(line)
+"""
+import importlib.util
+import json
+from dataclasses import MISSING, fields, is_dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Union, get_args, get_origin, get_type_hints
+from ..models.schemas import MediaSchema, TweetSchema
+
+if importlib.util.find_spec("orjson") is not None:
+    import orjson
+    JSON_BACKEND = "orjson"
+else:
+    orjson = None
+    JSON_BACKEND = "json"
+
+# Konstruktor khusus saat decode: media kosong memakai EMPTY_MEDIA bersama
+_CONSTRUCTORS: Dict[type, Callable] = {MediaSchema: MediaSchema.of}
+
+def _encode_expr(value: str, tp: Any, env: Dict[str, Any]) -> str:
+    origin, args = get_origin(tp), get_args(tp)
+    if origin is Union and type(None) in args:
+        inner = _encode_expr(value, next(arg for arg in args if arg is not type(None)), env)
+        return inner if inner == value else f"(None if {value} is None else {inner})"
+    if is_dataclass(tp):
+        env[f"_to_{tp.__name__}"] = compile_to_dict(tp)
+        return f"_to_{tp.__name__}({value})"
+    if tp is datetime:
+        return f"{value}.isoformat()"
+    if origin in (list, tuple):
+        return f"list({value})"
+    return value
+
+def _decode_expr(value: str, tp: Any, env: Dict[str, Any]) -> str:
+    origin, args = get_origin(tp), get_args(tp)
+    if origin is Union and type(None) in args:
+        inner_type = next(arg for arg in args if arg is not type(None))
+        inner = _decode_expr(value, inner_type, env)
+        if inner_type is datetime:
+            # Data lama menyimpan timestamp kosong sebagai ""
+            return f"({inner} if {value} else None)"
+        return inner if inner == value else f"(None if {value} is None else {inner})"
+    if is_dataclass(tp):
+        env[f"_from_{tp.__name__}"] = compile_from_dict(tp)
+        return f"_from_{tp.__name__}({value})"
+    if tp is datetime:
+        env["_fromisoformat"] = datetime.fromisoformat
+        return f"_fromisoformat({value})"
+    if origin is list:
+        return f"list({value})"
+    return value
+
+def _build(name: str, source: str, env: Dict[str, Any]) -> Callable:
+    exec(compile(source, f"<serialization:{name}>", "exec"), env)
+    return env[name]
+
+def _required(name: str, tp: Any, env: Dict[str, Any]) -> str:
+    """Field wajib: list/objek bertingkat/Optional boleh hilang dari dict (data lama)"""
+    origin, args = get_origin(tp), get_args(tp)
+    if origin is list:
+        return f"d.get({name!r}, ())"
+    if is_dataclass(tp):
+        env["_no_fields"] = {}
+        return f"d.get({name!r}, _no_fields)"
+    if origin is Union and type(None) in args:
+        return f"d.get({name!r})"
+    return f"d[{name!r}]"
+
+@lru_cache(maxsize=None)
+def compile_to_dict(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    """Fungsi `obj -> dict` siap-JSON untuk satu kelas dataclass"""
+    hints = get_type_hints(cls)
+    env: Dict[str, Any] = {}
+    items = [f"{f.name!r}: {_encode_expr(f'o.{f.name}', hints[f.name], env)}" for f in fields(cls)]
+    source = "def to_dict(o):\n    return {" + ", ".join(items) + "}\n"
+    return _build("to_dict", source, env)
+
+@lru_cache(maxsize=None)
+def compile_from_dict(cls: type) -> Callable[[Dict[str, Any]], Any]:
+    """Fungsi `dict -> obj`; field yang hilang memakai default dataclass"""
+    hints = get_type_hints(cls)
+    env: Dict[str, Any] = {"_cls": _CONSTRUCTORS.get(cls, cls)}
+    arguments = []
+    for f in fields(cls):
+        if f.default is not MISSING:
+            env[f"_default_{f.name}"] = f.default
+            raw = f"d.get({f.name!r}, _default_{f.name})"
+        elif f.default_factory is not MISSING:
+            env[f"_factory_{f.name}"] = f.default_factory
+            raw = f"(d[{f.name!r}] if {f.name!r} in d else _factory_{f.name}())"
+        else:
+            raw = _required(f.name, hints[f.name], env)
+        arguments.append(f"{f.name}={_decode_expr(raw, hints[f.name], env)}")
+    source = "def from_dict(d):\n    return _cls(" + ", ".join(arguments) + ")\n"
+    return _build("from_dict", source, env)
+
+def to_dict(obj: Any) -> Dict[str, Any]:
+    return compile_to_dict(type(obj))(obj)
+
+def from_dict(data: Dict[str, Any], cls: type = TweetSchema) -> Any:
+    return compile_from_dict(cls)(data)
+
+def _default(obj: Any) -> Any:
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return to_dict(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def dumps_bytes(obj: Any, pretty: bool = False) -> bytes:
+    """JSON UTF-8; ringkas (tanpa spasi) kecuali pretty=True (indentasi 2)"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        text = json.dumps(obj, default=_default, ensure_ascii=False, indent=2)
+    else:
+        text = json.dumps(obj, default=_default, ensure_ascii=False, separators=(",", ":"))
+    return text.encode("utf-8")
+
+def dumps(obj: Any, pretty: bool = False) -> str:
+    return dumps_bytes(obj, pretty).decode("utf-8")
+
+def loads(data: Union[str, bytes]) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def ndjson_bytes(tweets: Iterable[Any]) -> bytes:
+    """Satu objek JSON ringkas per baris, diakhiri newline"""
+    return b"".join(dumps_bytes(tweet) + b"\n" for tweet in tweets)
+
+def tweet_from_json(data: Union[str, bytes]) -> TweetSchema:
+    return from_dict(loads(data))
+
+def tweets_from_json(data: Union[str, bytes]) -> List[TweetSchema]:
+    """Array JSON (output -o hasil.json) kembali menjadi list TweetSchema"""
+    decode = compile_from_dict(TweetSchema)
+    return [decode(item) for item in loads(data)]
+
+def write_json(tweets: Iterable[Any], file: IO[bytes], pretty: bool = True):
+    file.write(dumps_bytes(list(tweets), pretty))
+
+def iter_ndjson(file: IO[bytes]) -> Iterator[TweetSchema]:
+    """Baca file NDJSON (mode biner atau teks) baris per baris"""
+    decode = compile_from_dict(TweetSchema)
+    for line in file:
+        if line.strip():
+            yield decode(loads(line))
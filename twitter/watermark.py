@@ -0,0 +1,78 @@
+# twitter/watermark.py
+"""Watermark per query untuk scraping incremental ("sejak run terakhir").
+
+Watermark menyimpan ID dan timestamp tweet terbaru yang pernah dikumpulkan
+untuk sebuah query. Dengan `incremental=True`, scraper berhenti paginasi
+begitu bertemu tweet yang sama atau lebih lama dari watermark:
+
+    scraper = TweetScraper(incremental=True, watermark_path="watermarks.db")
+"""
+import sqlite3
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+DEFAULT_WATERMARK_PATH = "scraper_watermarks.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS watermarks (
+    query TEXT PRIMARY KEY,
+    tweet_id TEXT NOT NULL,
+    timestamp TEXT,
+    updated_at REAL NOT NULL
+);
+"""
+
+@dataclass
+class Watermark:
+    query: str
+    tweet_id: str
+    timestamp: Optional[datetime] = None
+    updated_at: float = 0.0
+
+    def covers(self, tweet_id: Optional[str]) -> bool:
+        """True jika tweet ini sudah dikumpulkan run sebelumnya (ID snowflake naik seiring waktu)"""
+        return bool(tweet_id) and tweet_id.isdigit() and int(tweet_id) <= int(self.tweet_id)
+
+class WatermarkStore:
+    """Simpan tweet terbaru per query ke SQLite"""
+
+    def __init__(self, path: str = DEFAULT_WATERMARK_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def load(self, query: str) -> Optional[Watermark]:
+        row = self.conn.execute(
+            "SELECT tweet_id, timestamp, updated_at FROM watermarks WHERE query = ?", (query,)
+        ).fetchone()
+        if row is None:
+            return None
+        timestamp = datetime.fromisoformat(row[1]) if row[1] else None
+        return Watermark(query=query, tweet_id=row[0], timestamp=timestamp, updated_at=row[2])
+
+    def advance(self, query: str, tweet_id: str, timestamp: Optional[datetime] = None) -> bool:
+        """Naikkan watermark ke `tweet_id`; watermark tidak pernah mundur"""
+        current = self.load(query)
+        if current is not None and current.covers(tweet_id):
+            return False
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO watermarks (query, tweet_id, timestamp, updated_at) VALUES (?, ?, ?, ?)",
+                (query, tweet_id, timestamp.isoformat() if timestamp else None, time.time())
+            )
+        return True
+
+    def clear(self, query: str):
+        with self.conn:
+            self.conn.execute("DELETE FROM watermarks WHERE query = ?", (query,))
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
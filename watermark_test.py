@@ -0,0 +1,76 @@
+# File: watermark_test.py
+from twitter import TweetScraper
+from twitter.utils.helpers import extract_tweet_id
+from twitter.watermark import WatermarkStore
+from twitter.testing.nitter_server import FIRST_TWEET_ID, NitterStubServer, StubInstanceConfig
+
+
+def test_watermark_never_moves_back(tmp_path):
+    with WatermarkStore(str(tmp_path / "wm.db")) as store:
+        assert store.advance("jokowi", "200")
+        assert not store.advance("jokowi", "150")
+        assert store.load("jokowi").tweet_id == "200"
+        assert store.load("jokowi").covers("199")
+        assert not store.load("jokowi").covers("201")
+        assert store.load("prabowo") is None
+
+
+def timeline_requests(server):
+    return len([p for p in server.stats.paths if "f=tweets" in p])
+
+
+def test_incremental_run_stops_at_previous_watermark(tmp_path):
+    path = str(tmp_path / "wm.db")
+    options = dict(fetch_mode="http", health_path=None, pacing="fast", prefetch=False,
+                   incremental=True, watermark_path=path)
+    with NitterStubServer(StubInstanceConfig(page_size=10, total_items=100)) as server:
+        with TweetScraper(instances=[server.url], **options) as scraper:
+            first = scraper.scrape_tweets("jokowi", limit=25)
+        with WatermarkStore(path) as store:
+            assert store.load("jokowi").tweet_id == str(FIRST_TWEET_ID)
+            # Anggap 15 tweet terbaru muncul setelah run pertama
+            store.clear("jokowi")
+            store.advance("jokowi", str(FIRST_TWEET_ID - 15))
+
+        pages_before = timeline_requests(server)
+        with TweetScraper(instances=[server.url], **options) as scraper:
+            second = scraper.scrape_tweets("jokowi", limit=100)
+        assert timeline_requests(server) - pages_before == 2
+        assert second and all(int(extract_tweet_id(t.link)) > FIRST_TWEET_ID - 15 for t in second)
+        assert [t.link for t in second] == [t.link for t in first if int(extract_tweet_id(t.link)) > FIRST_TWEET_ID - 15]
+
+        pages_before = timeline_requests(server)
+        with TweetScraper(instances=[server.url], **options) as scraper:
+            assert scraper.scrape_tweets("jokowi", limit=100) == []
+        assert timeline_requests(server) - pages_before == 1
+
+    with WatermarkStore(path) as store:
+        assert store.load("jokowi").tweet_id == str(FIRST_TWEET_ID)
+
+
+def test_limit_before_watermark_keeps_gap_for_next_run(tmp_path):
+    path = str(tmp_path / "wm.db")
+    options = dict(fetch_mode="http", health_path=None, pacing="fast", prefetch=False,
+                   incremental=True, watermark_path=path)
+    old_mark = FIRST_TWEET_ID - 40
+    with NitterStubServer(StubInstanceConfig(page_size=10, total_items=100)) as server:
+        with WatermarkStore(path) as store:
+            # Anggap 40 tweet terbaru muncul setelah run sebelumnya
+            store.advance("jokowi", str(old_mark))
+
+        with TweetScraper(instances=[server.url], **options) as scraper:
+            partial = scraper.scrape_tweets("jokowi", limit=15)
+        assert len(partial) == 15
+        with WatermarkStore(path) as store:
+            assert store.load("jokowi").tweet_id == str(old_mark)
+
+        with TweetScraper(instances=[server.url], **options) as scraper:
+            full = scraper.scrape_tweets("jokowi", limit=100)
+        ids = [int(extract_tweet_id(t.link)) for t in full]
+        assert all(tweet_id > old_mark for tweet_id in ids)
+        # Celah antara tweet terakhir run terbatas dan watermark lama ikut terkumpul
+        assert min(ids) < min(int(extract_tweet_id(t.link)) for t in partial)
+        assert {t.link for t in partial} < {t.link for t in full}
+
+    with WatermarkStore(path) as store:
+        assert store.load("jokowi").tweet_id == str(FIRST_TWEET_ID)